@@ -0,0 +1,68 @@
+"""
+Compare the installed JSON codecs on block-heavy payloads.
+
+Run from the repository root with ``python -m benchmarks.codec``. Codecs
+whose library is not installed are skipped.
+"""
+
+import functools
+import timeit
+from typing import List
+
+from src.webcraft_api.codec import CODECS, JsonCodec
+
+SIDE = 32
+
+SET_BLOCKS = {
+    "blocks": [
+        {"block": "minecraft:stone", "x": x, "y": y, "z": z}
+        for x in range(SIDE)
+        for y in range(SIDE)
+        for z in range(SIDE)
+    ]
+}
+
+GET_BLOCKS_RESPONSE = {
+    "blocks": [
+        {"name": "minecraft:stone", "position": {"x": x, "y": y, "z": z}}
+        for x in range(SIDE)
+        for y in range(SIDE)
+        for z in range(SIDE)
+    ]
+}
+
+
+def _installed() -> List[JsonCodec]:
+    codecs = []
+    for name, codec_type in CODECS.items():
+        try:
+            codecs.append(codec_type())
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+    return codecs
+
+
+def run(number: int = 5):
+    codecs = _installed()
+    response_body = JsonCodec().dumps(GET_BLOCKS_RESPONSE)
+    print(f"set_blocks body: {len(SET_BLOCKS['blocks'])} blocks")
+    print(f"get_blocks response: {len(response_body) / 1e6:.1f} MB")
+    for codec in codecs:
+        encode = min(
+            timeit.repeat(
+                functools.partial(codec.dumps, SET_BLOCKS), number=number, repeat=3
+            )
+        )
+        decode = min(
+            timeit.repeat(
+                functools.partial(codec.loads, response_body), number=number, repeat=3
+            )
+        )
+        print(
+            f"  {codec.name:<8} encode {encode / number * 1e3:8.2f} ms"
+            f"  decode {decode / number * 1e3:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    run()
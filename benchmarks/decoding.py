@@ -0,0 +1,90 @@
+"""
+Compare the cost of the response decoding modes.
+
+Run from the repository root with ``python -m benchmarks.decoding``.
+"""
+
+import functools
+import json
+import timeit
+
+from src.webcraft_api.decoding import DecodeMode, decode_json
+from src.webcraft_api.models.responses import (
+    BlocksDto,
+    EntityDto,
+    PlayerDto,
+    SuccessResponse,
+)
+
+PLAYER = {
+    "name": "Steve",
+    "uuid": "069a79f4-44e9-4726-a5be-fca90e38aaf5",
+    "firstLogin": 1700000000000,
+    "lastLogin": 1700003600000,
+    "banned": False,
+    "op": True,
+    "whitelisted": True,
+    "ip": "127.0.0.1",
+    "entityID": 42,
+    "ping": 12,
+    "allowedFlight": False,
+    "online": True,
+    "exhaustion": 0.5,
+    "exp": 0.25,
+    "foodLevel": 20,
+    "health": 20.0,
+    "level": 30,
+    "world": "world",
+}
+
+BLOCKS = {
+    "blocks": [
+        {"name": "minecraft:stone", "position": {"x": x, "y": 64, "z": z}}
+        for x in range(64)
+        for z in range(64)
+    ]
+}
+
+ENTITY = {
+    "id": 7,
+    "uniqueId": "4f0c2a1e-9b1d-4c55-8f4e-3f1d2b6c7a90",
+    "entityType": "ZOMBIE",
+    "x": 10.5,
+    "y": 64.0,
+    "z": -3.25,
+    "world": "world",
+    "customName": None,
+    "isDead": False,
+    "health": 20.0,
+    "maxHealth": 20.0,
+}
+
+SUCCESS = {"status": 200, "code": "OK", "message": "Success"}
+
+CASES = [
+    ("SuccessResponse", SuccessResponse, SUCCESS, 20000),
+    ("PlayerDto", PlayerDto, PLAYER, 20000),
+    ("EntityDto", EntityDto, ENTITY, 20000),
+    ("BlocksDto (4096 blocks)", BlocksDto, BLOCKS, 20),
+]
+
+
+def run():
+    for label, model, data, number in CASES:
+        body = json.dumps(data).encode()
+        timings = {
+            "json.loads + model(**data)": (
+                lambda model=model, body=body: model(**json.loads(body))
+            ),
+        }
+        for mode in DecodeMode:
+            timings[mode.value] = functools.partial(decode_json, model, body, mode)
+
+        print(f"{label}:")
+        for name, fn in timings.items():
+            seconds = min(timeit.repeat(fn, number=number, repeat=3)) / number
+            print(f"  {name:<28} {seconds * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    run()
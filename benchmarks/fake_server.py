@@ -0,0 +1,464 @@
+"""
+Local stand-in for a WebCraftAPI server, used by the benchmarks.
+
+It answers every endpoint the services call with well-formed payloads of
+configurable size, after a configurable delay, and keeps no state beyond
+request counters. Run it on its own with
+``python -m benchmarks.fake_server --port 8080 --latency 0.005``.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Self
+
+from aiohttp import web
+from pydantic import BaseModel
+
+OK = {"status": 200, "code": "OK", "message": "OK"}
+
+
+class ServerProfile(BaseModel):
+    """Latency and payload sizes of the fake server."""
+
+    # Seconds added to every response, plus up to ``jitter`` more
+    latency: float = 0.0
+    jitter: float = 0.0
+    players: int = 100
+    offline_players: int = 400
+    worlds: int = 3
+    entity_types: int = 80
+    inventory_slots: int = 41
+    catalog_size: int = 1000
+    banned: int = 50
+    whitelisted: int = 200
+
+
+def _player(name: str, index: int) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "uuid": f"00000000-0000-0000-0000-{index:012d}",
+        "firstLogin": 1700000000000,
+        "lastLogin": 1700003600000,
+        "banned": False,
+        "op": False,
+        "whitelisted": True,
+        "ip": "127.0.0.1",
+        "entityID": index,
+        "ping": 12,
+        "allowedFlight": False,
+        "online": True,
+        "exhaustion": 0.5,
+        "exp": 0.25,
+        "foodLevel": 20,
+        "health": 20.0,
+        "level": 30,
+        "world": "world",
+    }
+
+
+def _entity(entity_id: str) -> Dict[str, Any]:
+    return {
+        "id": abs(hash(entity_id)) % 100_000,
+        "uniqueId": entity_id,
+        "entityType": "ZOMBIE",
+        "x": 10.5,
+        "y": 64.0,
+        "z": -3.25,
+        "world": "world",
+        "customName": None,
+        "isDead": False,
+        "health": 20.0,
+        "maxHealth": 20.0,
+    }
+
+
+def _bytes(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def create_app(profile: Optional[ServerProfile] = None) -> web.Application:
+    """
+    Build the fake server application.
+
+    Args:
+        profile: Latency and payload sizes, defaults to no delay
+
+    Returns:
+        web.Application: The application, with ``app["requests"]`` counting
+            requests and ``app["blocks"]`` counting blocks read or written
+    """
+    profile = profile or ServerProfile()
+    app = web.Application(client_max_size=256 * 1024**2)
+    app["requests"] = 0
+    app["blocks"] = 0
+
+    online = [f"player{i}" for i in range(profile.players)]
+    # Fixed responses are encoded once, like a server's cached lists
+    static = {
+        "/api/ping": _bytes({"response": "pong"}),
+        "/api/api": _bytes(
+            {
+                "name": "WebCraftAPI",
+                "version": "1.0.0",
+                "authors": ["bench"],
+                "description": "Fake server",
+                "documentation": "",
+                "website": "",
+            }
+        ),
+        "/api/server": _bytes(
+            {
+                "maxPlayers": profile.players,
+                "name": "bench",
+                "version": "1.21",
+                "bukkitVersion": "1.21-R0.1",
+                "address": "127.0.0.1",
+                "port": 25565,
+                "motd": "bench",
+            }
+        ),
+        "/api/players": _bytes(
+            {"online": profile.players, "offline": profile.offline_players}
+        ),
+        "/api/players/online": _bytes({"players": online}),
+        "/api/players/offline": _bytes(
+            {"players": [f"offline{i}" for i in range(profile.offline_players)]}
+        ),
+        "/api/worlds": _bytes(
+            {"worlds": ["world"] + [f"world{i}" for i in range(1, profile.worlds)]}
+        ),
+        "/api/blocks": _bytes(
+            {"blocks": [f"minecraft:block_{i}" for i in range(profile.catalog_size)]}
+        ),
+        "/api/items": _bytes(
+            {"items": [f"minecraft:item_{i}" for i in range(profile.catalog_size)]}
+        ),
+        "/api/entities/mobs/spawnable": _bytes(
+            {"entities": [f"MOB_{i}" for i in range(profile.entity_types)]}
+        ),
+        "/api/admins": _bytes({"admins": [{"name": "admin", "uuid": "0"}]}),
+        "/api/plugins": _bytes({"plugins": ["WebCraftAPI"]}),
+        "/api/banlist/ips": _bytes(
+            {
+                "bannedIps": [
+                    {"ip": f"10.0.0.{i}", "reason": "x", "source": "y", "expires": 0}
+                    for i in range(profile.banned)
+                ]
+            }
+        ),
+        "/api/banlist/players": _bytes(
+            {
+                "bannedPlayers": [
+                    {"name": f"griefer{i}", "reason": "x", "source": "y", "expires": 0}
+                    for i in range(profile.banned)
+                ]
+            }
+        ),
+        "/api/whitelist": _bytes({"enabled": True, "enforced": True}),
+        "/api/whitelist/players": _bytes(
+            {
+                "whitelistedPlayers": [
+                    {"name": f"player{i}"} for i in range(profile.whitelisted)
+                ]
+            }
+        ),
+    }
+    inventory = _bytes(
+        {
+            "slots": [
+                {"slot": f"SLOT_{i}", "item": "minecraft:cobblestone", "amount": 64}
+                for i in range(profile.inventory_slots)
+            ]
+        }
+    )
+    ok = _bytes(OK)
+
+    async def delay():
+        if profile.latency or profile.jitter:
+            await asyncio.sleep(profile.latency + random.uniform(0, profile.jitter))
+
+    def respond(body: bytes) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    def handler(build: Callable[[web.Request], Any]):
+        async def handle(request: web.Request) -> web.Response:
+            app["requests"] += 1
+            await delay()
+            result = build(request)
+            if asyncio.iscoroutine(result):
+                result = await result
+            return respond(result if isinstance(result, bytes) else _bytes(result))
+
+        return handle
+
+    async def get_blocks(request: web.Request) -> bytes:
+        queries = (await request.json())["blocks"]
+        app["blocks"] += len(queries)
+        return _bytes(
+            {
+                "blocks": [
+                    {
+                        "name": "minecraft:stone",
+                        "position": {"x": q["x"], "y": q["y"], "z": q["z"]},
+                    }
+                    for q in queries
+                ]
+            }
+        )
+
+    async def set_blocks(request: web.Request) -> bytes:
+        app["blocks"] += len((await request.json())["blocks"])
+        return ok
+
+    async def get_block(request: web.Request) -> Dict[str, Any]:
+        query = await request.json()
+        app["blocks"] += 1
+        return {"name": "minecraft:stone", "position": query}
+
+    async def read_and_ok(request: web.Request) -> bytes:
+        if request.can_read_body:
+            await request.read()
+        return ok
+
+    def info(request: web.Request) -> Dict[str, Any]:
+        return _player(request.match_info["player"], 0)
+
+    def world(request: web.Request) -> Dict[str, Any]:
+        return {
+            "name": request.match_info["world"],
+            "time": 6000.0,
+            "difficulty": "NORMAL",
+            "hardcore": False,
+            "pvp": True,
+            "spawnAnimals": True,
+            "spawnMonsters": True,
+            "seed": "12345",
+        }
+
+    def entity(request: web.Request) -> Dict[str, Any]:
+        return _entity(request.match_info["entity"])
+
+    async def spawn(request: web.Request) -> Dict[str, Any]:
+        await request.read()
+        return _entity(f"spawned-{random.getrandbits(32):08x}")
+
+    async def entity_change(request: web.Request) -> Dict[str, Any]:
+        if request.can_read_body:
+            await request.read()
+        return _entity(request.match_info["entity"])
+
+    routes = [
+        web.get(path, handler(lambda _, body=body: body))
+        for path, body in static.items()
+    ]
+    player = "/api/players/{player}"
+    entities = "/api/entities/{entity}"
+    worlds = "/api/worlds/{world}"
+    routes += [
+        web.get(player, handler(info)),
+        web.get(f"{player}/inventory/get", handler(lambda _: inventory)),
+        web.get(
+            player + "/inventory/slots/{slot}",
+            handler(
+                lambda r: {
+                    "slot": r.match_info["slot"],
+                    "item": "minecraft:dirt",
+                    "amount": 1,
+                }
+            ),
+        ),
+        web.get(f"{player}/health", handler(lambda _: {"health": 20.0})),
+        web.get(f"{player}/maxhealth", handler(lambda _: {"maxHealth": 20.0})),
+        web.get(f"{player}/foodlevel", handler(lambda _: {"foodLevel": 20})),
+        web.get(
+            f"{player}/location",
+            handler(lambda _: {"world": "world", "x": 1.0, "y": 64.0, "z": 2.0}),
+        ),
+        web.get(
+            f"{player}/spawnpoint",
+            handler(lambda _: {"defined": True, "x": 0.0, "y": 64.0, "z": 0.0}),
+        ),
+        web.get("/api/admins/{player}", handler(lambda _: {"admin": False})),
+        web.get("/api/banlist/ips/{ip}", handler(lambda _: {"banned": False})),
+        web.get("/api/banlist/players/{player}", handler(lambda _: {"banned": False})),
+        web.get(
+            "/api/whitelist/players/{player}", handler(lambda _: {"whitelisted": True})
+        ),
+        web.get(
+            "/api/plugins/{plugin}",
+            handler(
+                lambda r: {
+                    "name": r.match_info["plugin"],
+                    "enabled": True,
+                    "version": "1.0.0",
+                    "description": "",
+                    "website": "",
+                    "authors": [],
+                    "contributors": [],
+                }
+            ),
+        ),
+        web.get(worlds, handler(world)),
+        web.get(f"{worlds}/seed", handler(lambda _: {"seed": "12345"})),
+        web.get(f"{worlds}/difficulty", handler(lambda _: {"difficulty": "NORMAL"})),
+        web.get(
+            f"{worlds}/spawnpoint", handler(lambda _: {"x": 0.0, "y": 64.0, "z": 0.0})
+        ),
+        web.get(
+            f"{worlds}/time",
+            handler(lambda _: {"time": 6000, "humanReadableTime": "12:00"}),
+        ),
+        web.get(
+            f"{worlds}/weather", handler(lambda _: {"weather": "CLEAR", "duration": 0})
+        ),
+        web.post(f"{worlds}/blocks", handler(get_blocks)),
+        web.patch(f"{worlds}/blocks", handler(set_blocks)),
+        web.post(f"{worlds}/blocks/block", handler(get_block)),
+        web.patch(f"{worlds}/blocks/block", handler(read_and_ok)),
+        web.post("/api/entities/mobs/spawn", handler(spawn)),
+        web.get(entities, handler(entity)),
+        web.get(f"{entities}/customname", handler(lambda _: {"customName": None})),
+        web.get(f"{entities}/health", handler(lambda _: {"health": 20.0})),
+        web.get(f"{entities}/maxhealth", handler(lambda _: {"maxHealth": 20.0})),
+        web.post(f"{entities}/heal", handler(entity_change)),
+        web.post(f"{entities}/kill", handler(entity_change)),
+        web.patch(f"{entities}/customname", handler(entity_change)),
+        web.patch(f"{entities}/health", handler(entity_change)),
+        web.patch(f"{entities}/maxhealth", handler(entity_change)),
+        web.post("/api/authenticate", handler(lambda _: _bytes("bench-token"))),
+        # Every remaining action answers with a plain success response
+        web.post("/api/{tail:.*}", handler(read_and_ok)),
+        web.patch("/api/{tail:.*}", handler(read_and_ok)),
+    ]
+    app.add_routes(routes)
+    return app
+
+
+class FakeServer:
+    """Runs the fake server on the current event loop."""
+
+    def __init__(
+        self,
+        profile: Optional[ServerProfile] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            profile: Latency and payload sizes
+            host: The interface to listen on
+            port: The port, 0 for any free one
+        """
+        self.app = create_app(profile)
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL to give the client.
+
+        Returns:
+            str: The URL
+        """
+        return f"http://{self.host}:{self.port}"
+
+    async def __aenter__(self) -> Self:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def _free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def _serve(profile: Dict[str, Any], host: str, port: int):
+    web.run_app(
+        create_app(ServerProfile(**profile)),
+        host=host,
+        port=port,
+        access_log=None,
+        print=None,
+    )
+
+
+@contextmanager
+def server_process(
+    profile: Optional[ServerProfile] = None, host: str = "127.0.0.1"
+) -> Iterator[str]:
+    """
+    Run the fake server in a child process.
+
+    This keeps the server's CPU time and memory out of the client's
+    measurements.
+
+    Args:
+        profile: Latency and payload sizes
+        host: The interface to listen on
+
+    Yields:
+        str: The server's base URL
+    """
+    port = _free_port(host)
+    context = multiprocessing.get_context("spawn")
+    process = context.Process(
+        target=_serve,
+        args=((profile or ServerProfile()).model_dump(), host, port),
+        daemon=True,
+    )
+    process.start()
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection((host, port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or not process.is_alive():
+                    raise RuntimeError("fake server did not start")
+                time.sleep(0.05)
+        yield f"http://{host}:{port}"
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    for name, field in ServerProfile.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+        )
+    args = parser.parse_args()
+    profile = ServerProfile(
+        **{name: getattr(args, name) for name in ServerProfile.model_fields}
+    )
+    print(f"Fake WebCraftAPI server on http://{args.host}:{args.port}")
+    _serve(profile.model_dump(), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
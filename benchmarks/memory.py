@@ -0,0 +1,116 @@
+"""
+Compare the memory held by decoded responses in each decoding mode.
+
+Run from the repository root with ``python -m benchmarks.memory``.
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from src.webcraft_api.decoding import DecodeMode, decode_data
+from src.webcraft_api.models.responses import BlocksDto, EntityDto, PlayerDto
+
+ENTITIES = 10_000
+PLAYERS = 1_000
+SIDE = 24
+
+
+def _entity(index: int) -> Dict[str, Any]:
+    return {
+        "id": index,
+        "uniqueId": f"00000000-0000-0000-0000-{index:012d}",
+        "entityType": "ZOMBIE",
+        "x": index * 0.5,
+        "y": 64.0,
+        "z": -index * 0.25,
+        "world": "world",
+        "customName": None,
+        "isDead": False,
+        "health": 20.0,
+        "maxHealth": 20.0,
+    }
+
+
+def _player(index: int) -> Dict[str, Any]:
+    return {
+        "name": f"player{index}",
+        "uuid": f"00000000-0000-0000-0000-{index:012d}",
+        "firstLogin": 1700000000000,
+        "lastLogin": 1700003600000,
+        "banned": False,
+        "op": False,
+        "whitelisted": True,
+        "ip": "127.0.0.1",
+        "entityID": index,
+        "ping": 12,
+        "allowedFlight": False,
+        "online": True,
+        "exhaustion": 0.5,
+        "exp": 0.25,
+        "foodLevel": 20,
+        "health": 20.0,
+        "level": 30,
+        "world": "world",
+    }
+
+
+def _blocks() -> Dict[str, Any]:
+    return {
+        "blocks": [
+            {"name": "minecraft:stone", "position": {"x": x, "y": y, "z": z}}
+            for x in range(SIDE)
+            for y in range(SIDE)
+            for z in range(SIDE)
+        ]
+    }
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by the value ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def _decoder(
+    make_data: Callable[[], Any],
+    decode: Callable[[Any, DecodeMode], Any],
+    mode: DecodeMode,
+) -> Callable[[], Any]:
+    """Bind one case and mode into a build function for :func:`measure`."""
+    return lambda: decode(make_data(), mode)
+
+
+def run():
+    cases = [
+        (
+            f"{ENTITIES} EntityDto",
+            lambda: [_entity(i) for i in range(ENTITIES)],
+            lambda data, mode: [decode_data(EntityDto, item, mode) for item in data],
+        ),
+        (
+            f"{PLAYERS} PlayerDto",
+            lambda: [_player(i) for i in range(PLAYERS)],
+            lambda data, mode: [decode_data(PlayerDto, item, mode) for item in data],
+        ),
+        (
+            f"{SIDE**3} BlockDto",
+            _blocks,
+            lambda data, mode: decode_data(BlocksDto, data, mode),
+        ),
+    ]
+    for label, make_data, decode in cases:
+        print(f"{label}:")
+        for mode in DecodeMode:
+            # Fresh input each time, so raw mode is charged for its dicts
+            size = measure(_decoder(make_data, decode, mode))
+            print(f"  {mode.value:<10} {size / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    run()
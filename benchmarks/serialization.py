@@ -0,0 +1,66 @@
+"""
+Compare the ways of turning request models into JSON bodies.
+
+Run from the repository root with ``python -m benchmarks.serialization``.
+"""
+
+import asyncio
+import timeit
+
+from src.webcraft_api.codec import JsonCodec
+from src.webcraft_api.models.requests import (
+    KickRequest,
+    SetBlockRequest,
+    SetBlocksRequest,
+)
+from src.webcraft_api.serialization import JsonArrayStream, encode_model
+
+BLOCKS = [
+    SetBlockRequest(block="minecraft:stone", x=x, y=64, z=z)
+    for x in range(128)
+    for z in range(128)
+]
+
+
+def _drain(stream: JsonArrayStream) -> bytes:
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in stream])
+
+    return asyncio.run(collect())
+
+
+def run():
+    codec = JsonCodec()
+    kick = KickRequest(reason="Griefing")
+    set_blocks = SetBlocksRequest(blocks=BLOCKS)
+
+    cases = [
+        (
+            "KickRequest",
+            20000,
+            {
+                "__dict__ + codec": lambda: codec.dumps(kick.__dict__),
+                "model_dump + codec": lambda: codec.dumps(kick.model_dump()),
+                "encode_model": lambda: encode_model(kick),
+            },
+        ),
+        (
+            f"SetBlocksRequest ({len(BLOCKS)} blocks)",
+            5,
+            {
+                "__dict__ + codec": lambda: codec.dumps(set_blocks.__dict__),
+                "model_dump + codec": lambda: codec.dumps(set_blocks.model_dump()),
+                "encode_model": lambda: encode_model(set_blocks),
+                "JsonArrayStream": lambda: _drain(JsonArrayStream("blocks", BLOCKS)),
+            },
+        ),
+    ]
+    for label, number, timings in cases:
+        print(f"{label}:")
+        for name, fn in timings.items():
+            seconds = min(timeit.repeat(fn, number=number, repeat=3)) / number
+            print(f"  {name:<20} {seconds * 1e6:12.1f} us")
+
+
+if __name__ == "__main__":
+    run()
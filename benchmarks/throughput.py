@@ -0,0 +1,222 @@
+"""
+Measure the client against the local fake server on representative workloads.
+
+For each workload this reports requests per second, request latency
+percentiles, client CPU time per request and the client's peak traced
+memory. The server runs in a child process, so its CPU time and memory are
+not counted. Latency is measured per attempt from the first middleware
+hook, so for highly concurrent workloads it includes time queued for a
+request slot in the client.
+
+Run from the repository root with ``python -m benchmarks.throughput``; add
+``--latency 0.01`` to simulate a remote server, ``--json`` to save results
+for comparison between releases.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List
+
+from benchmarks.fake_server import ServerProfile, server_process
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.middleware import Middleware, RequestContext
+from src.webcraft_api.models.requests import (
+    BanPlayerRequest,
+    GetBlockRequest,
+    SetBlockRequest,
+)
+
+Workload = Callable[[WebCraftAPI], Awaitable[Any]]
+
+
+class LatencyRecorder(Middleware):
+    """Keeps the exact duration of every request attempt."""
+
+    def __init__(self):
+        self.durations: List[float] = []
+
+    async def before_send(self, ctx: RequestContext):
+        ctx.extras["bench_started"] = time.perf_counter()
+
+    async def after_receive(self, ctx: RequestContext, response):
+        self.durations.append(time.perf_counter() - ctx.extras["bench_started"])
+
+
+def _cube(side: int):
+    return [(x, y, z) for x in range(side) for y in range(side) for z in range(side)]
+
+
+async def pings(client: WebCraftAPI):
+    await asyncio.gather(*(client.ping.ping() for _ in range(2000)))
+
+
+async def player_lookups(client: WebCraftAPI):
+    names = (await client.players.get_online_players()).players
+    await asyncio.gather(
+        *(client.players.get_player_info(name) for name in names for _ in range(5))
+    )
+
+
+async def roster_scan(client: WebCraftAPI):
+    for _ in range(5):
+        await client.players.get_players_snapshot()
+
+
+async def inventories(client: WebCraftAPI):
+    names = (await client.players.get_online_players()).players
+    await asyncio.gather(*(client.players.get_inventory(name) for name in names))
+
+
+async def moderation(client: WebCraftAPI):
+    async def one(index: int):
+        name = f"griefer{index}"
+        await client.banlist.is_player_banned(name)
+        await client.banlist.ban_player(BanPlayerRequest(player=name, reason="bench"))
+        await client.players.kick_player(name)
+        await client.whitelist.unwhitelist_player(name)
+
+    await asyncio.gather(*(one(i) for i in range(250)))
+
+
+async def entities(client: WebCraftAPI):
+    await asyncio.gather(
+        *(client.entities.get_entity(f"entity-{i}") for i in range(1000))
+    )
+
+
+async def block_edit_100k(client: WebCraftAPI):
+    blocks = [
+        SetBlockRequest(block="minecraft:stone", x=x, y=y, z=z) for x, y, z in _cube(47)
+    ]
+    await client.worlds.set_blocks("world", blocks)
+
+
+async def block_query_100k(client: WebCraftAPI):
+    queries = [GetBlockRequest(x=x, y=y, z=z) for x, y, z in _cube(47)]
+    await client.worlds.get_blocks("world", queries)
+
+
+WORKLOADS: Dict[str, Workload] = {
+    "pings": pings,
+    "player_lookups": player_lookups,
+    "roster_scan": roster_scan,
+    "inventories": inventories,
+    "moderation": moderation,
+    "entities": entities,
+    "block_edit_100k": block_edit_100k,
+    "block_query_100k": block_query_100k,
+}
+
+
+async def measure(
+    url: str, name: str, workload: Workload, coalesce_gets: bool = False
+) -> Dict[str, Any]:
+    """
+    Run one workload on a fresh client, then again to measure memory.
+
+    Args:
+        url: The fake server URL
+        name: The workload name
+        workload: The workload
+        coalesce_gets: Let identical concurrent GETs share a request; off
+            by default so every call is measured
+
+    Returns:
+        Dict[str, Any]: The workload's results
+    """
+    recorder = LatencyRecorder()
+    async with WebCraftAPI(
+        url, middlewares=[recorder], coalesce_gets=coalesce_gets
+    ) as client:
+        # Warm connections and caches outside of the measurement
+        await client.ping.ping()
+        recorder.durations.clear()
+        gc.collect()
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        await workload(client)
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        durations = list(recorder.durations)
+
+        gc.collect()
+        tracemalloc.start()
+        await workload(client)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    requests = len(durations)
+    percentiles = (
+        statistics.quantiles(durations, n=100, method="inclusive")
+        if requests > 1
+        else durations * 99
+    )
+    return {
+        "workload": name,
+        "requests": requests,
+        "seconds": wall,
+        "requests_per_second": requests / wall if wall else 0.0,
+        "p50_ms": percentiles[49] * 1e3 if requests else 0.0,
+        "p95_ms": percentiles[94] * 1e3 if requests else 0.0,
+        "p99_ms": percentiles[98] * 1e3 if requests else 0.0,
+        "cpu_us_per_request": cpu / requests * 1e6 if requests else 0.0,
+        "peak_mb": peak / 1e6,
+    }
+
+
+async def run_all(
+    url: str, names: List[str], coalesce_gets: bool = False
+) -> List[Dict[str, Any]]:
+    results = []
+    for name in names:
+        result = await measure(url, name, WORKLOADS[name], coalesce_gets)
+        results.append(result)
+        print(
+            f"{name:<18} {result['requests']:>6} req {result['seconds']:7.2f} s "
+            f"{result['requests_per_second']:8.0f} req/s  "
+            f"p50 {result['p50_ms']:7.2f}  p95 {result['p95_ms']:7.2f}  "
+            f"p99 {result['p99_ms']:7.2f} ms  "
+            f"{result['cpu_us_per_request']:8.0f} us CPU/req  "
+            f"{result['peak_mb']:7.1f} MB peak"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "workloads", nargs="*", help=f"any of {', '.join(WORKLOADS)}; default all"
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument(
+        "--coalesce", action="store_true", help="coalesce identical GETs"
+    )
+    parser.add_argument("--json", metavar="PATH", help="write results to a file")
+    args = parser.parse_args()
+    unknown = set(args.workloads) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"unknown workloads: {', '.join(sorted(unknown))}")
+
+    profile = ServerProfile(
+        latency=args.latency, jitter=args.jitter, players=args.players
+    )
+    with server_process(profile) as url:
+        results = asyncio.run(
+            run_all(url, args.workloads or list(WORKLOADS), args.coalesce)
+        )
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(
+                {"profile": profile.model_dump(), "results": results}, file, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
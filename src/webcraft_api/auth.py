@@ -0,0 +1,52 @@
+import base64
+import json
+from typing import Optional
+
+from pydantic import BaseModel
+
+from src.webcraft_api.timeouts import SHORT_TIMEOUT, TimeoutConfig
+
+
+class AuthConfig(BaseModel):
+    """
+    Settings controlling how the client keeps its JWT valid.
+
+    With ``background_refresh`` the client logs in again shortly before the
+    token expires: ``refresh_margin`` seconds ahead, or halfway through the
+    token's lifetime for short-lived tokens. A request answered with 401
+    triggers one re-authentication shared by every request that hit it,
+    after which each of them is replayed once. Logins give up after
+    ``login_timeout``, so a stalled auth server cannot hold up the refresh
+    or the requests waiting on it.
+    """
+
+    background_refresh: bool = True
+    refresh_margin: float = 60.0
+    refresh_retry_delay: float = 5.0
+    reauthenticate_on_401: bool = True
+    login_timeout: TimeoutConfig = SHORT_TIMEOUT
+
+
+def decode_jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the expiry of a JWT without verifying it.
+
+    Args:
+        token: The encoded JWT
+
+    Returns:
+        Optional[float]: The ``exp`` claim as a Unix timestamp, or None if
+            the token is not a JWT or has no expiry
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except ValueError:
+        return None
+    expiry = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(expiry, bool) or not isinstance(expiry, (int, float)):
+        return None
+    return float(expiry)
@@ -0,0 +1,127 @@
+from itertools import islice
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from src.webcraft_api.concurrency import imap_unordered
+from src.webcraft_api.exceptions import APIException, BatchError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class BatchConfig(BaseModel):
+    """
+    Settings for splitting large block operations into several requests.
+
+    A block entry is roughly 60 bytes of JSON, so the default chunk size
+    keeps each request body around 250 KB. Chunks of ``stream_threshold``
+    blocks or more are encoded while they are sent instead of up front, so
+    by default every chunk beyond half the chunk size is streamed; None
+    always encodes up front.
+    """
+
+    chunk_size: int = 4096
+    concurrency: int = 4
+    chunk_attempts: int = 2
+    stream_threshold: Optional[int] = 2048
+
+
+def _is_transient(error: Exception) -> bool:
+    """Client errors other than rate limiting will fail again when resent."""
+    status = error.status_code if isinstance(error, APIException) else None
+    return status is None or status == 429 or status >= 500
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split items into lists of at most ``size`` entries, lazily.
+
+    Args:
+        items: The items to split
+        size: The maximum chunk length
+
+    Yields:
+        List[T]: The next chunk
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+async def dispatch_chunks(
+    send: Callable[[List[T]], Awaitable[R]],
+    items: Iterable[T],
+    config: BatchConfig,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[R]:
+    """
+    Send items in chunks over a bounded number of concurrent requests.
+
+    Chunks that fail transiently are sent again once the first pass is
+    over, up to ``chunk_attempts`` times in total. Chunks rejected with a
+    client error are not resent, but still fail the call once the other
+    chunks are done. Only failed chunks are kept in memory between passes,
+    so lazily generated items are never fully materialized.
+
+    Args:
+        send: Coroutine function sending one chunk
+        items: The items to send
+        config: Chunk size, concurrency and attempt settings
+        on_progress: Called with the number of items done so far and the
+            total, if known, after each successful chunk
+
+    Returns:
+        List[R]: The result of each chunk, in input order
+
+    Raises:
+        BatchError: If some chunks still fail after every attempt
+    """
+    total = len(items) if isinstance(items, Sized) else None
+    results: Dict[int, R] = {}
+    done = 0
+
+    async def send_indexed(entry):
+        return await send(entry[1])
+
+    pending: Iterable = enumerate(chunked(items, config.chunk_size))
+    # Client errors are kept across passes: resending will not fix them
+    permanent: Dict[int, Exception] = {}
+    failures: Dict[int, Exception] = {}
+    for attempt in range(max(1, config.chunk_attempts)):
+        failed: Dict[int, List[T]] = {}
+        failures = {}
+        async for _, (index, chunk), result in imap_unordered(
+            send_indexed, pending, config.concurrency
+        ):
+            if isinstance(result, Exception):
+                if _is_transient(result):
+                    failures[index] = result
+                    failed[index] = chunk
+                else:
+                    permanent[index] = result
+                continue
+            results[index] = result
+            done += len(chunk)
+            if on_progress is not None:
+                on_progress(done, total)
+        if not failed:
+            break
+        pending = list(failed.items())
+
+    failures.update(permanent)
+    if failures:
+        raise BatchError(failures, len(results))
+    return [results[index] for index in sorted(results)]
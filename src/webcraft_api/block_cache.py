@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+ChunkKey = Tuple[str, int, int]
+BlockKey = Tuple[int, int, int]
+
+
+class BlockCacheStats(BaseModel):
+    """Counters describing the block cache's effectiveness."""
+
+    hits: int
+    misses: int
+    evictions: int
+    chunks: int
+    blocks: int
+    max_blocks: int
+
+
+class BlockCache:
+    """
+    Client-side cache of block names, grouped by 16x16 chunk column.
+
+    Reads populate the cache and writes update it, so repeated lookups in a
+    build area are answered locally. When more than ``max_blocks`` blocks
+    are cached, whole chunk columns are evicted, least recently used first.
+    The cache belongs to a single client, as world names are not unique
+    across servers.
+    """
+
+    def __init__(self, max_blocks: int = 1_000_000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_blocks: Maximum number of blocks kept in memory
+        """
+        self.max_blocks = max_blocks
+        self._chunks: OrderedDict[ChunkKey, Dict[BlockKey, str]] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, world: str, x: int, y: int, z: int) -> Optional[str]:
+        """
+        Look up a cached block name.
+
+        Args:
+            world: The world name
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+
+        Returns:
+            Optional[str]: The block name, or None if not cached
+        """
+        key = (world, x >> 4, z >> 4)
+        chunk = self._chunks.get(key)
+        name = chunk.get((x, y, z)) if chunk is not None else None
+        if name is None:
+            self.misses += 1
+            return None
+        self._chunks.move_to_end(key)
+        self.hits += 1
+        return name
+
+    def put(self, world: str, x: int, y: int, z: int, name: str):
+        """
+        Record the block at a position.
+
+        Args:
+            world: The world name
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+            name: The block name
+        """
+        key = (world, x >> 4, z >> 4)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._chunks[key] = {}
+        else:
+            self._chunks.move_to_end(key)
+        if (x, y, z) not in chunk:
+            self._size += 1
+        chunk[(x, y, z)] = name
+        while self._size > self.max_blocks and len(self._chunks) > 1:
+            _, evicted = self._chunks.popitem(last=False)
+            self._size -= len(evicted)
+            self.evictions += 1
+
+    def invalidate(self, world: Optional[str] = None) -> int:
+        """
+        Drop cached blocks.
+
+        Args:
+            world: Only drop blocks of this world
+
+        Returns:
+            int: The number of blocks removed
+        """
+        stale = [key for key in self._chunks if world is None or key[0] == world]
+        removed = 0
+        for key in stale:
+            removed += len(self._chunks.pop(key))
+        self._size -= removed
+        return removed
+
+    @property
+    def stats(self) -> BlockCacheStats:
+        """
+        Current cache statistics.
+
+        Returns:
+            BlockCacheStats: Hit, miss, eviction and size counters
+        """
+        return BlockCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            chunks=len(self._chunks),
+            blocks=self._size,
+            max_blocks=self.max_blocks,
+        )
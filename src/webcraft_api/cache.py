@@ -0,0 +1,158 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from pydantic import BaseModel
+
+# TTL used by services for catalog data that only changes on server restart
+CATALOG_TTL = 3600.0
+
+CacheKey = Tuple[str, str, Hashable, Hashable]
+
+
+class CacheStats(BaseModel):
+    """Counters describing the response cache's effectiveness."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_entries: int
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache for GET responses with per-entry expiry.
+
+    Entries are keyed by base URL, endpoint and query parameters, so one
+    cache can be shared by clients talking to different servers. The TTL
+    suggested by a service can be overridden per endpoint through ``ttls``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept before evicting the
+                least recently used one
+            ttls: TTL overrides in seconds, keyed by endpoint
+        """
+        self.max_entries = max_entries
+        self.ttls = dict(ttls or {})
+        self._entries: OrderedDict[CacheKey, Tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(
+        base_url: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        variant: Hashable = None,
+    ) -> CacheKey:
+        """
+        Build the cache key for a request.
+
+        Args:
+            base_url: The server base URL
+            endpoint: The API endpoint
+            params: Query parameters
+            variant: Distinguishes responses decoded differently, such as
+                the model they were decoded into
+
+        Returns:
+            CacheKey: A hashable key
+        """
+        return base_url, endpoint, frozenset((params or {}).items()), variant
+
+    def get(self, key: CacheKey) -> Any:
+        """
+        Look up a cached response.
+
+        Cached responses are shared between callers and must not be mutated.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Any: The cached response, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: CacheKey, value: Any, ttl: float):
+        """
+        Store a response.
+
+        Args:
+            key: The cache key
+            value: The decoded response
+            ttl: Default time to live in seconds, unless overridden in ``ttls``
+        """
+        ttl = self.ttls.get(key[1], ttl)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(
+        self, base_url: Optional[str] = None, endpoint: Optional[str] = None
+    ) -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            base_url: Only drop entries for this server
+            endpoint: Only drop entries whose endpoint starts with this prefix
+
+        Returns:
+            int: The number of entries removed
+        """
+        stale = [
+            key
+            for key in self._entries
+            if (base_url is None or key[0] == base_url)
+            and (endpoint is None or key[1].startswith(endpoint))
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        """Drop every cached response and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Current cache statistics.
+
+        Returns:
+            CacheStats: Hit, miss and eviction counters
+        """
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+        )
@@ -1,9 +1,31 @@
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, Union
 
 import aiohttp
-
-from src.webcraft_api.exceptions import APIException
+from pydantic import BaseModel
+
+from src.webcraft_api.auth import AuthConfig, decode_jwt_expiry
+from src.webcraft_api.batching import BatchConfig
+from src.webcraft_api.block_cache import BlockCache
+from src.webcraft_api.cache import ResponseCache
+from src.webcraft_api.codec import JsonCodec, resolve_codec
+from src.webcraft_api.decoding import DecodeMode, decode_data, decode_json
+from src.webcraft_api.events import EventPoller, PollingPolicy
+from src.webcraft_api.exceptions import APIException, DeadlineExceeded
+from src.webcraft_api.metrics import route_of
+from src.webcraft_api.middleware import Middleware, RequestContext
 from src.webcraft_api.models.requests import AuthenticateRequest
+from src.webcraft_api.pool import PoolConfig, PoolStats, PoolTracker
+from src.webcraft_api.priority import (
+    Priority,
+    PriorityClassStats,
+    PriorityConfig,
+    PriorityScheduler,
+    resolve_priority,
+)
+from src.webcraft_api.retry import RetryBudget, RetryPolicy, parse_retry_after
+from src.webcraft_api.serialization import JsonArrayStream, encode_model
 from src.webcraft_api.services.admin import AdminService
 from src.webcraft_api.services.api import ApiService
 from src.webcraft_api.services.banlist import BanlistService
@@ -16,6 +38,19 @@ from src.webcraft_api.services.plugins import PluginsService
 from src.webcraft_api.services.server import ServerService
 from src.webcraft_api.services.whitelist import WhitelistService
 from src.webcraft_api.services.worlds import WorldsService
+from src.webcraft_api.singleflight import SingleFlight, SingleFlightStats
+from src.webcraft_api.timeouts import (
+    TimeoutConfig,
+    deadline_expired,
+    no_deadline,
+    remaining_time,
+    resolve_timeout,
+)
+from src.webcraft_api.tracing import NOOP_TRACER, Span, Tracer
+
+# Request models are encoded once, straight to bytes; dicts go through the
+# codec and streams are encoded while they are sent
+RequestBody = Union[Dict[str, Any], BaseModel, JsonArrayStream, None]
 
 
 class WebCraftAPI:
@@ -26,18 +61,86 @@ class WebCraftAPI:
     for Minecraft servers.
     """
 
-    def __init__(self, base_url: str, session: Optional[aiohttp.ClientSession] = None):
+    def __init__(
+        self,
+        base_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        pool: Optional[PoolConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        middlewares: Optional[List[Middleware]] = None,
+        timeout: Optional[TimeoutConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_gets: bool = True,
+        batch: Optional[BatchConfig] = None,
+        block_cache: Optional[BlockCache] = None,
+        decode_mode: DecodeMode = DecodeMode.VALIDATE,
+        codec: Union[JsonCodec, str, None] = None,
+        polling: Optional[PollingPolicy] = None,
+        priorities: Optional[PriorityConfig] = None,
+        auth: Optional[AuthConfig] = None,
+        tracer: Optional[Tracer] = None,
+    ):
         """
         Initialize the WebCraftAPI client.
 
         Args:
             base_url: The base URL of the WebCraftAPI server
             session: Optional existing aiohttp ClientSession
+            pool: Connection pool settings, used only when the client
+                creates its own session
+            retry: Retry policy for transient failures, shared by all services
+            middlewares: Middleware run around every request, in order
+            timeout: Default timeouts, overridable per call
+            cache: Opt-in cache for catalog endpoints, may be shared between
+                clients
+            coalesce_gets: Share one in-flight request between identical
+                concurrent GETs
+            batch: Chunking settings for large block operations
+            block_cache: Opt-in cache of block names, kept up to date by
+                the client's own block reads and writes
+            decode_mode: How responses become models; the default
+                ``validate`` is also the fastest, ``slots`` trades speed for
+                much smaller snapshots and ``raw`` returns the decoded JSON
+            codec: JSON codec for request and response bodies, by instance
+                or name; defaults to the fastest one installed
+            polling: Interval adaptation and request budget of the event
+                poller
+            priorities: Concurrency limits and starvation protection of the
+                priority request scheduler
+            auth: Token refresh and re-authentication settings
+            tracer: Receives a span per service method call and per HTTP
+                request; tracing is off by default
         """
         self.base_url = base_url.rstrip("/")
         self.token: Optional[str] = None
+        self.token_expires_at: Optional[float] = None
+        self.auth = auth or AuthConfig()
+        self._credentials: Optional[AuthenticateRequest] = None
+        self._token_issued_at = 0.0
+        self._auth_flight = SingleFlight()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.pool = pool or PoolConfig()
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout or TimeoutConfig()
+        self.cache = cache
+        self.coalesce_gets = coalesce_gets
+        self._single_flight = SingleFlight()
+        self.batch = batch or BatchConfig()
+        self.block_cache = block_cache
+        self.decode_mode = DecodeMode(decode_mode)
+        self.codec = resolve_codec(codec)
+        self.tracer = tracer or NOOP_TRACER
+        self.middlewares: List[Middleware] = list(middlewares or [])
+        self._retry_budget = RetryBudget(
+            self.retry.budget_ratio, self.retry.budget_min_retries
+        )
         self._session: Optional[aiohttp.ClientSession] = session
         self._is_session_owner = session is None
+        self._pool_tracker = PoolTracker()
+        self.scheduler = PriorityScheduler(
+            priorities or PriorityConfig(),
+            self.pool.limit if session is None else None,
+        )
 
         # Initialize services
         self.admin = AdminService(self)
@@ -53,6 +156,9 @@ class WebCraftAPI:
         self.whitelist = WhitelistService(self)
         self.worlds = WorldsService(self)
 
+        # Change detection, idle until something subscribes
+        self.events = EventPoller(self, polling)
+
     async def __aenter__(self):
         """Context manager entry point."""
         await self.open()
@@ -60,21 +166,54 @@ class WebCraftAPI:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit point."""
-        if self._is_session_owner:
-            await self.close()
+        # Background tasks stop even when the session belongs to the caller
+        await self.close()
 
     async def open(self):
         """Initialize the HTTP session if it does not already exist."""
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                connector=self.pool.create_connector(),
+                trace_configs=[self._pool_tracker.trace_config()],
             )
             self._is_session_owner = True
             if self.token:
                 self._update_auth_header()
+            if self.pool.warmup_connections > 0:
+                await self._warm_up()
+
+    async def _warm_up(self):
+        """Open keep-alive connections ahead of the first real requests."""
+
+        async def touch():
+            try:
+                async with self._session.get(  # type: ignore
+                    f"{self.base_url}{self.pool.warmup_endpoint}"
+                ) as response:
+                    await response.read()
+            except aiohttp.ClientError:
+                pass
+
+        await asyncio.gather(*(touch() for _ in range(self.pool.warmup_connections)))
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """
+        Current connection pool statistics.
+
+        Returns:
+            PoolStats: Connections in use, idle, created, reused and queued
+        """
+        connector = self._session.connector if self._session else None
+        return self._pool_tracker.snapshot(connector)
 
     async def close(self):
-        """Close the HTTP session if owned by this instance."""
+        """Stop background tasks and close the HTTP session if owned."""
+        await self.events.stop()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
         if self._is_session_owner and self._session and not self._session.closed:
             await self._session.close()
             self._session = None
@@ -83,6 +222,9 @@ class WebCraftAPI:
         """
         Authenticate with the API and get a JWT token.
 
+        The credentials are kept so the client can log in again on its own
+        when the token is about to expire or gets rejected.
+
         Args:
             username: The username for authentication
             password: The password for authentication
@@ -93,28 +235,96 @@ class WebCraftAPI:
         Raises:
             APIException: If authentication fails
         """
+        self._credentials = AuthenticateRequest(username=username, password=password)
+        token = await self._login()
+        if self.auth.background_refresh and self.token_expires_at is not None:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_loop())
+        return token
+
+    async def _login(self) -> str:
+        """Exchange the stored credentials for a new token."""
         await self.open()
 
-        auth_request = AuthenticateRequest(username=username, password=password)
-
         if not self._session:
             raise RuntimeError("Session not initialized")
 
-        async with self._session.post(
-            f"{self.base_url}/api/authenticate", json=auth_request.__dict__
-        ) as response:
-            if response.status == 200:
-                text = await response.text()
-                self.token = text.strip('"')
-                self._update_auth_header()
-                return self.token
-            else:
-                try:
-                    error = await response.json()
-                    message = error.get("message", "Unknown error")
-                except Exception:
-                    message = f"Authentication failed with status {response.status}"
-                raise APIException(message, response.status)
+        try:
+            async with self._session.post(
+                f"{self.base_url}/api/authenticate",
+                data=self.codec.dumps(self._credentials.model_dump()),  # type: ignore
+                headers={"Content-Type": "application/json"},
+                timeout=self.auth.login_timeout.to_client_timeout(remaining_time()),
+            ) as response:
+                if response.status == 200:
+                    text = await response.text()
+                    self.token = text.strip('"')
+                    self.token_expires_at = decode_jwt_expiry(self.token)
+                    self._token_issued_at = time.time()
+                    self._update_auth_header()
+                    return self.token
+                else:
+                    try:
+                        error = self.codec.loads(await response.read())
+                        message = error.get("message", "Unknown error")
+                    except Exception:
+                        message = f"Authentication failed with status {response.status}"
+                    raise APIException(message, response.status)
+        except asyncio.TimeoutError as e:
+            if deadline_expired():
+                raise DeadlineExceeded() from e
+            raise
+
+    async def _reauthenticate(self, stale_token: Optional[str]):
+        """
+        Replace a token that expired or was rejected.
+
+        Concurrent callers share a single login, and callers holding a token
+        that was already replaced return at once.
+
+        Args:
+            stale_token: The token the caller found to be invalid
+        """
+        if self.token != stale_token:
+            return
+
+        async def shared() -> str:
+            # Shared by every caller, so only the login timeout applies;
+            # each caller stops waiting at its own deadline instead
+            with no_deadline():
+                return await self._login()
+
+        await self._auth_flight.do("authenticate", shared, remaining_time())
+
+    def _refresh_due(self) -> Optional[float]:
+        """Unix time at which the current token should be replaced."""
+        if self.token_expires_at is None:
+            return None
+        lifetime = self.token_expires_at - self._token_issued_at
+        margin = max(0.0, min(self.auth.refresh_margin, lifetime / 2))
+        return self.token_expires_at - margin
+
+    async def _refresh_loop(self):
+        """Log in again ahead of each token's expiry, until cancelled."""
+        while True:
+            due = self._refresh_due()
+            if due is None:
+                return
+            if due > time.time():
+                # Re-check afterwards, the token may have been replaced
+                await asyncio.sleep(due - time.time())
+                continue
+            try:
+                await self._reauthenticate(self.token)
+            except Exception:
+                # Requests fall back to re-authenticating on 401
+                await asyncio.sleep(self.auth.refresh_retry_delay)
+                continue
+            due = self._refresh_due()
+            if due is not None and due <= time.time():
+                # The server hands out tokens that are already stale, e.g.
+                # because of clock skew; leave it to the 401 handling
+                return
 
     def _update_auth_header(self):
         """Update the session headers with the authentication token."""
@@ -127,108 +337,481 @@ class WebCraftAPI:
         if not self._session:
             raise RuntimeError("Session not initialized")
 
+    @property
+    def priority_stats(self) -> Dict[str, PriorityClassStats]:
+        """
+        Statistics of the priority request scheduler.
+
+        Returns:
+            Dict[str, PriorityClassStats]: Running, queued and waiting
+                counters keyed by priority class
+        """
+        return self.scheduler.stats
+
+    @property
+    def coalesce_stats(self) -> SingleFlightStats:
+        """
+        Statistics on GET requests collapsed by single-flight deduplication.
+
+        Returns:
+            SingleFlightStats: Call, execution and collapse counters
+        """
+        return self._single_flight.stats
+
+    def invalidate_cache(self, endpoint: Optional[str] = None) -> int:
+        """
+        Drop this server's cached responses.
+
+        Args:
+            endpoint: Only drop entries whose endpoint starts with this prefix
+
+        Returns:
+            int: The number of entries removed
+        """
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(self.base_url, endpoint)
+
+    def add_middleware(self, middleware: Middleware):
+        """
+        Register a middleware on the request pipeline.
+
+        Args:
+            middleware: The middleware to run around every request
+        """
+        self.middlewares.append(middleware)
+
+    def _raise_for_status(self, ctx: RequestContext, response: aiohttp.ClientResponse):
+        """
+        Raise an APIException if the response carries an error status.
+
+        Args:
+            ctx: The request context holding the response body
+            response: The HTTP response
+
+        Raises:
+            APIException: If the response status is 400 or above
+        """
+        if response.status < 400:
+            return
+        try:
+            error = self.codec.loads(ctx.body or b"")
+            message = error.get(
+                "message", f"API request failed with status {response.status}"
+            )
+        except Exception:
+            message = f"API request failed with status {response.status}"
+        raise APIException(
+            message,
+            response.status,
+            parse_retry_after(response.headers.get("Retry-After")),
+        )
+
+    def _encode_body(self, data: RequestBody) -> Union[bytes, JsonArrayStream, None]:
+        """
+        Encode a request body.
+
+        Args:
+            data: A request model, a dict or a stream
+
+        Returns:
+            Union[bytes, JsonArrayStream, None]: The JSON bytes, the stream
+                itself, or None when there is no body
+        """
+        if data is None or isinstance(data, JsonArrayStream):
+            return data
+        if isinstance(data, BaseModel):
+            return encode_model(data)
+        return self.codec.dumps(data)
+
+    def _decode(self, model: Type[BaseModel], data: Dict[str, Any]) -> Any:
+        """
+        Turn decoded JSON into a model according to the client's decode mode.
+
+        Args:
+            model: The model class
+            data: The decoded JSON object
+
+        Returns:
+            Any: The model instance, or ``data`` itself in raw mode
+        """
+        return decode_data(model, data, self.decode_mode)
+
+    def _decode_body(
+        self,
+        ctx: RequestContext,
+        response: aiohttp.ClientResponse,
+        model: Optional[Type[BaseModel]] = None,
+    ) -> Any:
+        """
+        Decode a successful response body.
+
+        Args:
+            ctx: The request context holding the response body
+            response: The HTTP response
+            model: The model to decode into, if any
+
+        Returns:
+            Any: The model instance when a model is given and the decode
+                mode is not raw; otherwise the JSON body, plain text wrapped
+                as ``{"response": text}``, or an empty dict when there is no
+                body
+        """
+        content_type = response.headers.get("Content-Type", "")
+        if ctx.body and "application/json" in content_type:
+            if model is not None:
+                return decode_json(model, ctx.body, self.decode_mode, self.codec.loads)
+            return self.codec.loads(ctx.body)
+
+        if not ctx.body:
+            data: Dict[str, Any] = {}
+        else:
+            # Handle text responses by wrapping them
+            data = {"response": ctx.body.decode(response.get_encoding())}
+        return data if model is None else self._decode(model, data)
+
+    async def _with_retry(
+        self,
+        ctx: RequestContext,
+        send: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run a request, retrying transient failures according to the policy.
+
+        A request rejected with 401 is replayed once after re-authenticating;
+        the replay does not count against ``max_attempts``.
+
+        Args:
+            ctx: The request context, used to decide idempotency
+            send: Coroutine function performing a single attempt
+
+        Returns:
+            Any: The decoded response
+
+        Raises:
+            APIException: If the request fails and may not be retried
+        """
+        policy = self.retry
+        self._retry_budget.deposit()
+        retryable = policy.is_idempotent(ctx.method, ctx.idempotent)
+        reauthenticated = False
+        while True:
+            try:
+                return await send()
+            except APIException as e:
+                if (
+                    e.status_code == 401
+                    and not reauthenticated
+                    and self.auth.reauthenticate_on_401
+                    and self._credentials is not None
+                ):
+                    # The server did not process the request, so replay it
+                    # once with a fresh token whatever its idempotency
+                    reauthenticated = True
+                    await self._reauthenticate(ctx.extras.get("token"))
+                    continue
+                if not retryable or e.status_code not in policy.retry_statuses:
+                    raise
+                error: Exception = e
+                retry_after = e.retry_after
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not retryable:
+                    raise
+                error = e
+                retry_after = None
+
+            # The replay after re-authenticating does not use up an attempt
+            attempts = ctx.attempt - reauthenticated
+            if attempts >= policy.max_attempts:
+                raise error
+            delay = policy.backoff(attempts, retry_after)
+            remaining = remaining_time()
+            if remaining is not None and remaining <= delay:
+                raise DeadlineExceeded() from error
+            if not self._retry_budget.withdraw():
+                raise error
+            await asyncio.sleep(delay)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: RequestBody = None,
+        idempotent: Optional[bool] = None,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        model: Optional[Type[BaseModel]] = None,
+        priority: Optional[Priority] = None,
+    ) -> Any:
+        """
+        Send a request through the middleware pipeline.
+
+        Args:
+            method: The HTTP method
+            endpoint: The API endpoint
+            params: Query parameters
+            data: JSON request body, preferably the request model itself
+            idempotent: Whether the request may be retried, defaults to the
+                retry policy's rule for the method
+            timeout: Timeouts for this call, or a total timeout in seconds;
+                always clamped to the active deadline
+            model: Decode the response into this model, following the
+                client's decode mode
+            priority: Default scheduling class, overridden by a caller's
+                ``priority`` block
+
+        Returns:
+            Any: The decoded model, or the response data without a model
+
+        Raises:
+            APIException: If the request fails
+        """
+        await self._check_session()
+        ctx = RequestContext(
+            method,
+            endpoint,
+            f"{self.base_url}{endpoint}",
+            params,
+            data,
+            idempotent,
+            resolve_timeout(timeout, self.timeout),
+            resolve_priority(priority),
+        )
+
+        async def send() -> Any:
+            ctx.attempt += 1
+            ctx.status = None
+            ctx.body = None
+            if (
+                self.token_expires_at is not None
+                and self._credentials is not None
+                and time.time() >= self.token_expires_at
+            ):
+                # Missed the background refresh, e.g. after a suspend
+                await self._reauthenticate(self.token)
+            ctx.extras["token"] = self.token
+            try:
+                ctx.content = self._encode_body(ctx.data)
+                if ctx.content is not None:
+                    ctx.headers.setdefault("Content-Type", "application/json")
+                for middleware in self.middlewares:
+                    await middleware.before_send(ctx)
+                # Computed after the hooks, which may have waited
+                client_timeout = ctx.timeout.to_client_timeout(remaining_time())
+                async with self.scheduler.slot(ctx.priority) as waited:
+                    ctx.extras["priority_wait"] = waited
+                    async with self._session.request(  # type: ignore
+                        ctx.method,
+                        ctx.url,
+                        params=ctx.params,
+                        data=ctx.content,
+                        headers=ctx.headers,
+                        timeout=client_timeout,
+                    ) as response:
+                        ctx.status = response.status
+                        ctx.body = await response.read()
+                        for middleware in self.middlewares:
+                            await middleware.after_receive(ctx, response)
+                        self._raise_for_status(ctx, response)
+                        return self._decode_body(ctx, response, model)
+            except BaseException as e:
+                for middleware in self.middlewares:
+                    await middleware.on_error(ctx, e)
+                span = ctx.extras.get("span")
+                if span is not None:
+                    span.add_event(
+                        "attempt failed",
+                        {
+                            "http.request.resend_count": ctx.attempt - 1,
+                            "exception.type": type(e).__name__,
+                        },
+                    )
+                if isinstance(e, asyncio.TimeoutError) and deadline_expired():
+                    raise DeadlineExceeded() from e
+                raise
+
+        if not self.tracer.enabled:
+            return await self._with_retry(ctx, send)
+        route = route_of(endpoint)
+        with self.tracer.start_span(
+            f"{method} {route}",
+            {
+                "http.request.method": method,
+                "http.route": route,
+                "url.full": ctx.url,
+                "webcraft.priority": ctx.priority.name.lower(),
+            },
+        ) as span:
+            ctx.extras["span"] = span
+            try:
+                return await self._with_retry(ctx, send)
+            finally:
+                self._finish_http_span(span, ctx)
+
+    @staticmethod
+    def _finish_http_span(span: Span, ctx: RequestContext):
+        """
+        Record the outcome of a request on its span.
+
+        Args:
+            span: The HTTP span
+            ctx: The request context after the last attempt
+        """
+        span.set_attribute("http.request.resend_count", max(ctx.attempt - 1, 0))
+        if ctx.status is not None:
+            span.set_attribute("http.response.status_code", ctx.status)
+        if isinstance(ctx.content, bytes):
+            span.set_attribute("http.request.body.size", len(ctx.content))
+        if ctx.body is not None:
+            span.set_attribute("http.response.body.size", len(ctx.body))
+
     async def _get(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        cache_ttl: Optional[float] = None,
+        model: Optional[Type[BaseModel]] = None,
+        priority: Optional[Priority] = None,
+    ) -> Any:
         """
         Make a GET request to the API.
 
         Args:
             endpoint: The API endpoint
             params: Query parameters
+            idempotent: Whether the request may be retried, defaults to the
+                retry policy's rule for GET
+            timeout: Timeouts for this call, or a total timeout in seconds
+            cache_ttl: Make the response cacheable for this many seconds,
+                when the client has a cache configured
+            model: Decode the response into this model
+            priority: Default scheduling class of the request
 
         Returns:
-            dict: The response data
+            Any: The decoded model, or the response data without a model
 
         Raises:
             APIException: If the request fails
         """
-        await self._check_session()
-        async with self._session.get(  # type: ignore
-            f"{self.base_url}{endpoint}", params=params
-        ) as response:
-            if response.status >= 400:
-                try:
-                    error = await response.json()
-                    message = error.get(
-                        "message", f"API request failed with status {response.status}"
+        key = ResponseCache.key(
+            self.base_url, endpoint, params, (model, self.decode_mode)
+        )
+
+        async def fetch() -> Any:
+            if not self.coalesce_gets:
+                return await self._request(
+                    "GET",
+                    endpoint,
+                    params=params,
+                    idempotent=idempotent,
+                    timeout=timeout,
+                    model=model,
+                    priority=priority,
+                )
+            level = resolve_priority(priority)
+            config = resolve_timeout(timeout, self.timeout)
+
+            async def shared() -> Any:
+                # Runs for every caller, so none of their deadlines apply;
+                # each caller stops waiting at its own deadline instead
+                with no_deadline():
+                    return await self._request(
+                        "GET",
+                        endpoint,
+                        params=params,
+                        idempotent=idempotent,
+                        timeout=config,
+                        model=model,
+                        priority=level,
                     )
-                except Exception:
-                    message = f"API request failed with status {response.status}"
-                raise APIException(message, response.status)
 
-            return await response.json()
+            return await self._single_flight.do(
+                (key, level, config.connect, config.sock_read, config.total),
+                shared,
+                remaining_time(),
+            )
+
+        if self.cache is None or cache_ttl is None:
+            return await fetch()
+
+        response = self.cache.get(key)
+        if response is None:
+            response = await fetch()
+            self.cache.set(key, response, cache_ttl)
+        return response
 
     async def _post(
-        self, endpoint: str, data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        self,
+        endpoint: str,
+        data: RequestBody = None,
+        idempotent: Optional[bool] = None,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        model: Optional[Type[BaseModel]] = None,
+        priority: Optional[Priority] = None,
+    ) -> Any:
         """
         Make a POST request to the API.
 
         Args:
             endpoint: The API endpoint
-            data: Request data
+            data: Request data, preferably the request model itself
+            idempotent: Whether the request may be retried, defaults to the
+                retry policy's rule for POST
+            timeout: Timeouts for this call, or a total timeout in seconds
+            model: Decode the response into this model
+            priority: Default scheduling class of the request
 
         Returns:
-            dict: The response data
+            Any: The decoded model, or the response data without a model
 
         Raises:
             APIException: If the request fails
         """
-        await self._check_session()
-        async with self._session.post(  # type: ignore
-            f"{self.base_url}{endpoint}", json=data
-        ) as response:
-            if response.status >= 400:
-                try:
-                    error = await response.json()
-                    message = error.get(
-                        "message", f"API request failed with status {response.status}"
-                    )
-                except Exception:
-                    message = f"API request failed with status {response.status}"
-                raise APIException(message, response.status)
-
-            if response.status == 200:
-                content_type = response.headers.get("Content-Type", "")
-                if "application/json" in content_type:
-                    return await response.json()
-                else:
-                    # Handle text responses by wrapping them
-                    text = await response.text()
-                    return {"response": text}
-
-            return {}
+        return await self._request(
+            "POST",
+            endpoint,
+            data=data,
+            idempotent=idempotent,
+            timeout=timeout,
+            model=model,
+            priority=priority,
+        )
 
     async def _patch(
-        self, endpoint: str, data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        self,
+        endpoint: str,
+        data: RequestBody = None,
+        idempotent: Optional[bool] = None,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        model: Optional[Type[BaseModel]] = None,
+        priority: Optional[Priority] = None,
+    ) -> Any:
         """
         Make a PATCH request to the API.
 
         Args:
             endpoint: The API endpoint
-            data: Request data
+            data: Request data, preferably the request model itself
+            idempotent: Whether the request may be retried, defaults to the
+                retry policy's rule for PATCH
+            timeout: Timeouts for this call, or a total timeout in seconds
+            model: Decode the response into this model
+            priority: Default scheduling class of the request
 
         Returns:
-            dict: The response data
+            Any: The decoded model, or the response data without a model
 
         Raises:
             APIException: If the request fails
         """
-        await self._check_session()
-
-        async with self._session.patch(  # type: ignore
-            f"{self.base_url}{endpoint}", json=data
-        ) as response:
-            if response.status >= 400:
-                try:
-                    error = await response.json()
-                    message = error.get(
-                        "message", f"API request failed with status {response.status}"
-                    )
-                except Exception:
-                    message = f"API request failed with status {response.status}"
-                raise APIException(message, response.status)
-
-            return await response.json()
+        return await self._request(
+            "PATCH",
+            endpoint,
+            data=data,
+            idempotent=idempotent,
+            timeout=timeout,
+            model=model,
+            priority=priority,
+        )
@@ -0,0 +1,157 @@
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def _encode_default(value: Any) -> Any:
+    """Encode values the JSON libraries do not know about natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    This base implementation uses the standard library. Pydantic models
+    nested anywhere in a request body are serialized through
+    ``model_dump``.
+    """
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as JSON.
+
+        Args:
+            value: The value to encode
+
+        Returns:
+            bytes: The UTF-8 encoded JSON
+        """
+        return json.dumps(
+            value, separators=(",", ":"), default=_encode_default
+        ).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON.
+
+        Args:
+            data: The JSON document
+
+        Returns:
+            Any: The decoded value
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """
+        Initialize the codec.
+
+        Raises:
+            ImportError: If orjson is not installed
+        """
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson, install it with `pip install orjson`"
+            )
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=_encode_default)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        """
+        Initialize the codec.
+
+        Raises:
+            ImportError: If msgspec is not installed
+        """
+        if msgspec is None:
+            raise ImportError(
+                "MsgspecCodec requires msgspec, install it with `pip install msgspec`"
+            )
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def default_codec() -> JsonCodec:
+    """
+    Pick the fastest installed codec.
+
+    Returns:
+        JsonCodec: orjson if installed, then msgspec, then the standard library
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecCodec()
+    return JsonCodec()
+
+
+def resolve_codec(codec: Union[JsonCodec, str, None]) -> JsonCodec:
+    """
+    Turn a codec setting into a codec.
+
+    Args:
+        codec: A codec instance, a codec name from ``CODECS``, or None for
+            the fastest installed codec
+
+    Returns:
+        JsonCodec: The codec
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the named codec's library is not installed
+    """
+    if codec is None:
+        return default_codec()
+    if isinstance(codec, JsonCodec):
+        return codec
+    codec_type: Optional[Type[JsonCodec]] = CODECS.get(codec)
+    if codec_type is None:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}, expected one of {', '.join(CODECS)}"
+        )
+    return codec_type()
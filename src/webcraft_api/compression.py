@@ -0,0 +1,278 @@
+import importlib.util
+import zlib
+from fnmatch import fnmatchcase
+from typing import AsyncIterable, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+from pydantic import BaseModel
+
+from src.webcraft_api.middleware import Middleware, RequestContext
+
+# Endpoints moving large, repetitive JSON: block queries and edits, the
+# block and item catalogs and inventories
+DEFAULT_ENDPOINTS = (
+    "/api/worlds/*/blocks",
+    "/api/blocks",
+    "/api/items",
+    "/api/players/*/inventory/get",
+)
+
+# aiohttp decodes zstd from 3.13 on, through the standard library module
+# or its backport
+ZSTD_AIOHTTP_VERSION = (3, 13)
+
+
+def _installed(*modules: str) -> bool:
+    """
+    Check whether any of the given modules can be imported.
+
+    Args:
+        modules: Dotted module names
+
+    Returns:
+        bool: True if one of them is installed
+    """
+    for module in modules:
+        try:
+            if importlib.util.find_spec(module) is not None:
+                return True
+        except ModuleNotFoundError:
+            # The parent package of a dotted name is missing
+            continue
+    return False
+
+
+def _aiohttp_version() -> Tuple[int, ...]:
+    return tuple(int(part) for part in aiohttp.__version__.split(".")[:2])
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """
+    Response encodings aiohttp can decode here, best ratio first.
+
+    Returns:
+        Tuple[str, ...]: ``zstd`` and ``br`` when their libraries are
+            installed, then ``gzip`` and ``deflate``
+    """
+    encodings = []
+    if _aiohttp_version() >= ZSTD_AIOHTTP_VERSION and _installed(
+        "compression.zstd", "backports.zstd"
+    ):
+        encodings.append("zstd")
+    if _installed("brotlicffi", "brotli"):
+        encodings.append("br")
+    return (*encodings, "gzip", "deflate")
+
+
+class CompressionConfig(BaseModel):
+    """
+    Settings of response and request body compression.
+
+    Only requests to ``endpoints`` (shell-style patterns) are touched. They
+    ask for every encoding in ``accept_encodings``, and when
+    ``request_min_size`` is set, bodies at least that many bytes long are
+    sent gzip-compressed. Request compression is off by default because the
+    server has to be set up to accept it. Streamed bodies are compressed
+    whenever request compression is on, since they are only used for large
+    block lists.
+    """
+
+    endpoints: Tuple[str, ...] = DEFAULT_ENDPOINTS
+    accept_encodings: Tuple[str, ...] = supported_encodings()
+    request_min_size: Optional[int] = None
+    level: int = 6
+
+
+class CompressionStats(BaseModel):
+    """
+    Byte counters of compressed endpoints.
+
+    ``response_bytes_received`` only covers responses whose wire size is
+    known from ``Content-Length``; the others are counted in
+    ``responses_unmeasured`` and left out of both response byte totals.
+    """
+
+    requests_compressed: int
+    request_bytes: int
+    request_bytes_sent: int
+    responses: int
+    responses_compressed: int
+    responses_unmeasured: int
+    response_bytes: int
+    response_bytes_received: int
+    encodings: Dict[str, int]
+
+    @property
+    def bytes_saved(self) -> int:
+        """
+        Bytes kept off the wire in both directions.
+
+        Returns:
+            int: The total saved
+        """
+        return (
+            self.request_bytes
+            - self.request_bytes_sent
+            + self.response_bytes
+            - self.response_bytes_received
+        )
+
+
+class GzipStream:
+    """
+    Gzip-compressed view of a streamed request body.
+
+    Like the stream it wraps, every iteration starts over, so a retried
+    request sends the full body again. Bytes are counted once, when the
+    first iteration completes, so retries and abandoned attempts do not
+    inflate the counters.
+    """
+
+    def __init__(
+        self,
+        stream: AsyncIterable[bytes],
+        level: int = 6,
+        stats: Optional["CompressionMiddleware"] = None,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            stream: The uncompressed body
+            level: The zlib compression level
+            stats: Middleware whose request byte counters are updated
+        """
+        self.stream = stream
+        self.level = level
+        self.stats = stats
+        self.counted = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        compressor = zlib.compressobj(self.level, wbits=31)
+        raw = sent = 0
+        async for chunk in self.stream:
+            compressed = compressor.compress(chunk)
+            raw += len(chunk)
+            sent += len(compressed)
+            if compressed:
+                yield compressed
+        tail = compressor.flush()
+        sent += len(tail)
+        yield tail
+        if self.stats is not None and not self.counted:
+            self.counted = True
+            self.stats.request_bytes += raw
+            self.stats.request_bytes_sent += sent
+
+
+class CompressionMiddleware(Middleware):
+    """
+    Middleware negotiating compressed responses and compressing large
+    request bodies on selected endpoints.
+
+    aiohttp decompresses responses itself; this middleware chooses what to
+    ask for and counts the bytes on both sides of the compression. Register
+    it after middleware that changes the request body.
+    """
+
+    def __init__(self, config: Optional[CompressionConfig] = None):
+        """
+        Initialize the middleware.
+
+        Args:
+            config: Endpoints, encodings and request size threshold
+        """
+        self.config = config or CompressionConfig()
+        self.requests_compressed = 0
+        self.request_bytes = 0
+        self.request_bytes_sent = 0
+        self.responses = 0
+        self.responses_compressed = 0
+        self.responses_unmeasured = 0
+        self.response_bytes = 0
+        self.response_bytes_received = 0
+        self.encodings: Dict[str, int] = {}
+
+    def applies(self, endpoint: str) -> bool:
+        """
+        Check whether an endpoint is opted in.
+
+        Args:
+            endpoint: The API endpoint
+
+        Returns:
+            bool: True if the endpoint matches one of the patterns
+        """
+        return any(fnmatchcase(endpoint, pattern) for pattern in self.config.endpoints)
+
+    async def before_send(self, ctx: RequestContext):
+        if not self.applies(ctx.endpoint):
+            return
+        ctx.extras["compression"] = True
+        if self.config.accept_encodings:
+            ctx.headers["Accept-Encoding"] = ", ".join(self.config.accept_encodings)
+        min_size = self.config.request_min_size
+        content = ctx.content
+        if min_size is None or content is None:
+            return
+        # The body is encoded again for every attempt; count it only once
+        first = not ctx.extras.get("compression_counted")
+        if isinstance(content, bytes):
+            if len(content) < min_size:
+                return
+            compressed = zlib.compress(content, self.config.level, wbits=31)
+            if first:
+                self.request_bytes += len(content)
+                self.request_bytes_sent += len(compressed)
+            ctx.content = compressed
+        else:
+            stream = ctx.extras.get("compressed_stream")
+            if stream is None:
+                stream = GzipStream(content, self.config.level, self)
+                ctx.extras["compressed_stream"] = stream
+            else:
+                stream.stream = content
+            ctx.content = stream
+        ctx.headers["Content-Encoding"] = "gzip"
+        if first:
+            ctx.extras["compression_counted"] = True
+            self.requests_compressed += 1
+
+    async def after_receive(
+        self, ctx: RequestContext, response: aiohttp.ClientResponse
+    ):
+        if not ctx.extras.get("compression"):
+            return
+        self.responses += 1
+        encoding = response.headers.get("Content-Encoding", "identity").lower()
+        if encoding != "identity":
+            self.responses_compressed += 1
+        self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+        length = response.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            # Chunked responses do not reveal their size on the wire
+            self.responses_unmeasured += 1
+            return
+        self.response_bytes += len(ctx.body or b"")
+        self.response_bytes_received += int(length)
+
+    @property
+    def stats(self) -> CompressionStats:
+        """
+        Current byte counters.
+
+        Returns:
+            CompressionStats: Request and response sizes before and after
+                compression
+        """
+        return CompressionStats(
+            requests_compressed=self.requests_compressed,
+            request_bytes=self.request_bytes,
+            request_bytes_sent=self.request_bytes_sent,
+            responses=self.responses,
+            responses_compressed=self.responses_compressed,
+            responses_unmeasured=self.responses_unmeasured,
+            response_bytes=self.response_bytes,
+            response_bytes_received=self.response_bytes_received,
+            encodings=dict(self.encodings),
+        )
@@ -0,0 +1,78 @@
+import asyncio
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from src.webcraft_api.exceptions import REQUEST_ERRORS
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+async def imap_unordered(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int,
+) -> AsyncIterator[Tuple[int, T, Union[R, Exception]]]:
+    """
+    Apply an async function to items with bounded concurrency.
+
+    Items are pulled lazily from ``items``, so generators are never
+    materialized, and results are yielded as soon as they complete. A
+    failed request is yielded in place of the result instead of aborting
+    the rest; any other exception is a bug and propagates. Closing the
+    iterator early cancels the remaining work.
+
+    Args:
+        fn: Coroutine function applied to each item
+        items: The items to process
+        concurrency: Maximum number of calls running at once
+
+    Yields:
+        Tuple[int, T, Union[R, Exception]]: The item's input position, the
+            item and its result or exception
+    """
+    iterator = enumerate(items)
+    results: asyncio.Queue = asyncio.Queue(maxsize=max(1, concurrency))
+
+    async def worker():
+        for index, item in iterator:
+            try:
+                result: Union[R, Exception] = await fn(item)
+            except REQUEST_ERRORS as e:
+                result = e
+            await results.put((index, item, result))
+
+    async def run_workers():
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        except Exception:
+            # e.g. the items iterable itself raised; end the results first
+            await results.put(_DONE)
+            raise
+        await results.put(_DONE)
+
+    runner = asyncio.create_task(run_workers())
+    try:
+        while True:
+            entry = await results.get()
+            if entry is _DONE:
+                break
+            yield entry
+        # Propagate unexpected failures of the workers themselves
+        await runner
+    finally:
+        if not runner.done():
+            runner.cancel()
+            try:
+                await runner
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,144 @@
+import json
+from enum import Enum
+from functools import lru_cache
+from types import UnionType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from src.webcraft_api.models.slotted import slotted
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class DecodeMode(str, Enum):
+    """
+    How responses are turned into models.
+
+    ``validate`` is the fastest way to get models, since pydantic-core
+    parses and validates the bytes in native code; ``benchmarks.decoding``
+    compares the modes.
+    """
+
+    # Full pydantic validation, parsing the JSON bytes directly
+    VALIDATE = "validate"
+    # Build frozen slotted dataclasses with the models' fields; slower than
+    # validate, but much smaller in memory for large snapshots
+    SLOTS = "slots"
+    # Skip models entirely and return the decoded JSON
+    RAW = "raw"
+
+
+def _unwrap(annotation: Any) -> Tuple[Optional[str], Optional[Type[BaseModel]]]:
+    """Find the nested model behind a field annotation, if any."""
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        for arg in get_args(annotation):
+            if arg is not type(None):
+                return _unwrap(arg)
+        return None, None
+    if origin in (list, tuple):
+        args = get_args(annotation)
+        if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            return "list", args[0]
+        return None, None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return "model", annotation
+    return None, None
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(model: Type[BaseModel]) -> Dict[str, Tuple[str, Type[BaseModel]]]:
+    """Map each field holding models to how it nests them."""
+    nested = {}
+    for name, field in model.model_fields.items():
+        kind, submodel = _unwrap(field.annotation)
+        if kind is not None:
+            nested[name] = (kind, submodel)
+    return nested
+
+
+def to_slotted(model: Type[BaseModel], data: Dict[str, Any]) -> Any:
+    """
+    Build the slotted counterpart of a model and its nested models.
+
+    Keys that are not fields of the model are ignored, as pydantic does.
+
+    Args:
+        model: The model class
+        data: The decoded JSON object
+
+    Returns:
+        Any: An instance of ``slotted(model)``
+    """
+    nested = _nested_fields(model)
+    values = {name: data[name] for name in model.model_fields if name in data}
+    for name, (kind, submodel) in nested.items():
+        value = values.get(name)
+        if value is None:
+            continue
+        if kind == "list":
+            values[name] = [
+                to_slotted(submodel, item) if isinstance(item, dict) else item
+                for item in value
+            ]
+        elif isinstance(value, dict):
+            values[name] = to_slotted(submodel, value)
+    return slotted(model)(**values)
+
+
+def decode_data(model: Type[M], data: Dict[str, Any], mode: DecodeMode) -> Any:
+    """
+    Turn decoded JSON into a model according to the decoding mode.
+
+    Args:
+        model: The model class
+        data: The decoded JSON object
+        mode: The decoding mode
+
+    Returns:
+        Any: The model instance, its slotted counterpart in slots mode, or
+            ``data`` itself in raw mode
+    """
+    if mode is DecodeMode.RAW:
+        return data
+    if mode is DecodeMode.SLOTS:
+        return to_slotted(model, data)
+    return model(**data)
+
+
+def decode_json(
+    model: Type[M],
+    body: bytes,
+    mode: DecodeMode,
+    loads: Callable[[bytes], Any] = json.loads,
+) -> Any:
+    """
+    Turn a JSON response body into a model according to the decoding mode.
+
+    In validate mode pydantic parses the bytes itself, skipping the
+    intermediate dict.
+
+    Args:
+        model: The model class
+        body: The raw JSON bytes
+        mode: The decoding mode
+        loads: The JSON decoder used outside of validate mode
+
+    Returns:
+        Any: The model instance, or the decoded JSON in raw mode
+    """
+    if mode is DecodeMode.VALIDATE:
+        return model.model_validate_json(body)
+    return decode_data(model, loads(body), mode)
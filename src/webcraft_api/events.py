@@ -0,0 +1,651 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Self, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from src.webcraft_api.exceptions import REQUEST_ERRORS, APIException
+from src.webcraft_api.models.events import (
+    EntityHealthChanged,
+    EntityMoved,
+    EntityRemoved,
+    Event,
+    HealthChanged,
+    PlayerJoined,
+    PlayerLeft,
+    PollFailed,
+    WeatherChanged,
+)
+from src.webcraft_api.ratelimit import TokenBucket, TokenBucketStats
+
+if TYPE_CHECKING:
+    from src.webcraft_api.client import WebCraftAPI
+
+logger = logging.getLogger(__name__)
+
+
+class EventSource(ABC):
+    """
+    A resource polled for changes.
+
+    Subclasses fetch a snapshot of the resource in ``poll`` and compare two
+    consecutive snapshots in ``diff``. Sources are identified by ``key``;
+    watching a source whose key is already watched reuses the existing one.
+    ``cost`` is the number of requests one poll makes, charged against the
+    poller's request budget. Sources whose cost varies set it in ``poll`` to
+    the number of requests that poll made; the poller charges the
+    difference, and the new value is the estimate for the next poll.
+    """
+
+    def __init__(self, key: str, interval: float):
+        """
+        Initialize the source.
+
+        Args:
+            key: Identifies the resource, also used as the events' source
+            interval: Base seconds between polls, adapted by the poller's
+                polling policy
+        """
+        self.key = key
+        self.interval = interval
+        self.cost = 1.0
+
+    @abstractmethod
+    async def poll(self, client: "WebCraftAPI") -> Any:
+        """
+        Fetch the current state of the resource.
+
+        Args:
+            client: The client to poll through
+
+        Returns:
+            Any: A snapshot passed to ``diff``
+        """
+
+    @abstractmethod
+    def diff(self, previous: Any, current: Any, timestamp: float) -> List[Event]:
+        """
+        Describe the changes between two snapshots.
+
+        Args:
+            previous: The snapshot of the previous poll
+            current: The snapshot of this poll
+            timestamp: When this poll completed
+
+        Returns:
+            List[Event]: The detected changes, possibly none
+        """
+
+
+class OnlinePlayersSource(EventSource):
+    """Reports players joining and leaving, with one request per poll."""
+
+    def __init__(self, interval: float = 2.0):
+        super().__init__("players/online", interval)
+
+    async def poll(self, client: "WebCraftAPI") -> Set[str]:
+        response = await client._get("/api/players/online")
+        return set(response["players"])
+
+    def diff(
+        self, previous: Set[str], current: Set[str], timestamp: float
+    ) -> List[Event]:
+        events: List[Event] = [
+            PlayerJoined(source=self.key, timestamp=timestamp, player=player)
+            for player in sorted(current - previous)
+        ]
+        events.extend(
+            PlayerLeft(source=self.key, timestamp=timestamp, player=player)
+            for player in sorted(previous - current)
+        )
+        return events
+
+
+class PlayerHealthSource(EventSource):
+    """
+    Reports health changes of online players.
+
+    Every poll fetches each online player's information, so this source is
+    far more expensive than ``OnlinePlayersSource``.
+    """
+
+    def __init__(self, interval: float = 5.0, concurrency: int = 16):
+        super().__init__("players/health", interval)
+        self.concurrency = concurrency
+
+    async def poll(self, client: "WebCraftAPI") -> Dict[str, float]:
+        health = {}
+        # One request for the roster plus one per player
+        self.cost = 1.0
+        async for player, result in client.players._iter_raw_player_info(
+            None, self.concurrency
+        ):
+            self.cost += 1
+            # Players who left between the two requests are skipped
+            if not isinstance(result, Exception):
+                health[player] = result["health"]
+        return health
+
+    def diff(
+        self, previous: Dict[str, float], current: Dict[str, float], timestamp: float
+    ) -> List[Event]:
+        return [
+            HealthChanged(
+                source=self.key,
+                timestamp=timestamp,
+                player=player,
+                old=previous[player],
+                new=health,
+            )
+            for player, health in current.items()
+            if player in previous and previous[player] != health
+        ]
+
+
+class WeatherSource(EventSource):
+    """Reports weather changes of a world."""
+
+    def __init__(self, world: str, interval: float = 10.0):
+        super().__init__(f"worlds/{world}/weather", interval)
+        self.world = world
+
+    async def poll(self, client: "WebCraftAPI") -> str:
+        response = await client._get(f"/api/worlds/{self.world}/weather")
+        return response["weather"]
+
+    def diff(self, previous: str, current: str, timestamp: float) -> List[Event]:
+        if previous == current:
+            return []
+        return [
+            WeatherChanged(
+                source=self.key,
+                timestamp=timestamp,
+                world=self.world,
+                old=previous,
+                new=current,
+            )
+        ]
+
+
+class EntitySource(EventSource):
+    """Reports health changes, movement and removal of one entity."""
+
+    def __init__(self, entity_id: str, interval: float = 2.0):
+        super().__init__(f"entities/{entity_id}", interval)
+        self.entity_id = entity_id
+
+    async def poll(self, client: "WebCraftAPI") -> Optional[Dict[str, Any]]:
+        try:
+            entity = await client._get(f"/api/entities/{self.entity_id}")
+        except APIException as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return None if entity.get("isDead") else entity
+
+    def diff(
+        self,
+        previous: Optional[Dict[str, Any]],
+        current: Optional[Dict[str, Any]],
+        timestamp: float,
+    ) -> List[Event]:
+        if previous is None:
+            return []
+        if current is None:
+            return [
+                EntityRemoved(
+                    source=self.key, timestamp=timestamp, entity_id=self.entity_id
+                )
+            ]
+        events: List[Event] = []
+        if previous.get("health") != current.get("health"):
+            events.append(
+                EntityHealthChanged(
+                    source=self.key,
+                    timestamp=timestamp,
+                    entity_id=self.entity_id,
+                    old=previous.get("health", 0.0),
+                    new=current.get("health", 0.0),
+                )
+            )
+        position = ("world", "x", "y", "z")
+        if any(previous[field] != current[field] for field in position):
+            events.append(
+                EntityMoved(
+                    source=self.key,
+                    timestamp=timestamp,
+                    entity_id=self.entity_id,
+                    **{field: current[field] for field in position},
+                )
+            )
+        return events
+
+
+class PollingPolicy(BaseModel):
+    """
+    Settings adapting poll intervals to how often resources change.
+
+    After a poll that detected changes a source's interval is multiplied by
+    ``speedup``, after a quiet or failed poll by ``backoff``, staying within
+    ``min_factor`` and ``max_factor`` times the source's base interval.
+    ``max_rps`` caps the requests per second of all sources together; when
+    the budget is exhausted polls wait their turn. Set both factors to 1 for
+    fixed intervals.
+    """
+
+    min_factor: float = 0.25
+    max_factor: float = 8.0
+    speedup: float = 0.5
+    backoff: float = 1.5
+    max_rps: Optional[float] = None
+    burst: float = 10.0
+
+    def next_interval(self, base: float, current: float, changed: bool) -> float:
+        """
+        Compute a source's interval after a poll.
+
+        Args:
+            base: The source's base interval
+            current: The interval used for the last poll
+            changed: Whether the poll detected changes
+
+        Returns:
+            float: The seconds until the next poll
+        """
+        interval = current * (self.speedup if changed else self.backoff)
+        return min(base * self.max_factor, max(base * self.min_factor, interval))
+
+
+class ScheduleEntry(BaseModel):
+    """The adaptive schedule of one watched source."""
+
+    key: str
+    base_interval: float
+    interval: float
+    next_poll_in: Optional[float] = None
+    cost: float
+    polls: int
+    changes: int
+    change_ratio: float
+    throttled_seconds: float
+
+
+class _SourceState:
+    """Scheduling state of one watched source."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_poll: Optional[float] = None
+        self.polls = 0
+        self.changes = 0
+        # Moving average of the share of polls that detected changes
+        self.change_ratio = 0.0
+        self.throttled_seconds = 0.0
+
+
+class PollerStats(BaseModel):
+    """Counters describing the event poller's work."""
+
+    sources: int
+    subscribers: int
+    polls: int
+    failures: int
+    events: int
+    dropped: int
+
+
+class Subscription:
+    """
+    An async iterator over the events delivered to one subscriber.
+
+    Events are buffered per subscriber; when a slow subscriber's buffer is
+    full, its oldest events are dropped. Use it as an async context manager,
+    or call ``close`` when done, so the poller can stop polling once nobody
+    listens.
+    """
+
+    def __init__(
+        self,
+        poller: "EventPoller",
+        event_types: Tuple[Type[Event], ...],
+        max_queue: int,
+    ):
+        """
+        Initialize the subscription.
+
+        Args:
+            poller: The poller delivering the events
+            event_types: Only deliver events of these types, or all if empty
+            max_queue: Maximum number of buffered events
+        """
+        self._poller = poller
+        self.event_types = event_types
+        self._queue: asyncio.Queue = asyncio.Queue(max_queue)
+        self.dropped = 0
+        self.closed = False
+
+    def _put(self, event: Optional[Event]):
+        if (
+            event is not None
+            and self.event_types
+            and not isinstance(event, self.event_types)
+        ):
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._poller.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def close(self):
+        """Stop receiving events and end the iteration."""
+        if self.closed:
+            return
+        self.closed = True
+        self._put(None)
+        await self._poller._unsubscribe(self)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        if self.closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class EventPoller:
+    """
+    Polls watched resources and delivers the detected changes as events.
+
+    Each watched source is polled by one task on its own interval, however
+    many subscribers there are, and every event is fanned out to all of
+    them. Intervals adapt to how often each source changes, and all polls
+    share one request budget, according to the polling policy. Polling
+    starts with the first subscription and stops when the last one closes.
+    The first poll after starting only records a baseline.
+    """
+
+    def __init__(self, client: "WebCraftAPI", policy: Optional[PollingPolicy] = None):
+        """
+        Initialize the poller.
+
+        Args:
+            client: The WebCraftAPI client instance
+            policy: Interval adaptation and request budget settings
+        """
+        self.client = client
+        self.policy = policy or PollingPolicy()
+        self._budget: Optional[TokenBucket] = None
+        if self.policy.max_rps is not None:
+            self._budget = TokenBucket(self.policy.max_rps, self.policy.burst)
+        self.sources: Dict[str, EventSource] = {}
+        self._states: Dict[str, _SourceState] = {}
+        self._subscribers: List[Subscription] = []
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.polls = 0
+        self.failures = 0
+        self.events = 0
+        self.dropped = 0
+
+    def watch(self, source: EventSource) -> EventSource:
+        """
+        Start watching a source.
+
+        Args:
+            source: The source to poll
+
+        Returns:
+            EventSource: The watched source, which is the already watched one
+                when a source with the same key exists
+        """
+        existing = self.sources.get(source.key)
+        if existing is not None:
+            if source.interval < existing.interval:
+                existing.interval = source.interval
+                self._states[source.key].interval = source.interval
+            return existing
+        self.sources[source.key] = source
+        self._states[source.key] = _SourceState(source.interval)
+        if self._subscribers:
+            self._start(source)
+        return source
+
+    def watch_players(self, interval: float = 2.0) -> EventSource:
+        """
+        Watch players joining and leaving.
+
+        Args:
+            interval: Seconds between polls
+
+        Returns:
+            EventSource: The watched source
+        """
+        return self.watch(OnlinePlayersSource(interval))
+
+    def watch_player_health(
+        self, interval: float = 5.0, concurrency: int = 16
+    ) -> EventSource:
+        """
+        Watch the health of every online player.
+
+        Args:
+            interval: Seconds between polls
+            concurrency: Maximum number of player requests in flight
+
+        Returns:
+            EventSource: The watched source
+        """
+        return self.watch(PlayerHealthSource(interval, concurrency))
+
+    def watch_weather(self, world: str, interval: float = 10.0) -> EventSource:
+        """
+        Watch the weather of a world.
+
+        Args:
+            world: The world name
+            interval: Seconds between polls
+
+        Returns:
+            EventSource: The watched source
+        """
+        return self.watch(WeatherSource(world, interval))
+
+    def watch_entity(self, entity_id: str, interval: float = 2.0) -> EventSource:
+        """
+        Watch an entity's health, position and removal.
+
+        Args:
+            entity_id: The entity ID
+            interval: Seconds between polls
+
+        Returns:
+            EventSource: The watched source
+        """
+        return self.watch(EntitySource(entity_id, interval))
+
+    def unwatch(self, key: str) -> bool:
+        """
+        Stop watching a source.
+
+        Args:
+            key: The source key
+
+        Returns:
+            bool: Whether the source was watched
+        """
+        source = self.sources.pop(key, None)
+        self._states.pop(key, None)
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+        return source is not None
+
+    def subscribe(
+        self, *event_types: Type[Event], max_queue: int = 1000
+    ) -> Subscription:
+        """
+        Receive events from every watched source.
+
+        Args:
+            event_types: Only deliver events of these types, or all if none
+            max_queue: Maximum number of buffered events before the oldest
+                are dropped
+
+        Returns:
+            Subscription: An async iterator over the events
+        """
+        subscription = Subscription(self, event_types, max_queue)
+        self._subscribers.append(subscription)
+        for source in self.sources.values():
+            if source.key not in self._tasks:
+                self._start(source)
+        return subscription
+
+    async def _unsubscribe(self, subscription: Subscription):
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+        if not self._subscribers:
+            await self.stop()
+
+    async def stop(self):
+        """Stop polling and end every subscription."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for subscription in list(self._subscribers):
+            subscription.closed = True
+            subscription._put(None)
+        self._subscribers.clear()
+
+    @property
+    def stats(self) -> PollerStats:
+        """
+        Current poller statistics.
+
+        Returns:
+            PollerStats: Source, subscriber, poll, failure and event counters
+        """
+        return PollerStats(
+            sources=len(self.sources),
+            subscribers=len(self._subscribers),
+            polls=self.polls,
+            failures=self.failures,
+            events=self.events,
+            dropped=self.dropped,
+        )
+
+    @property
+    def schedule(self) -> List[ScheduleEntry]:
+        """
+        The current adaptive schedule, for tuning.
+
+        Returns:
+            List[ScheduleEntry]: One entry per watched source
+        """
+        now = time.monotonic()
+        entries = []
+        for key, source in self.sources.items():
+            state = self._states[key]
+            next_poll_in = None
+            if state.next_poll is not None and key in self._tasks:
+                next_poll_in = max(0.0, state.next_poll - now)
+            entries.append(
+                ScheduleEntry(
+                    key=key,
+                    base_interval=source.interval,
+                    interval=state.interval,
+                    next_poll_in=next_poll_in,
+                    cost=source.cost,
+                    polls=state.polls,
+                    changes=state.changes,
+                    change_ratio=state.change_ratio,
+                    throttled_seconds=state.throttled_seconds,
+                )
+            )
+        return entries
+
+    @property
+    def budget_stats(self) -> Optional[TokenBucketStats]:
+        """
+        Usage of the shared request budget.
+
+        Returns:
+            Optional[TokenBucketStats]: The budget's counters, or None when
+                the policy sets no ``max_rps``
+        """
+        return self._budget.stats if self._budget is not None else None
+
+    def _start(self, source: EventSource):
+        self._tasks[source.key] = asyncio.create_task(self._run(source))
+
+    def _publish(self, event: Event):
+        self.events += 1
+        for subscription in self._subscribers:
+            subscription._put(event)
+
+    async def _run(self, source: EventSource):
+        """Poll one source until cancelled."""
+        state = self._states[source.key]
+        previous: Any = None
+        has_baseline = False
+        while True:
+            charged = source.cost
+            if self._budget is not None:
+                state.throttled_seconds += await self._budget.acquire(charged)
+            started = time.monotonic()
+            changed = False
+            try:
+                current = await source.poll(self.client)
+            except Exception as e:
+                if not isinstance(e, REQUEST_ERRORS):
+                    # Most likely a bug in the source; keep polling, but
+                    # do not let it pass as a failed request
+                    logger.exception("Unexpected error polling %s", source.key)
+                self.failures += 1
+                self._publish(
+                    PollFailed(
+                        source=source.key,
+                        timestamp=time.time(),
+                        message=str(e),
+                        status_code=getattr(e, "status_code", None),
+                    )
+                )
+            else:
+                self.polls += 1
+                state.polls += 1
+                if has_baseline:
+                    events = source.diff(previous, current, time.time())
+                    changed = bool(events)
+                    for event in events:
+                        self._publish(event)
+                previous, has_baseline = current, True
+            if self._budget is not None:
+                # Settle the estimate against the requests actually made
+                if source.cost > charged:
+                    state.throttled_seconds += await self._budget.acquire(
+                        source.cost - charged
+                    )
+                elif source.cost < charged:
+                    self._budget.refund(charged - source.cost)
+            if changed:
+                state.changes += 1
+            state.change_ratio += 0.2 * (changed - state.change_ratio)
+            state.interval = self.policy.next_interval(
+                source.interval, state.interval, changed
+            )
+            state.next_poll = started + state.interval
+            await asyncio.sleep(max(0.0, state.next_poll - time.monotonic()))
@@ -1,17 +1,63 @@
-from typing import Optional
+from typing import Dict, Optional
+
+import aiohttp
 
 
 class APIException(Exception):
     """Exception raised for API errors."""
 
-    def __init__(self, message: str, status_code: Optional[int] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
         """
         Initialize the exception.
 
         Args:
             message: The error message
             status_code: The HTTP status code
+            retry_after: Delay in seconds requested by the server, if any
         """
         self.message = message
         self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(self.message)
+
+
+class DeadlineExceeded(APIException):
+    """Exception raised when an operation runs past its deadline."""
+
+    def __init__(self, message: str = "Operation deadline exceeded"):
+        """
+        Initialize the exception.
+
+        Args:
+            message: The error message
+        """
+        super().__init__(message)
+
+
+class BatchError(APIException):
+    """Exception raised when chunks of a batched operation keep failing."""
+
+    def __init__(self, failures: Dict[int, Exception], completed: int):
+        """
+        Initialize the exception.
+
+        Args:
+            failures: The last error of each failed chunk, by chunk index
+            completed: The number of chunks that succeeded
+        """
+        self.failures = failures
+        self.completed = completed
+        first = failures[min(failures)]
+        super().__init__(
+            f"{len(failures)} chunk(s) failed, {completed} succeeded: {first}",
+            getattr(first, "status_code", None),
+        )
+
+
+# Errors a request can end with, as opposed to bugs in the calling code
+REQUEST_ERRORS = (APIException, aiohttp.ClientError, TimeoutError)
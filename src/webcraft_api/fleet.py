@@ -0,0 +1,306 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import aiohttp
+
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.concurrency import imap_unordered
+from src.webcraft_api.exceptions import DeadlineExceeded
+from src.webcraft_api.models.bulk import FleetPlayerCount, FleetResult, RequestError
+from src.webcraft_api.models.requests import BanPlayerRequest
+from src.webcraft_api.pool import PoolConfig
+from src.webcraft_api.priority import PriorityConfig
+from src.webcraft_api.timeouts import deadline
+
+# Many hosts share the connector, so each one gets a slice of the total
+FLEET_POOL = PoolConfig(limit=256, limit_per_host=16)
+
+
+def _request_error(error: Exception) -> RequestError:
+    """Describe the failure of one server within a fleet call."""
+    return RequestError(
+        message=str(error) or type(error).__name__,
+        status_code=getattr(error, "status_code", None),
+    )
+
+
+def _field(value: Any, name: str) -> Any:
+    """Read a field from a model, slotted model or raw dict alike."""
+    return value[name] if isinstance(value, dict) else getattr(value, name)
+
+
+class Fleet:
+    """
+    Client for many WebCraftAPI servers at once.
+
+    Every server gets its own ``WebCraftAPI`` client, reachable through
+    ``fleet[name]``, but all of them share one connection pool. Calls made
+    through ``gather`` run on every server concurrently and report each
+    server's result or failure separately instead of failing as a whole.
+    """
+
+    def __init__(
+        self,
+        servers: Union[Mapping[str, str], Iterable[str]],
+        pool: Optional[PoolConfig] = None,
+        concurrency: int = 16,
+        timeout: Optional[float] = None,
+        **client_options: Any,
+    ):
+        """
+        Initialize the fleet.
+
+        Args:
+            servers: Base URLs keyed by server name, or just base URLs, which
+                then also serve as names
+            pool: Settings of the shared connection pool
+            concurrency: Maximum number of servers called at once
+            timeout: Default time budget in seconds for each server's part of
+                a fleet call
+            client_options: Further ``WebCraftAPI`` arguments applied to
+                every client, such as ``retry`` or ``decode_mode``; the
+                priority scheduler's total limit defaults to the pool's
+                per-host limit
+
+        Raises:
+            ValueError: If ``client_options`` includes a ``session``; the
+                fleet creates every client's session on the shared pool
+        """
+        if "session" in client_options:
+            raise ValueError(
+                "Fleet clients share the fleet's connection pool; "
+                "configure it with pool instead of passing a session"
+            )
+        if not isinstance(servers, Mapping):
+            servers = {url: url for url in servers}
+        self.pool = pool or FLEET_POOL
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        # Clients would size their scheduler from their own default pool,
+        # not the shared one; requests beyond their share of it would then
+        # queue first come first served inside aiohttp, and critical
+        # requests wait behind bulk ones
+        priorities = client_options.pop("priorities", None) or PriorityConfig()
+        if priorities.max_in_flight is None:
+            priorities = priorities.model_copy(
+                update={"max_in_flight": self.pool.limit_per_host}
+            )
+        self.clients: Dict[str, WebCraftAPI] = {
+            name: WebCraftAPI(
+                url, pool=self.pool, priorities=priorities, **client_options
+            )
+            for name, url in servers.items()
+        }
+
+    def __getitem__(self, name: str) -> WebCraftAPI:
+        return self.clients[name]
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    async def __aenter__(self):
+        """Context manager entry point."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit point."""
+        await self.close()
+
+    async def open(self):
+        """
+        Create the shared connection pool and a session per server.
+
+        A session a client opened on its own beforehand, with a pool of its
+        own, is closed and replaced.
+        """
+        if self._connector is not None and not self._connector.closed:
+            return
+        self._connector = self.pool.create_connector()
+        for client in self.clients.values():
+            if client._session is not None and not client._session.closed:
+                await client._session.close()
+            # A session per server keeps each server's Authorization header
+            client._session = aiohttp.ClientSession(
+                headers={"Content-Type": "application/json"},
+                connector=self._connector,
+                connector_owner=False,
+                trace_configs=[client._pool_tracker.trace_config()],
+            )
+            client._is_session_owner = True
+            if client.token:
+                client._update_auth_header()
+
+    async def close(self):
+        """Close every session and the shared connection pool."""
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    async def gather(
+        self,
+        fn: Callable[[WebCraftAPI], Awaitable[Any]],
+        servers: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> FleetResult:
+        """
+        Run a call on several servers concurrently.
+
+        Each server's part runs under its own deadline, so a slow server is
+        reported as failed without holding up the others for longer than
+        the timeout.
+
+        Args:
+            fn: Coroutine function called with each server's client, e.g.
+                ``lambda api: api.players.get_count()``
+            servers: Names of the servers to call, defaults to all
+            timeout: Time budget in seconds per server, defaults to the
+                fleet's timeout
+
+        Returns:
+            FleetResult: Each server's result or error
+
+        Raises:
+            Exception: Any error of ``fn`` other than a failed request,
+                which is a bug rather than a server failure
+        """
+        return await self._gather(lambda _, client: fn(client), servers, timeout)
+
+    async def _gather(
+        self,
+        fn: Callable[[str, WebCraftAPI], Awaitable[Any]],
+        servers: Optional[Iterable[str]],
+        timeout: Optional[float],
+    ) -> FleetResult:
+        """Like ``gather``, but also passes the server name to ``fn``."""
+        await self.open()
+        timeout = self.timeout if timeout is None else timeout
+
+        async def call(name: str) -> Any:
+            client = self.clients[name]
+            if timeout is None:
+                return await fn(name, client)
+            with deadline(timeout):
+                try:
+                    return await asyncio.wait_for(fn(name, client), timeout)
+                except asyncio.TimeoutError as e:
+                    raise DeadlineExceeded() from e
+
+        names = list(self.clients if servers is None else servers)
+        results: Dict[str, Any] = {}
+        errors: Dict[str, RequestError] = {}
+        async for _, name, result in imap_unordered(call, names, self.concurrency):
+            if isinstance(result, Exception):
+                errors[name] = _request_error(result)
+            else:
+                results[name] = result
+        # Report servers in the order they were given
+        return FleetResult(
+            results={name: results[name] for name in names if name in results},
+            errors={name: errors[name] for name in names if name in errors},
+        )
+
+    async def authenticate(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        credentials: Optional[Mapping[str, Tuple[str, str]]] = None,
+    ) -> FleetResult:
+        """
+        Authenticate with every server concurrently.
+
+        Args:
+            username: The username used on every server
+            password: The password used on every server
+            credentials: Per-server ``(username, password)`` pairs keyed by
+                server name, taking precedence over the shared ones
+
+        Returns:
+            FleetResult: The JWT token of each server, or its error
+
+        Raises:
+            ValueError: If some servers have no credentials; no server is
+                logged in then
+        """
+        credentials = dict(credentials or {})
+        for name in self.clients:
+            credentials.setdefault(name, (username, password))
+        missing = [
+            name
+            for name in self.clients
+            if credentials[name][0] is None or credentials[name][1] is None
+        ]
+        if missing:
+            raise ValueError(f"No credentials for servers {missing!r}")
+
+        async def login(name: str, client: WebCraftAPI) -> str:
+            return await client.authenticate(*credentials[name])
+
+        return await self._gather(login, None, None)
+
+    async def broadcast_all(
+        self, message: str, servers: Optional[Iterable[str]] = None
+    ) -> FleetResult:
+        """
+        Broadcast a message to all players on every server.
+
+        Args:
+            message: The message to broadcast
+            servers: Names of the servers to call, defaults to all
+
+        Returns:
+            FleetResult: Each server's success response or error
+        """
+        return await self.gather(
+            lambda client: client.chat.broadcast_all(message), servers
+        )
+
+    async def ban_player(
+        self, request: BanPlayerRequest, servers: Optional[Iterable[str]] = None
+    ) -> FleetResult:
+        """
+        Ban a player on every server.
+
+        Args:
+            request: The ban request
+            servers: Names of the servers to call, defaults to all
+
+        Returns:
+            FleetResult: Each server's success response or error
+        """
+        return await self.gather(
+            lambda client: client.banlist.ban_player(request), servers
+        )
+
+    async def get_player_count(
+        self, servers: Optional[Iterable[str]] = None
+    ) -> FleetPlayerCount:
+        """
+        Count the players of the whole fleet.
+
+        Args:
+            servers: Names of the servers to call, defaults to all
+
+        Returns:
+            FleetPlayerCount: Totals over the servers that answered, with
+                each server's count or error
+        """
+        result = await self.gather(lambda client: client.players.get_count(), servers)
+        counts = result.results.values()
+        return FleetPlayerCount(
+            online=sum(_field(count, "online") for count in counts),
+            offline=sum(_field(count, "offline") for count in counts),
+            servers=result,
+        )
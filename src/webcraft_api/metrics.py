@@ -0,0 +1,403 @@
+import asyncio
+import re
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+import aiohttp
+from pydantic import BaseModel
+
+from src.webcraft_api.middleware import Middleware, RequestContext
+
+# Endpoint templates of the services; requests are labelled with these so
+# player, world and entity names do not each get their own series
+ROUTES = (
+    "/api/admins",
+    "/api/admins/{player}",
+    "/api/api",
+    "/api/banlist/ips",
+    "/api/banlist/ips/ban",
+    "/api/banlist/ips/{ip}",
+    "/api/banlist/ips/{ip}/pardon",
+    "/api/banlist/players",
+    "/api/banlist/players/ban",
+    "/api/banlist/players/{player}",
+    "/api/banlist/players/{player}/pardon",
+    "/api/blocks",
+    "/api/chat/broadcast/all",
+    "/api/chat/broadcast/ops",
+    "/api/chat/broadcast/players",
+    "/api/entities/mobs/spawn",
+    "/api/entities/mobs/spawnable",
+    "/api/entities/{entity_id}",
+    "/api/entities/{entity_id}/customname",
+    "/api/entities/{entity_id}/heal",
+    "/api/entities/{entity_id}/health",
+    "/api/entities/{entity_id}/kill",
+    "/api/entities/{entity_id}/maxhealth",
+    "/api/items",
+    "/api/ping",
+    "/api/players",
+    "/api/players/offline",
+    "/api/players/online",
+    "/api/players/{player}",
+    "/api/players/{player}/feed",
+    "/api/players/{player}/foodlevel",
+    "/api/players/{player}/give",
+    "/api/players/{player}/heal",
+    "/api/players/{player}/health",
+    "/api/players/{player}/inventory/clear",
+    "/api/players/{player}/inventory/get",
+    "/api/players/{player}/inventory/slots/{slot}",
+    "/api/players/{player}/kick",
+    "/api/players/{player}/kill",
+    "/api/players/{player}/location",
+    "/api/players/{player}/maxhealth",
+    "/api/players/{player}/spawnpoint",
+    "/api/players/{player}/starve",
+    "/api/players/{player}/teleport",
+    "/api/plugins",
+    "/api/plugins/{plugin}",
+    "/api/server",
+    "/api/whitelist",
+    "/api/whitelist/players",
+    "/api/whitelist/players/add",
+    "/api/whitelist/players/remove",
+    "/api/whitelist/players/{player}",
+    "/api/worlds",
+    "/api/worlds/{world}",
+    "/api/worlds/{world}/blocks",
+    "/api/worlds/{world}/blocks/block",
+    "/api/worlds/{world}/difficulty",
+    "/api/worlds/{world}/items/drop",
+    "/api/worlds/{world}/save",
+    "/api/worlds/{world}/seed",
+    "/api/worlds/{world}/spawnpoint",
+    "/api/worlds/{world}/time",
+    "/api/worlds/{world}/weather",
+)
+
+# Prometheus' default buckets, extended for slow bulk requests
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_PLACEHOLDER = re.compile(r"\{[^/}]+\}")
+
+
+def _compile_routes(routes: Sequence[str]) -> List[Tuple[Pattern[str], str]]:
+    # Literal segments win over placeholders, e.g. /players/online
+    ordered = sorted(routes, key=lambda route: len(_PLACEHOLDER.findall(route)))
+    return [
+        (
+            re.compile(
+                "".join(
+                    "[^/]+" if _PLACEHOLDER.fullmatch(part) else re.escape(part)
+                    for part in re.split(r"(\{[^/}]+\})", route)
+                )
+                + "$"
+            ),
+            route,
+        )
+        for route in ordered
+    ]
+
+
+_COMPILED_ROUTES = _compile_routes(ROUTES)
+
+
+@lru_cache(maxsize=4096)
+def route_of(endpoint: str) -> str:
+    """
+    Find the endpoint template of a request.
+
+    Args:
+        endpoint: The API endpoint, e.g. ``/api/players/Steve/health``
+
+    Returns:
+        str: The template, e.g. ``/api/players/{player}/health``, or
+            ``other`` for endpoints the services do not use
+    """
+    for pattern, route in _COMPILED_ROUTES:
+        if pattern.match(endpoint):
+            return route
+    return "other"
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Quantiles are interpolated within the bucket they fall in, the way
+    Prometheus' ``histogram_quantile`` does, so they are exact to the bucket
+    resolution and cost nothing per observation beyond a bisection.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Ascending upper bounds in seconds, without +Inf
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """
+        Record one duration.
+
+        Args:
+            seconds: The duration
+        """
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: The quantile, between 0 and 1
+
+        Returns:
+            float: The estimated duration in seconds, 0 when empty
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                # The +Inf bucket is capped by the largest observation
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.max)
+            seen += count
+        return self.max
+
+
+class LatencySummary(BaseModel):
+    """Latency of one endpoint, in seconds."""
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class EndpointMetrics(BaseModel):
+    """Counters of one method and endpoint template."""
+
+    method: str
+    route: str
+    requests: int
+    errors: int
+    error_rate: float
+    statuses: Dict[str, int]
+    bytes_sent: int
+    bytes_received: int
+    latency: LatencySummary
+
+
+class _EndpointState:
+    __slots__ = ("bytes_received", "bytes_sent", "errors", "histogram", "statuses")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.histogram = LatencyHistogram(buckets)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class MetricsMiddleware(Middleware):
+    """
+    Middleware recording per-endpoint request metrics.
+
+    Every attempt is counted, so a retried call shows up once per try.
+    Requests are grouped by method and endpoint template (see
+    :func:`route_of`). Latency runs from this middleware's ``before_send``
+    to the response being read, so it includes time queued in the priority
+    scheduler and in the connection pool; register it after a rate limiter
+    to leave out rate limiting waits. A status of 400 or above, a timeout or
+    a connection error counts as an error. Streamed request bodies are not
+    counted in ``bytes_sent``, and GETs answered from the response cache or
+    by a coalesced request are not requests of their own.
+
+    Nothing is recorded unless the middleware is added to a client. One
+    instance may be shared between clients, e.g. across a fleet, to
+    aggregate their requests.
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "webcraft"
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            buckets: Latency histogram upper bounds in seconds
+            namespace: Prefix of the exported metric names
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._endpoints: Dict[Tuple[str, str], _EndpointState] = {}
+
+    async def before_send(self, ctx: RequestContext):
+        ctx.extras["metrics_started"] = (ctx.attempt, time.perf_counter())
+
+    async def after_receive(
+        self, ctx: RequestContext, response: aiohttp.ClientResponse
+    ):
+        self._record(ctx, str(response.status), response.status >= 400)
+        ctx.extras["metrics_recorded"] = ctx.attempt
+
+    async def on_error(self, ctx: RequestContext, error: BaseException):
+        if ctx.extras.get("metrics_recorded") == ctx.attempt:
+            # Already counted with its status code
+            return
+        if isinstance(error, asyncio.CancelledError):
+            status = "cancelled"
+        elif isinstance(error, asyncio.TimeoutError):
+            status = "timeout"
+        else:
+            status = "error"
+        self._record(ctx, status, status != "cancelled")
+
+    def _record(self, ctx: RequestContext, status: str, failed: bool):
+        attempt, started = ctx.extras.get("metrics_started", (None, 0.0))
+        if attempt != ctx.attempt:
+            # Failed in an earlier middleware's before_send
+            return
+        key = (ctx.method, route_of(ctx.endpoint))
+        state = self._endpoints.get(key)
+        if state is None:
+            state = self._endpoints[key] = _EndpointState(self.buckets)
+        state.statuses[status] = state.statuses.get(status, 0) + 1
+        if failed:
+            state.errors += 1
+        if isinstance(ctx.content, bytes):
+            state.bytes_sent += len(ctx.content)
+        if ctx.body is not None:
+            state.bytes_received += len(ctx.body)
+        state.histogram.observe(time.perf_counter() - started)
+
+    def reset(self):
+        """Discard everything recorded so far."""
+        self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, EndpointMetrics]:
+        """
+        Current metrics of every endpoint called so far.
+
+        Returns:
+            Dict[str, EndpointMetrics]: Metrics keyed by ``"<method> <route>"``
+        """
+        snapshot = {}
+        for (method, route), state in sorted(self._endpoints.items()):
+            histogram = state.histogram
+            snapshot[f"{method} {route}"] = EndpointMetrics(
+                method=method,
+                route=route,
+                requests=histogram.count,
+                errors=state.errors,
+                error_rate=state.errors / histogram.count if histogram.count else 0.0,
+                statuses=dict(state.statuses),
+                bytes_sent=state.bytes_sent,
+                bytes_received=state.bytes_received,
+                latency=LatencySummary(
+                    count=histogram.count,
+                    mean=histogram.sum / histogram.count if histogram.count else 0.0,
+                    p50=histogram.quantile(0.5),
+                    p95=histogram.quantile(0.95),
+                    p99=histogram.quantile(0.99),
+                    max=histogram.max,
+                ),
+            )
+        return snapshot
+
+    def prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            labels: Constant labels added to every sample, e.g. the server
+
+        Returns:
+            str: The exposition text, ending with a newline
+        """
+        prefix = self.namespace
+        constant = "".join(
+            f'{name}="{_escape(value)}",' for name, value in (labels or {}).items()
+        )
+        requests = [
+            f"# HELP {prefix}_requests_total Request attempts by status.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        errors = [
+            f"# HELP {prefix}_request_errors_total Failed request attempts.",
+            f"# TYPE {prefix}_request_errors_total counter",
+        ]
+        sent = [
+            f"# HELP {prefix}_request_bytes_total Request body bytes sent.",
+            f"# TYPE {prefix}_request_bytes_total counter",
+        ]
+        received = [
+            f"# HELP {prefix}_response_bytes_total Response body bytes received.",
+            f"# TYPE {prefix}_response_bytes_total counter",
+        ]
+        duration = [
+            f"# HELP {prefix}_request_duration_seconds Request attempt latency.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for (method, route), state in sorted(self._endpoints.items()):
+            base = f'{constant}method="{method}",route="{_escape(route)}"'
+            for status, count in sorted(state.statuses.items()):
+                requests.append(
+                    f'{prefix}_requests_total{{{base},status="{status}"}} {count}'
+                )
+            errors.append(f"{prefix}_request_errors_total{{{base}}} {state.errors}")
+            sent.append(f"{prefix}_request_bytes_total{{{base}}} {state.bytes_sent}")
+            received.append(
+                f"{prefix}_response_bytes_total{{{base}}} {state.bytes_received}"
+            )
+            histogram = state.histogram
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                cumulative += count
+                duration.append(
+                    f"{prefix}_request_duration_seconds_bucket"
+                    f'{{{base},le="{bound}"}} {cumulative}'
+                )
+            duration.append(
+                f"{prefix}_request_duration_seconds_sum{{{base}}} {histogram.sum}"
+            )
+            duration.append(
+                f"{prefix}_request_duration_seconds_count{{{base}}} {histogram.count}"
+            )
+        return "\n".join(requests + errors + sent + received + duration) + "\n"
@@ -0,0 +1,90 @@
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from src.webcraft_api.priority import Priority
+from src.webcraft_api.timeouts import TimeoutConfig
+
+
+class RequestContext:
+    """State of a single API call as it travels through the request pipeline."""
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Any = None,
+        idempotent: Optional[bool] = None,
+        timeout: Optional[TimeoutConfig] = None,
+        priority: Priority = Priority.NORMAL,
+    ):
+        """
+        Initialize the request context.
+
+        Args:
+            method: The HTTP method
+            endpoint: The API endpoint, relative to the base URL
+            url: The absolute request URL
+            params: Query parameters
+            data: JSON request body: a request model, a dict or a stream
+            idempotent: Whether the request may be retried
+            timeout: Timeouts applied to each attempt
+            priority: Scheduling class of the request
+        """
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.params = params
+        self.data = data
+        self.idempotent = idempotent
+        self.timeout = timeout or TimeoutConfig()
+        self.priority = priority
+        self.headers: Dict[str, str] = {}
+        # Encoded request body of the current attempt: bytes or a stream
+        self.content: Any = None
+        self.attempt = 0
+        self.status: Optional[int] = None
+        self.body: Optional[bytes] = None
+        self.extras: Dict[str, Any] = {}
+
+
+class Middleware:
+    """
+    Base class for request pipeline middleware.
+
+    Every hook is a no-op by default, so subclasses only override what they
+    need. Hooks run once per attempt, in registration order, which lets
+    cross-cutting features (timing, rate limiting, compression) be written
+    once for every service method.
+    """
+
+    async def before_send(self, ctx: RequestContext):
+        """
+        Called before each attempt is sent.
+
+        Args:
+            ctx: The request context, whose headers and encoded body
+                (``content``) may be modified
+        """
+
+    async def after_receive(
+        self, ctx: RequestContext, response: aiohttp.ClientResponse
+    ):
+        """
+        Called once the response body has been read, before status checking.
+
+        Args:
+            ctx: The request context, with status and body filled in
+            response: The HTTP response
+        """
+
+    async def on_error(self, ctx: RequestContext, error: BaseException):
+        """
+        Called when an attempt fails, including API errors.
+
+        Args:
+            ctx: The request context
+            error: The exception raised by the attempt
+        """
@@ -0,0 +1,234 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .common import Position
+from .responses import BlockDto
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "BlockArray requires numpy, install it with `pip install numpy`"
+        )
+
+
+def _index_dtype(palette_size: int) -> "np.dtype":
+    # uint16 halves the index memory, but block states with properties can
+    # outgrow it
+    return np.dtype(np.uint16 if palette_size <= 1 << 16 else np.uint32)
+
+
+class BlockArray:
+    """
+    Compact, column-oriented storage for many blocks.
+
+    Coordinates are kept in three int32 arrays and block names as indices
+    into a palette (uint16, widened to uint32 past 65536 names), so a 64^3 scan costs a few megabytes and no
+    per-block Python objects. ``BlockDto`` instances are only built on
+    demand.
+    """
+
+    def __init__(
+        self,
+        xs: "np.ndarray",
+        ys: "np.ndarray",
+        zs: "np.ndarray",
+        palette: List[str],
+        indices: "np.ndarray",
+    ):
+        """
+        Initialize the array.
+
+        Args:
+            xs: X coordinates (int32)
+            ys: Y coordinates (int32)
+            zs: Z coordinates (int32)
+            palette: The distinct block names
+            indices: Palette index of each block (uint16 or uint32)
+        """
+        _require_numpy()
+        self.xs = xs
+        self.ys = ys
+        self.zs = zs
+        self.palette = palette
+        self.indices = indices
+
+    @classmethod
+    def from_raw(cls, blocks: Iterable[Dict[str, Any]]) -> "BlockArray":
+        """
+        Build an array straight from decoded ``BlocksDto`` JSON entries.
+
+        Args:
+            blocks: Dicts with a ``name`` and a ``position`` holding x, y, z
+
+        Returns:
+            BlockArray: The compact representation
+        """
+        _require_numpy()
+        palette: List[str] = []
+        lookup: Dict[str, int] = {}
+        xs: List[float] = []
+        ys: List[float] = []
+        zs: List[float] = []
+        indices: List[int] = []
+        for block in blocks:
+            name = block["name"]
+            index = lookup.get(name)
+            if index is None:
+                index = lookup[name] = len(palette)
+                palette.append(name)
+            position = block["position"]
+            xs.append(position["x"])
+            ys.append(position["y"])
+            zs.append(position["z"])
+            indices.append(index)
+        return cls(
+            np.asarray(xs, dtype=np.float64).astype(np.int32),
+            np.asarray(ys, dtype=np.float64).astype(np.int32),
+            np.asarray(zs, dtype=np.float64).astype(np.int32),
+            palette,
+            np.asarray(indices, dtype=_index_dtype(len(palette))),
+        )
+
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[BlockDto]) -> "BlockArray":
+        """
+        Build an array from ``BlockDto`` instances.
+
+        Args:
+            blocks: The blocks to store
+
+        Returns:
+            BlockArray: The compact representation
+        """
+        return cls.from_raw(
+            {"name": block.name, "position": block.position.model_dump()}
+            for block in blocks
+        )
+
+    @classmethod
+    def concatenate(cls, arrays: Sequence["BlockArray"]) -> "BlockArray":
+        """
+        Join several arrays, merging their palettes.
+
+        Args:
+            arrays: The arrays to join, in order
+
+        Returns:
+            BlockArray: A single array holding every block
+        """
+        _require_numpy()
+        palette: List[str] = []
+        lookup: Dict[str, int] = {}
+        remapped = []
+        for array in arrays:
+            for name in array.palette:
+                if name not in lookup:
+                    lookup[name] = len(palette)
+                    palette.append(name)
+        dtype = _index_dtype(len(palette))
+        for array in arrays:
+            mapping = np.asarray([lookup[name] for name in array.palette], dtype=dtype)
+            remapped.append(mapping[array.indices])
+        if not arrays:
+            empty = np.empty(0, dtype=np.int32)
+            return cls(empty, empty, empty, [], np.empty(0, dtype=np.uint16))
+        return cls(
+            np.concatenate([array.xs for array in arrays]),
+            np.concatenate([array.ys for array in arrays]),
+            np.concatenate([array.zs for array in arrays]),
+            palette,
+            np.concatenate(remapped).astype(dtype, copy=False),
+        )
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, index: int) -> BlockDto:
+        return BlockDto(
+            name=self.palette[self.indices[index]],
+            position=Position(
+                x=int(self.xs[index]), y=int(self.ys[index]), z=int(self.zs[index])
+            ),
+        )
+
+    @property
+    def names(self) -> "np.ndarray":
+        """
+        Block name of every entry.
+
+        Returns:
+            np.ndarray: An object array of names
+        """
+        return np.asarray(self.palette, dtype=object)[self.indices]
+
+    def mask(self, *names: str) -> "np.ndarray":
+        """
+        Select the blocks with any of the given names.
+
+        Args:
+            names: The block names to match
+
+        Returns:
+            np.ndarray: A boolean mask over the entries
+        """
+        wanted = [index for index, name in enumerate(self.palette) if name in names]
+        return np.isin(self.indices, np.asarray(wanted, dtype=self.indices.dtype))
+
+    def filter(self, mask: "np.ndarray") -> "BlockArray":
+        """
+        Keep only the entries selected by a boolean mask.
+
+        Args:
+            mask: A boolean mask, e.g. from ``mask`` or a coordinate test
+
+        Returns:
+            BlockArray: The selected blocks, sharing the palette
+        """
+        return BlockArray(
+            self.xs[mask],
+            self.ys[mask],
+            self.zs[mask],
+            self.palette,
+            self.indices[mask],
+        )
+
+    def lookup(self, x: int, y: int, z: int) -> Optional[str]:
+        """
+        Find the block name at a position.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+
+        Returns:
+            Optional[str]: The block name, or None if the position is absent
+        """
+        found = np.flatnonzero((self.xs == x) & (self.ys == y) & (self.zs == z))
+        if len(found) == 0:
+            return None
+        return self.palette[self.indices[found[0]]]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count the blocks of each name.
+
+        Returns:
+            Dict[str, int]: Number of entries per block name
+        """
+        totals = np.bincount(self.indices, minlength=len(self.palette))
+        return {name: int(total) for name, total in zip(self.palette, totals) if total}
+
+    def to_blocks(self) -> List[BlockDto]:
+        """
+        Convert every entry back to a ``BlockDto``.
+
+        Returns:
+            List[BlockDto]: The blocks, in order
+        """
+        return [self[index] for index in range(len(self))]
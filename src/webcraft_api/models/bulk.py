@@ -0,0 +1,108 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from .responses import PlayerDto
+
+
+class RequestError(BaseModel):
+    """A failure of one item within a bulk operation."""
+
+    message: str
+    status_code: Optional[int] = None
+
+
+class PlayerInfoResult(BaseModel):
+    """Outcome of fetching one player's information in a bulk snapshot."""
+
+    player: str
+    info: Optional[PlayerDto] = None
+    error: Optional[RequestError] = None
+
+
+class PlayerSnapshot(BaseModel):
+    """
+    Information about many players, stored column by column.
+
+    Each entry of ``columns`` maps a ``PlayerDto`` field to a list with one
+    value per successfully fetched player, in the order of ``players``.
+    Players that could not be fetched are listed in ``errors`` instead.
+    """
+
+    players: List[str]
+    columns: Dict[str, List[Any]]
+    errors: Dict[str, RequestError]
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def get(self, player: str) -> Optional[PlayerDto]:
+        """
+        Rebuild the ``PlayerDto`` of a single player.
+
+        Args:
+            player: The player name as requested
+
+        Returns:
+            Optional[PlayerDto]: The player information, or None if absent
+        """
+        try:
+            index = self.players.index(player)
+        except ValueError:
+            return None
+        return PlayerDto.model_construct(
+            **{field: values[index] for field, values in self.columns.items()}
+        )
+
+    def to_dtos(self) -> List[PlayerDto]:
+        """
+        Rebuild every row as a ``PlayerDto``.
+
+        Returns:
+            List[PlayerDto]: One entry per successfully fetched player
+        """
+        fields = list(self.columns)
+        return [
+            PlayerDto.model_construct(**dict(zip(fields, row)))
+            for row in zip(*self.columns.values())
+        ]
+
+
+class FillResult(BaseModel):
+    """Outcome of a region fill or replace operation."""
+
+    scanned: int
+    changed: int
+
+
+class FleetResult(BaseModel):
+    """
+    Outcome of one call made on several servers.
+
+    Servers that answered are listed in ``results``, the others in
+    ``errors``, both keyed by server name.
+    """
+
+    results: Dict[str, Any]
+    errors: Dict[str, RequestError]
+
+    def __len__(self) -> int:
+        return len(self.results) + len(self.errors)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every server answered.
+
+        Returns:
+            bool: True if there are no errors
+        """
+        return not self.errors
+
+
+class FleetPlayerCount(BaseModel):
+    """Player counts summed over the servers that answered."""
+
+    online: int
+    offline: int
+    servers: FleetResult
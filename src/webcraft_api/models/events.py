@@ -0,0 +1,69 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Event(BaseModel):
+    """A change detected by the event poller."""
+
+    source: str
+    timestamp: float
+
+
+class PlayerJoined(Event):
+    """A player came online."""
+
+    player: str
+
+
+class PlayerLeft(Event):
+    """A player went offline."""
+
+    player: str
+
+
+class HealthChanged(Event):
+    """An online player's health changed."""
+
+    player: str
+    old: float
+    new: float
+
+
+class WeatherChanged(Event):
+    """The weather of a world changed."""
+
+    world: str
+    old: str
+    new: str
+
+
+class EntityHealthChanged(Event):
+    """A watched entity's health changed."""
+
+    entity_id: str
+    old: float
+    new: float
+
+
+class EntityMoved(Event):
+    """A watched entity changed position or world."""
+
+    entity_id: str
+    world: str
+    x: float
+    y: float
+    z: float
+
+
+class EntityRemoved(Event):
+    """A watched entity died or no longer exists."""
+
+    entity_id: str
+
+
+class PollFailed(Event):
+    """A poll of a source failed; the source keeps being polled."""
+
+    message: str
+    status_code: Optional[int] = None
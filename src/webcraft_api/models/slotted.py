@@ -0,0 +1,75 @@
+import dataclasses
+from functools import lru_cache
+from typing import Any, Type
+
+from pydantic import BaseModel
+
+from .common import Position
+from .responses import BlockDto, EntityDto, PlayerDto, SlotDto
+
+
+@lru_cache(maxsize=None)
+def slotted(model: Type[BaseModel]) -> type:
+    """
+    Build the lightweight counterpart of a pydantic model.
+
+    The counterpart is a frozen dataclass with ``__slots__`` and the same
+    field names and defaults, so it is read the same way as the model while
+    taking a fraction of the memory. It is generated from the model's
+    fields, so both stay in sync. Nested models keep their pydantic type in
+    the annotations but are filled with their own slotted counterparts when
+    decoded through ``DecodeMode.SLOTS``.
+
+    Args:
+        model: The pydantic model class
+
+    Returns:
+        type: The slotted dataclass, one per model
+    """
+    fields = []
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            fields.append((name, field.annotation))
+        else:
+            fields.append(
+                (name, field.annotation, dataclasses.field(default=field.default))
+            )
+    cls = dataclasses.make_dataclass(
+        model.__name__,
+        fields,
+        frozen=True,
+        slots=True,
+        kw_only=True,
+        namespace={"model": model, "to_model": _to_model},
+    )
+    cls.__module__ = __name__
+    cls.__doc__ = model.__doc__
+    return cls
+
+
+def _to_model(self) -> BaseModel:
+    """
+    Convert back to the pydantic model, validating the values.
+
+    Returns:
+        BaseModel: The equivalent pydantic model instance
+    """
+    return self.model.model_validate(_as_dict(self))
+
+
+def _as_dict(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: _as_dict(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, list):
+        return [_as_dict(item) for item in value]
+    return value
+
+
+SlottedPosition = slotted(Position)
+SlottedBlock = slotted(BlockDto)
+SlottedEntity = slotted(EntityDto)
+SlottedPlayer = slotted(PlayerDto)
+SlottedSlot = slotted(SlotDto)
@@ -0,0 +1,135 @@
+import time
+from types import SimpleNamespace
+from typing import Optional
+
+import aiohttp
+from pydantic import BaseModel
+
+
+class PoolConfig(BaseModel):
+    """
+    Connection pool settings used when the client creates its own session.
+
+    The defaults are sized for a single WebCraftAPI server: every connection
+    targets the same host, so the per-host limit matches the total limit.
+    aiohttp always enables TCP_NODELAY on its connections, so small JSON
+    requests are never held back by Nagle's algorithm.
+    """
+
+    limit: int = 64
+    limit_per_host: int = 64
+    keepalive_timeout: float = 30.0
+    use_dns_cache: bool = True
+    ttl_dns_cache: Optional[int] = 300
+    warmup_connections: int = 0
+    warmup_endpoint: str = "/api/ping"
+
+    def create_connector(self) -> aiohttp.TCPConnector:
+        """
+        Build a TCP connector from this configuration.
+
+        Returns:
+            aiohttp.TCPConnector: The configured connector
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.use_dns_cache,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+
+
+class PoolStats(BaseModel):
+    """Point-in-time statistics about the client's connection pool."""
+
+    limit: int
+    limit_per_host: int
+    in_use: int
+    idle: int
+    created: int
+    reused: int
+    waits: int
+    wait_time: float
+
+
+class PoolTracker:
+    """Collects connection pool events through aiohttp request tracing."""
+
+    def __init__(self):
+        """Initialize the tracker with zeroed counters."""
+        self.created = 0
+        self.reused = 0
+        self.waits = 0
+        self.wait_time = 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build a trace config that feeds this tracker.
+
+        Returns:
+            aiohttp.TraceConfig: Trace config to pass to the client session
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        trace_config.on_connection_create_end.append(self._on_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_reuseconn)
+        return trace_config
+
+    def snapshot(self, connector: Optional[aiohttp.BaseConnector]) -> PoolStats:
+        """
+        Combine the tracked counters with the connector's current state.
+
+        Args:
+            connector: The connector backing the session, if any
+
+        Returns:
+            PoolStats: The current pool statistics
+        """
+        in_use = 0
+        idle = 0
+        limit = 0
+        limit_per_host = 0
+        if connector is not None:
+            limit = connector.limit
+            limit_per_host = connector.limit_per_host
+            # aiohttp does not expose pool occupancy publicly
+            in_use = len(getattr(connector, "_acquired", ()))
+            idle = sum(
+                len(conns) for conns in getattr(connector, "_conns", {}).values()
+            )
+
+        return PoolStats(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            in_use=in_use,
+            idle=idle,
+            created=self.created,
+            reused=self.reused,
+            waits=self.waits,
+            wait_time=self.wait_time,
+        )
+
+    async def _on_queued_start(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params
+    ):
+        self.waits += 1
+        ctx.pool_queued_at = time.perf_counter()
+
+    async def _on_queued_end(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params
+    ):
+        queued_at = getattr(ctx, "pool_queued_at", None)
+        if queued_at is not None:
+            self.wait_time += time.perf_counter() - queued_at
+
+    async def _on_create_end(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params
+    ):
+        self.created += 1
+
+    async def _on_reuseconn(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params
+    ):
+        self.reused += 1
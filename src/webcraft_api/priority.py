@@ -0,0 +1,223 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class Priority(IntEnum):
+    """Scheduling class of a request, most urgent first."""
+
+    # Moderation such as kicks and bans
+    CRITICAL = 0
+    NORMAL = 1
+    # Large jobs such as block edits and roster scans
+    BULK = 2
+
+
+_priority: ContextVar[Optional[Priority]] = ContextVar(
+    "webcraft_priority", default=None
+)
+
+
+@contextmanager
+def priority(level: Priority) -> Iterator[Priority]:
+    """
+    Run every request made in the block at the given priority.
+
+    This overrides the priority service methods pick by default, including
+    for requests they make concurrently on the caller's behalf.
+
+    Args:
+        level: The priority to use
+
+    Yields:
+        Priority: The priority in effect
+    """
+    token = _priority.set(Priority(level))
+    try:
+        yield Priority(level)
+    finally:
+        _priority.reset(token)
+
+
+def resolve_priority(default: Optional[Priority] = None) -> Priority:
+    """
+    Pick the priority of a request.
+
+    Args:
+        default: The priority chosen by the service method, if any
+
+    Returns:
+        Priority: The caller's priority if set, else ``default``, else normal
+    """
+    level = _priority.get()
+    if level is not None:
+        return level
+    return Priority.NORMAL if default is None else Priority(default)
+
+
+class PriorityConfig(BaseModel):
+    """
+    Settings of the priority request scheduler.
+
+    ``max_in_flight`` bounds all requests together and defaults to the
+    connection pool limit, so requests queue by priority in the client
+    rather than first come first served in the pool. The per-class limits
+    additionally bound each class; None leaves a class bounded only by the
+    total. A request waiting longer than ``max_wait`` seconds is served
+    before any younger one, whatever its class, so bulk jobs cannot starve.
+    """
+
+    max_in_flight: Optional[int] = None
+    critical: Optional[int] = None
+    normal: Optional[int] = None
+    bulk: Optional[int] = None
+    max_wait: float = 5.0
+
+    def limit(self, level: Priority) -> Optional[int]:
+        """
+        Concurrency limit of one class.
+
+        Args:
+            level: The priority class
+
+        Returns:
+            Optional[int]: The limit, or None if only the total applies
+        """
+        return getattr(self, level.name.lower())
+
+
+class PriorityClassStats(BaseModel):
+    """Counters of one priority class."""
+
+    running: int
+    queued: int
+    completed: int
+    promoted: int
+    wait_seconds: float
+    max_wait: float
+
+
+class PriorityScheduler:
+    """
+    Grants request slots by priority.
+
+    When a slot frees up, the oldest request that has waited longer than
+    ``max_wait`` goes first; otherwise the most urgent class with room under
+    its own limit does, first come first served within the class.
+    """
+
+    def __init__(self, config: PriorityConfig, default_limit: Optional[int] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            config: Limits and starvation protection settings
+            default_limit: Total limit used when the config sets none;
+                None or 0 means unbounded
+        """
+        self.config = config
+        self.max_in_flight = config.max_in_flight or default_limit or None
+        self._queues: Dict[Priority, Deque[Tuple[float, asyncio.Future]]] = {
+            level: deque() for level in Priority
+        }
+        self._running: Dict[Priority, int] = dict.fromkeys(Priority, 0)
+        self._completed: Dict[Priority, int] = dict.fromkeys(Priority, 0)
+        self._promoted: Dict[Priority, int] = dict.fromkeys(Priority, 0)
+        self._wait_seconds: Dict[Priority, float] = dict.fromkeys(Priority, 0.0)
+        self._max_wait: Dict[Priority, float] = dict.fromkeys(Priority, 0.0)
+
+    @asynccontextmanager
+    async def slot(self, level: Priority) -> AsyncIterator[float]:
+        """
+        Hold a request slot for the duration of the block.
+
+        Args:
+            level: The request's priority
+
+        Yields:
+            float: The seconds spent waiting for the slot
+        """
+        waited = await self._acquire(level)
+        try:
+            yield waited
+        finally:
+            self._running[level] -= 1
+            self._completed[level] += 1
+            self._dispatch()
+
+    async def _acquire(self, level: Priority) -> float:
+        enqueued = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self._queues[level].append((enqueued, future))
+        self._dispatch()
+        if not future.done():
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    self._queues[level].remove((enqueued, future))
+                else:
+                    # Granted just before the cancellation arrived
+                    self._running[level] -= 1
+                    self._dispatch()
+                raise
+        waited = time.monotonic() - enqueued
+        self._wait_seconds[level] += waited
+        self._max_wait[level] = max(self._max_wait[level], waited)
+        return waited
+
+    def _has_room(self, level: Priority) -> bool:
+        limit = self.config.limit(level)
+        return limit is None or self._running[level] < limit
+
+    def _next(self) -> Optional[Priority]:
+        """Pick the class whose oldest waiter goes next."""
+        ready = [
+            level for level in Priority if self._queues[level] and self._has_room(level)
+        ]
+        if not ready:
+            return None
+        oldest = min(ready, key=lambda level: self._queues[level][0][0])
+        if time.monotonic() - self._queues[oldest][0][0] >= self.config.max_wait:
+            if oldest != ready[0]:
+                self._promoted[oldest] += 1
+            return oldest
+        return ready[0]
+
+    def _dispatch(self):
+        while (
+            self.max_in_flight is None
+            or sum(self._running.values()) < self.max_in_flight
+        ):
+            level = self._next()
+            if level is None:
+                return
+            _, future = self._queues[level].popleft()
+            self._running[level] += 1
+            future.set_result(None)
+
+    @property
+    def stats(self) -> Dict[str, PriorityClassStats]:
+        """
+        Current per-class statistics.
+
+        Returns:
+            Dict[str, PriorityClassStats]: Counters keyed by class name
+        """
+        return {
+            level.name.lower(): PriorityClassStats(
+                running=self._running[level],
+                queued=len(self._queues[level]),
+                completed=self._completed[level],
+                promoted=self._promoted[level],
+                wait_seconds=self._wait_seconds[level],
+                max_wait=self._max_wait[level],
+            )
+            for level in Priority
+        }
@@ -0,0 +1,256 @@
+import asyncio
+import heapq
+import time
+from collections import deque
+from itertools import count
+from typing import Deque, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from src.webcraft_api.middleware import Middleware, RequestContext
+from src.webcraft_api.priority import Priority
+
+
+class TokenBucketStats(BaseModel):
+    """Counters describing a token bucket's usage."""
+
+    rate: float
+    burst: float
+    available: float
+    acquired: float
+    waits: int
+    wait_seconds: float
+    max_wait: float
+    recent_rate: float
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. A
+    request is granted once ``burst`` or its cost in tokens, whichever is
+    smaller, is available, going into debt for the rest, so a request
+    costing more than ``burst`` still goes through. Waiting requests are
+    granted by priority, in arrival order within a priority, so a critical
+    request never queues behind bulk work waiting for the same bucket.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, window: float = 10.0):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens stored
+            window: Seconds over which ``recent_rate`` is measured
+        """
+        self.rate = rate
+        self.burst = burst
+        self.window = window
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._history: Deque[Tuple[float, float]] = deque()
+        # Waiting requests as [priority, arrival, tokens, future]
+        self._waiters: List[list] = []
+        self._arrivals = count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self.acquired = 0.0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self, now: float, tokens: float):
+        self._tokens -= tokens
+        self.acquired += tokens
+        self._history.append((now, tokens))
+
+    def _grant(self):
+        """Grant waiting requests that fit, then sleep until the next one."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            needed = min(tokens, self.burst)
+            if self._tokens < needed:
+                self._wakeup = asyncio.get_running_loop().call_later(
+                    (needed - self._tokens) / self.rate, self._grant
+                )
+                return
+            heapq.heappop(self._waiters)
+            self._take(now, tokens)
+            future.set_result(None)
+
+    async def acquire(
+        self, tokens: float = 1.0, priority: Priority = Priority.NORMAL
+    ) -> float:
+        """
+        Take tokens, waiting until they are available.
+
+        Args:
+            tokens: The number of tokens to take
+            priority: Scheduling class of the request among the waiters
+
+        Returns:
+            float: The seconds spent waiting
+        """
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and self._tokens >= min(tokens, self.burst):
+            self._take(now, tokens)
+            return 0.0
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [priority, next(self._arrivals), tokens, future])
+        self._grant()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation: hand the tokens back
+                self._tokens += tokens
+                self.acquired -= tokens
+            self._grant()
+            raise
+        delay = time.monotonic() - now
+        self.waits += 1
+        self.wait_seconds += delay
+        self.max_wait = max(self.max_wait, delay)
+        return delay
+
+    def refund(self, tokens: float):
+        """
+        Give back tokens taken for requests that were not made.
+
+        Args:
+            tokens: The number of tokens to return
+        """
+        self._refill(time.monotonic())
+        self._tokens = min(self.burst, self._tokens + tokens)
+        self.acquired -= tokens
+        if self._waiters:
+            self._grant()
+
+    @property
+    def recent_rate(self) -> float:
+        """
+        Tokens taken per second over the last ``window`` seconds.
+
+        Returns:
+            float: The observed rate
+        """
+        cutoff = time.monotonic() - self.window
+        while self._history and self._history[0][0] < cutoff:
+            self._history.popleft()
+        return sum(tokens for _, tokens in self._history) / self.window
+
+    @property
+    def stats(self) -> TokenBucketStats:
+        """
+        Current bucket statistics.
+
+        Returns:
+            TokenBucketStats: Capacity, usage and waiting counters
+        """
+        self._refill(time.monotonic())
+        return TokenBucketStats(
+            rate=self.rate,
+            burst=self.burst,
+            available=self._tokens,
+            acquired=self.acquired,
+            waits=self.waits,
+            wait_seconds=self.wait_seconds,
+            max_wait=self.max_wait,
+            recent_rate=self.recent_rate,
+        )
+
+
+class RateLimit(BaseModel):
+    """Rate of one endpoint group."""
+
+    rate: float
+    burst: float = 1.0
+
+
+class RateLimiter(Middleware):
+    """
+    Middleware spacing out requests with one token bucket per endpoint group.
+
+    Requests are sorted into ``reads`` (GET requests and block queries),
+    ``world_edits`` (block changes) and ``writes`` (every other change, such
+    as giving items or broadcasting). A group without a limit is not
+    throttled. Requests wait for their turn instead of failing, most urgent
+    priority first, and every attempt of a retried request counts. Register
+    it first so no other middleware runs while a request is queued.
+    """
+
+    READS = "reads"
+    WRITES = "writes"
+    WORLD_EDITS = "world_edits"
+
+    def __init__(
+        self,
+        reads: Optional[RateLimit] = None,
+        writes: Optional[RateLimit] = None,
+        world_edits: Optional[RateLimit] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            reads: Limit for GET requests and block queries
+            writes: Limit for changes other than block edits
+            world_edits: Limit for block edits, including fills
+        """
+        self.buckets: Dict[str, TokenBucket] = {}
+        for group, limit in (
+            (self.READS, reads),
+            (self.WRITES, writes),
+            (self.WORLD_EDITS, world_edits),
+        ):
+            if limit is not None:
+                self.buckets[group] = TokenBucket(limit.rate, limit.burst)
+
+    @classmethod
+    def group(cls, method: str, endpoint: str) -> str:
+        """
+        Find the endpoint group of a request.
+
+        Args:
+            method: The HTTP method
+            endpoint: The API endpoint
+
+        Returns:
+            str: ``reads``, ``writes`` or ``world_edits``
+        """
+        method = method.upper()
+        if endpoint.startswith("/api/worlds/") and "/blocks" in endpoint:
+            # Block queries are POSTs, block changes PATCHes
+            return cls.WORLD_EDITS if method == "PATCH" else cls.READS
+        if method in ("GET", "HEAD", "OPTIONS"):
+            return cls.READS
+        return cls.WRITES
+
+    async def before_send(self, ctx: RequestContext):
+        bucket = self.buckets.get(self.group(ctx.method, ctx.endpoint))
+        if bucket is not None:
+            ctx.extras["rate_limit_wait"] = await bucket.acquire(priority=ctx.priority)
+
+    @property
+    def stats(self) -> Dict[str, TokenBucketStats]:
+        """
+        Usage and queueing delay of each limited group.
+
+        Returns:
+            Dict[str, TokenBucketStats]: Bucket statistics keyed by group
+        """
+        return {group: bucket.stats for group, bucket in self.buckets.items()}
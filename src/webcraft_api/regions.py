@@ -0,0 +1,135 @@
+import math
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
+
+Coordinate = Tuple[int, int, int]
+
+
+class Run(NamedTuple):
+    """A run of consecutive blocks along the X axis at a fixed Y and Z."""
+
+    y: int
+    z: int
+    x_start: int
+    x_end: int
+
+    def __len__(self) -> int:
+        return self.x_end - self.x_start + 1
+
+
+def cuboid(x1: int, y1: int, z1: int, x2: int, y2: int, z2: int) -> Iterator[Run]:
+    """
+    Describe the box between two corners, both inclusive.
+
+    Args:
+        x1: X coordinate of the first corner
+        y1: Y coordinate of the first corner
+        z1: Z coordinate of the first corner
+        x2: X coordinate of the opposite corner
+        y2: Y coordinate of the opposite corner
+        z2: Z coordinate of the opposite corner
+
+    Yields:
+        Run: One run per row of the box
+    """
+    x_start, x_end = sorted((x1, x2))
+    y_start, y_end = sorted((y1, y2))
+    z_start, z_end = sorted((z1, z2))
+    for y in range(y_start, y_end + 1):
+        for z in range(z_start, z_end + 1):
+            yield Run(y, z, x_start, x_end)
+
+
+def _half_width(radius: float, dy: int, dz: int) -> Optional[int]:
+    remainder = radius * radius - dy * dy - dz * dz
+    if remainder < 0:
+        return None
+    return math.isqrt(int(remainder))
+
+
+def sphere(
+    cx: int, cy: int, cz: int, radius: int, hollow: bool = False
+) -> Iterator[Run]:
+    """
+    Describe a sphere around a center block.
+
+    Args:
+        cx: X coordinate of the center
+        cy: Y coordinate of the center
+        cz: Z coordinate of the center
+        radius: The radius in blocks
+        hollow: Only include the one block thick shell
+
+    Yields:
+        Run: The runs making up the sphere
+    """
+    for dy in range(-radius, radius + 1):
+        for dz in range(-radius, radius + 1):
+            outer = _half_width(radius, dy, dz)
+            if outer is None:
+                continue
+            inner = _half_width(radius - 1, dy, dz) if hollow else None
+            if inner is None:
+                yield Run(cy + dy, cz + dz, cx - outer, cx + outer)
+                continue
+            if outer > inner:
+                yield Run(cy + dy, cz + dz, cx - outer, cx - inner - 1)
+                yield Run(cy + dy, cz + dz, cx + inner + 1, cx + outer)
+
+
+def line(x1: int, y1: int, z1: int, x2: int, y2: int, z2: int) -> Iterator[Run]:
+    """
+    Describe a straight line between two blocks using 3D Bresenham.
+
+    Args:
+        x1: X coordinate of the start
+        y1: Y coordinate of the start
+        z1: Z coordinate of the start
+        x2: X coordinate of the end
+        y2: Y coordinate of the end
+        z2: Z coordinate of the end
+
+    Yields:
+        Run: The runs making up the line, merged along X where possible
+    """
+    dx, dy, dz = abs(x2 - x1), abs(y2 - y1), abs(z2 - z1)
+    sx = 1 if x2 >= x1 else -1
+    sy = 1 if y2 >= y1 else -1
+    sz = 1 if z2 >= z1 else -1
+    steps = max(dx, dy, dz)
+    x, y, z = x1, y1, z1
+    err_x = err_y = err_z = steps // 2
+    run_start = x
+    for _ in range(steps):
+        err_x -= dx
+        err_y -= dy
+        err_z -= dz
+        next_x, next_y, next_z = x, y, z
+        if err_x < 0:
+            err_x += steps
+            next_x += sx
+        if err_y < 0:
+            err_y += steps
+            next_y += sy
+        if err_z < 0:
+            err_z += steps
+            next_z += sz
+        if (next_y, next_z) != (y, z):
+            yield Run(y, z, min(run_start, x), max(run_start, x))
+            run_start = next_x
+        x, y, z = next_x, next_y, next_z
+    yield Run(y, z, min(run_start, x), max(run_start, x))
+
+
+def expand(runs: Iterable[Run]) -> Iterator[Coordinate]:
+    """
+    Turn runs into individual block coordinates, lazily.
+
+    Args:
+        runs: The runs to expand
+
+    Yields:
+        Coordinate: The (x, y, z) of each block
+    """
+    for run in runs:
+        for x in range(run.x_start, run.x_end + 1):
+            yield x, run.y, run.z
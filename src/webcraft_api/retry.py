@@ -0,0 +1,129 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+from pydantic import BaseModel
+
+
+class RetryPolicy(BaseModel):
+    """
+    Settings controlling how failed requests are retried.
+
+    Requests are only retried when they are idempotent: every method listed
+    in ``idempotent_methods`` qualifies, and service methods mark the other
+    calls that are safe to repeat (setting a value, reading blocks). Actions
+    such as ``kill_player`` or ``give_items`` are never retried by default.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    max_retry_after: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    idempotent_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+    budget_ratio: float = 0.2
+    budget_min_retries: int = 10
+
+    def is_idempotent(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """
+        Decide whether a request may be repeated.
+
+        Args:
+            method: The HTTP method
+            idempotent: Explicit override given by the caller
+
+        Returns:
+            bool: True if the request may be retried
+        """
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Uses capped exponential backoff with full jitter. A server supplied
+        ``Retry-After`` takes precedence, capped at ``max_retry_after`` so
+        a longer request never turns into a shorter jittered delay.
+
+        Args:
+            attempt: The number of attempts made so far (starting at 1)
+            retry_after: Delay requested by the server, in seconds
+
+        Returns:
+            float: The delay in seconds
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the overall request volume.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws
+    one, so when the server is down the client sends at most
+    ``1 + ratio`` times its normal traffic instead of multiplying it by
+    ``max_attempts``. The budget starts with ``min_retries`` tokens and
+    saves up at most ten times as many, so a client that has sent few
+    requests can still retry.
+    """
+
+    def __init__(self, ratio: float, min_retries: int):
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Retry tokens earned per request
+            min_retries: Tokens available before any request was made
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._max_tokens = max(float(min_retries), 1.0) * 10
+        self._tokens = float(min_retries)
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self):
+        """Record a first attempt."""
+        self._tokens = min(self._max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Try to spend a token on a retry.
+
+        Returns:
+            bool: True if the retry is allowed
+        """
+        if self._tokens >= 1:
+            self._tokens -= 1
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        return False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header.
+
+    Args:
+        value: The header value, either seconds or an HTTP date
+
+    Returns:
+        Optional[float]: The delay in seconds, or None if absent or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,54 @@
+from typing import AsyncIterator, Iterable, Sequence
+
+from pydantic import BaseModel
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """
+    Encode a request model straight to JSON bytes.
+
+    Pydantic's compiled serializer writes nested models directly, with no
+    intermediate dict and no ``str`` to ``bytes`` copy.
+
+    Args:
+        model: The request model
+
+    Returns:
+        bytes: The UTF-8 encoded JSON
+    """
+    return model.__pydantic_serializer__.to_json(model)
+
+
+class JsonArrayStream:
+    """
+    Request body ``{"<key>": [...]}`` encoded lazily while it is sent.
+
+    Items are encoded ``batch_size`` at a time, so a very large block list
+    never exists as one JSON document in memory. The body is sent with
+    chunked transfer encoding. Every iteration starts over from the first
+    item, so a retried request sends the full body again.
+    """
+
+    def __init__(self, key: str, items: Sequence[BaseModel], batch_size: int = 1024):
+        """
+        Initialize the stream.
+
+        Args:
+            key: The name of the array in the JSON object
+            items: The request models making up the array
+            batch_size: Number of items encoded per chunk
+        """
+        self.key = key
+        self.items = items
+        self.batch_size = batch_size
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b'{"' + self.key.encode() + b'":['
+        for start in range(0, len(self.items), self.batch_size):
+            batch: Iterable[BaseModel] = self.items[start : start + self.batch_size]
+            prefix = b"," if start else b""
+            yield prefix + b",".join(encode_model(item) for item in batch)
+        yield b"]}"
@@ -15,8 +15,7 @@ class AdminService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/admins")
-        return AdminsDto(**response)
+        return await self.client._get("/api/admins", model=AdminsDto)
 
     async def is_player_admin(self, player: str) -> IsAdminDto:
         """
@@ -31,5 +30,4 @@ class AdminService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/admins/{player}")
-        return IsAdminDto(**response)
+        return await self.client._get(f"/api/admins/{player}", model=IsAdminDto)
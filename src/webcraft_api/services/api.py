@@ -1,3 +1,4 @@
+from src.webcraft_api.cache import CATALOG_TTL
 from src.webcraft_api.models.responses import ApiDto
 from src.webcraft_api.services.base import BaseService
 
@@ -15,5 +16,4 @@ class ApiService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/api")
-        return ApiDto(**response)
+        return await self.client._get("/api/api", cache_ttl=CATALOG_TTL, model=ApiDto)
@@ -8,6 +8,7 @@ from src.webcraft_api.models.responses import (
     IsBannedDto,
     SuccessResponse,
 )
+from src.webcraft_api.priority import Priority
 from src.webcraft_api.services.base import BaseService
 
 
@@ -24,8 +25,7 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/banlist/ips")
-        return BannedIpsDto(**response)
+        return await self.client._get("/api/banlist/ips", model=BannedIpsDto)
 
     async def ban_ip(self, request: BanIpRequest) -> SuccessResponse:
         """
@@ -40,8 +40,13 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post("/api/banlist/ips/ban", request.__dict__)
-        return SuccessResponse(**response)
+        return await self.client._post(
+            "/api/banlist/ips/ban",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
+            priority=Priority.CRITICAL,
+        )
 
     async def is_ip_banned(self, ip: str) -> IsBannedDto:
         """
@@ -56,8 +61,7 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/banlist/ips/{ip}")
-        return IsBannedDto(**response)
+        return await self.client._get(f"/api/banlist/ips/{ip}", model=IsBannedDto)
 
     async def unban_ip(self, ip: str) -> SuccessResponse:
         """
@@ -72,8 +76,9 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/banlist/ips/{ip}/pardon")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/banlist/ips/{ip}/pardon", idempotent=True, model=SuccessResponse
+        )
 
     async def get_banned_players(self) -> BannedPlayersDto:
         """
@@ -85,8 +90,7 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/banlist/players")
-        return BannedPlayersDto(**response)
+        return await self.client._get("/api/banlist/players", model=BannedPlayersDto)
 
     async def ban_player(self, request: BanPlayerRequest) -> SuccessResponse:
         """
@@ -101,8 +105,13 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post("/api/banlist/players/ban", request.__dict__)
-        return SuccessResponse(**response)
+        return await self.client._post(
+            "/api/banlist/players/ban",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
+            priority=Priority.CRITICAL,
+        )
 
     async def is_player_banned(self, player: str) -> IsBannedDto:
         """
@@ -117,8 +126,9 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/banlist/players/{player}")
-        return IsBannedDto(**response)
+        return await self.client._get(
+            f"/api/banlist/players/{player}", model=IsBannedDto
+        )
 
     async def unban_player(self, player: str) -> SuccessResponse:
         """
@@ -133,5 +143,8 @@ class BanlistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/banlist/players/{player}/pardon")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/banlist/players/{player}/pardon",
+            idempotent=True,
+            model=SuccessResponse,
+        )
@@ -1,5 +1,71 @@
+import functools
+import inspect
+from typing import Any, Callable, Dict
+
+from pydantic import BaseModel
+
+from src.webcraft_api.tracing import SERVICE_ATTRIBUTES
+
+
+def _span_attributes(
+    signature: inspect.Signature, args: tuple, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Pick the span attributes of a service call from its arguments.
+
+    Args:
+        signature: The method's signature
+        args: Positional arguments, including ``self``
+        kwargs: Keyword arguments
+
+    Returns:
+        Dict[str, Any]: World, player and entity names and item counts
+    """
+    attributes: Dict[str, Any] = {}
+    bound = signature.bind_partial(*args, **kwargs).arguments
+    for name, value in bound.items():
+        if name in SERVICE_ATTRIBUTES and isinstance(value, (str, int)):
+            attributes[SERVICE_ATTRIBUTES[name]] = value
+        elif isinstance(value, BaseModel):
+            for field in ("world", "player", "ip"):
+                field_value = getattr(value, field, None)
+                if isinstance(field_value, str):
+                    attributes[SERVICE_ATTRIBUTES[field]] = field_value
+        elif isinstance(value, (list, tuple)):
+            attributes[f"webcraft.{name}.count"] = len(value)
+    return attributes
+
+
+def _traced(owner: str, name: str, method: Callable) -> Callable:
+    """Wrap a public service coroutine in a span named after it."""
+    signature = inspect.signature(method)
+    span_name = f"{owner}.{name}"
+
+    @functools.wraps(method)
+    async def traced(self, *args, **kwargs):
+        tracer = self.client.tracer
+        if not tracer.enabled:
+            return await method(self, *args, **kwargs)
+        attributes = _span_attributes(signature, (self, *args), kwargs)
+        with tracer.start_span(span_name, attributes):
+            return await method(self, *args, **kwargs)
+
+    return traced
+
+
 class BaseService:
-    """Base class for API service implementations."""
+    """
+    Base class for API service implementations.
+
+    Public coroutine methods of subclasses are traced: with a tracer set on
+    the client, each call is a span named ``<Service>.<method>``.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, member in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(member):
+                setattr(cls, name, _traced(cls.__name__, name, member))
 
     def __init__(self, client: "WebCraftAPI"):
         """
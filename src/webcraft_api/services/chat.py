@@ -20,8 +20,9 @@ class ChatService(BaseService):
             APIException: If the request fails
         """
         request = BroadcastRequest(message=message)
-        response = await self.client._post("/api/chat/broadcast/all", request.__dict__)
-        return SuccessResponse(**response)
+        return await self.client._post(
+            "/api/chat/broadcast/all", request, model=SuccessResponse
+        )
 
     async def broadcast_ops(self, message: str) -> SuccessResponse:
         """
@@ -37,8 +38,9 @@ class ChatService(BaseService):
             APIException: If the request fails
         """
         request = BroadcastRequest(message=message)
-        response = await self.client._post("/api/chat/broadcast/ops", request.__dict__)
-        return SuccessResponse(**response)
+        return await self.client._post(
+            "/api/chat/broadcast/ops", request, model=SuccessResponse
+        )
 
     async def broadcast_players(self, message: str) -> SuccessResponse:
         """
@@ -54,7 +56,6 @@ class ChatService(BaseService):
             APIException: If the request fails
         """
         request = BroadcastRequest(message=message)
-        response = await self.client._post(
-            "/api/chat/broadcast/players", request.__dict__
+        return await self.client._post(
+            "/api/chat/broadcast/players", request, model=SuccessResponse
         )
-        return SuccessResponse(**response)
@@ -1,3 +1,4 @@
+from src.webcraft_api.cache import CATALOG_TTL
 from src.webcraft_api.models.requests import (
     CustomNameRequest,
     HealthRequest,
@@ -27,8 +28,11 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/entities/mobs/spawnable")
-        return SpawnableEntitiesDto(**response)
+        return await self.client._get(
+            "/api/entities/mobs/spawnable",
+            cache_ttl=CATALOG_TTL,
+            model=SpawnableEntitiesDto,
+        )
 
     async def spawn_mob(self, request: SpawnMobRequest) -> EntityDto:
         """
@@ -43,8 +47,9 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post("/api/entities/mobs/spawn", request.__dict__)
-        return EntityDto(**response)
+        return await self.client._post(
+            "/api/entities/mobs/spawn", request, model=EntityDto
+        )
 
     async def get_entity(self, entity_id: str) -> EntityDto:
         """
@@ -59,8 +64,7 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/entities/{entity_id}")
-        return EntityDto(**response)
+        return await self.client._get(f"/api/entities/{entity_id}", model=EntityDto)
 
     async def heal_entity(self, entity_id: str) -> EntityDto:
         """
@@ -75,8 +79,9 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/entities/{entity_id}/heal")
-        return EntityDto(**response)
+        return await self.client._post(
+            f"/api/entities/{entity_id}/heal", idempotent=True, model=EntityDto
+        )
 
     async def kill_entity(self, entity_id: str) -> EntityDto:
         """
@@ -91,8 +96,9 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/entities/{entity_id}/kill")
-        return EntityDto(**response)
+        return await self.client._post(
+            f"/api/entities/{entity_id}/kill", model=EntityDto
+        )
 
     async def get_entity_custom_name(self, entity_id: str) -> CustomNameDto:
         """
@@ -107,8 +113,9 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/entities/{entity_id}/customname")
-        return CustomNameDto(**response)
+        return await self.client._get(
+            f"/api/entities/{entity_id}/customname", model=CustomNameDto
+        )
 
     async def set_entity_custom_name(
         self, entity_id: str, custom_name: str
@@ -127,10 +134,12 @@ class EntitiesService(BaseService):
             APIException: If the request fails
         """
         request = CustomNameRequest(customName=custom_name)
-        response = await self.client._patch(
-            f"/api/entities/{entity_id}/customname", request.__dict__
+        return await self.client._patch(
+            f"/api/entities/{entity_id}/customname",
+            request,
+            idempotent=True,
+            model=EntityDto,
         )
-        return EntityDto(**response)
 
     async def get_entity_health(self, entity_id: str) -> HealthDto:
         """
@@ -145,8 +154,9 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/entities/{entity_id}/health")
-        return HealthDto(**response)
+        return await self.client._get(
+            f"/api/entities/{entity_id}/health", model=HealthDto
+        )
 
     async def set_entity_health(self, entity_id: str, health: float) -> EntityDto:
         """
@@ -163,10 +173,12 @@ class EntitiesService(BaseService):
             APIException: If the request fails
         """
         request = HealthRequest(health=health)
-        response = await self.client._patch(
-            f"/api/entities/{entity_id}/health", request.__dict__
+        return await self.client._patch(
+            f"/api/entities/{entity_id}/health",
+            request,
+            idempotent=True,
+            model=EntityDto,
         )
-        return EntityDto(**response)
 
     async def get_entity_max_health(self, entity_id: str) -> MaxHealthDto:
         """
@@ -181,8 +193,9 @@ class EntitiesService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/entities/{entity_id}/maxhealth")
-        return MaxHealthDto(**response)
+        return await self.client._get(
+            f"/api/entities/{entity_id}/maxhealth", model=MaxHealthDto
+        )
 
     async def set_entity_max_health(
         self, entity_id: str, max_health: float
@@ -201,7 +214,9 @@ class EntitiesService(BaseService):
             APIException: If the request fails
         """
         request = MaxHealthRequest(maxHealth=max_health)
-        response = await self.client._patch(
-            f"/api/entities/{entity_id}/maxhealth", request.__dict__
+        return await self.client._patch(
+            f"/api/entities/{entity_id}/maxhealth",
+            request,
+            idempotent=True,
+            model=EntityDto,
         )
-        return EntityDto(**response)
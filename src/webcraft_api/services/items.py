@@ -1,3 +1,4 @@
+from src.webcraft_api.cache import CATALOG_TTL
 from src.webcraft_api.models.responses import BlockNamesDto, ItemNamesDto
 from src.webcraft_api.services.base import BaseService
 
@@ -15,8 +16,9 @@ class ItemsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/blocks")
-        return BlockNamesDto(**response)
+        return await self.client._get(
+            "/api/blocks", cache_ttl=CATALOG_TTL, model=BlockNamesDto
+        )
 
     async def get_all_items(self) -> ItemNamesDto:
         """
@@ -28,5 +30,6 @@ class ItemsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/items")
-        return ItemNamesDto(**response)
+        return await self.client._get(
+            "/api/items", cache_ttl=CATALOG_TTL, model=ItemNamesDto
+        )
@@ -1,19 +1,27 @@
+from typing import Union
+
 from src.webcraft_api.models.responses import PingDto
 from src.webcraft_api.services.base import BaseService
+from src.webcraft_api.timeouts import SHORT_TIMEOUT, TimeoutConfig
 
 
 class PingService(BaseService):
     """Service for ping-related API endpoints."""
 
-    async def ping(self) -> PingDto:
+    async def ping(self, timeout: Union[TimeoutConfig, float, None] = None) -> PingDto:
         """
         Send a Ping request to the server to check if it is alive.
 
+        Args:
+            timeout: Override the default short timeout, so a wedged server
+                is reported quickly
+
         Returns:
             PingDto: Ping response
 
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/ping")
-        return PingDto(**response)
+        return await self.client._get(
+            "/api/ping", timeout=timeout or SHORT_TIMEOUT, model=PingDto
+        )
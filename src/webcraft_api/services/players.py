@@ -1,5 +1,7 @@
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 
+from src.webcraft_api.concurrency import imap_unordered
+from src.webcraft_api.models.bulk import PlayerInfoResult, PlayerSnapshot, RequestError
 from src.webcraft_api.models.enums import SlotType
 from src.webcraft_api.models.requests import (
     FoodLevelRequest,
@@ -23,9 +25,17 @@ from src.webcraft_api.models.responses import (
     SlotDto,
     SuccessResponse,
 )
+from src.webcraft_api.priority import Priority
 from src.webcraft_api.services.base import BaseService
 
 
+def _request_error(error: Exception) -> RequestError:
+    """Describe a failed request within a bulk operation."""
+    return RequestError(
+        message=str(error), status_code=getattr(error, "status_code", None)
+    )
+
+
 class PlayersService(BaseService):
     """Service for player-related API endpoints."""
 
@@ -39,8 +49,7 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/players")
-        return PlayerCountDto(**response)
+        return await self.client._get("/api/players", model=PlayerCountDto)
 
     async def get_online_players(self) -> PlayerNamesDto:
         """
@@ -52,8 +61,7 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/players/online")
-        return PlayerNamesDto(**response)
+        return await self.client._get("/api/players/online", model=PlayerNamesDto)
 
     async def get_offline_players(self) -> PlayerNamesDto:
         """
@@ -65,8 +73,7 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/players/offline")
-        return PlayerNamesDto(**response)
+        return await self.client._get("/api/players/offline", model=PlayerNamesDto)
 
     async def get_player_info(self, player: str) -> PlayerDto:
         """
@@ -81,8 +88,84 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/players/{player}")
-        return PlayerDto(**response)
+        return await self.client._get(f"/api/players/{player}", model=PlayerDto)
+
+    async def iter_player_info(
+        self, players: Optional[Iterable[str]] = None, concurrency: int = 16
+    ) -> AsyncIterator[PlayerInfoResult]:
+        """
+        Fetch information about many players concurrently.
+
+        Results are yielded as soon as each request completes, so they do not
+        follow the input order. A failed request is reported on its result
+        instead of aborting the others.
+
+        Args:
+            players: Player names or UUIDs, defaults to every online player
+            concurrency: Maximum number of requests in flight
+
+        Yields:
+            PlayerInfoResult: The information or error for one player
+
+        Raises:
+            APIException: If the online player list cannot be fetched
+        """
+        async for player, result in self._iter_raw_player_info(players, concurrency):
+            if isinstance(result, Exception):
+                yield PlayerInfoResult(player=player, error=_request_error(result))
+            else:
+                # Built without validation so ``info`` keeps the
+                # representation chosen by the client's decode mode
+                yield PlayerInfoResult.model_construct(
+                    player=player,
+                    info=self.client._decode(PlayerDto, result),
+                    error=None,
+                )
+
+    async def get_players_snapshot(
+        self, players: Optional[Iterable[str]] = None, concurrency: int = 16
+    ) -> PlayerSnapshot:
+        """
+        Fetch information about many players into a columnar snapshot.
+
+        Args:
+            players: Player names or UUIDs, defaults to every online player
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            PlayerSnapshot: Player information by column, plus per-player errors
+
+        Raises:
+            APIException: If the online player list cannot be fetched
+        """
+        names: List[str] = []
+        columns: Dict[str, List] = {field: [] for field in PlayerDto.model_fields}
+        errors: Dict[str, RequestError] = {}
+        async for player, result in self._iter_raw_player_info(players, concurrency):
+            if isinstance(result, Exception):
+                errors[player] = _request_error(result)
+                continue
+            names.append(player)
+            for field, values in columns.items():
+                values.append(result.get(field))
+        return PlayerSnapshot(players=names, columns=columns, errors=errors)
+
+    async def _iter_raw_player_info(
+        self, players: Optional[Iterable[str]], concurrency: int
+    ) -> AsyncIterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+        """Fetch player information as decoded JSON, bypassing the models."""
+        if players is None:
+            players = (
+                await self.client._get("/api/players/online", priority=Priority.BULK)
+            )["players"]
+
+        async def fetch(player: str) -> Dict[str, Any]:
+            return await self.client._get(
+                f"/api/players/{player}", priority=Priority.BULK
+            )
+
+        async for _, player, result in imap_unordered(fetch, players, concurrency):
+            yield player, result
 
     async def feed_player(self, player: str) -> SuccessResponse:
         """
@@ -97,8 +180,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/players/{player}/feed")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/players/{player}/feed", idempotent=True, model=SuccessResponse
+        )
 
     async def give_items(
         self, player: str, item: str, amount: int = 1
@@ -118,10 +202,9 @@ class PlayersService(BaseService):
             APIException: If the request fails
         """
         request = GiveRequest(item=item, amount=amount)
-        response = await self.client._post(
-            f"/api/players/{player}/give", request.__dict__
+        return await self.client._post(
+            f"/api/players/{player}/give", request, model=SuccessResponse
         )
-        return SuccessResponse(**response)
 
     async def heal_player(self, player: str) -> SuccessResponse:
         """
@@ -136,8 +219,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/players/{player}/heal")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/players/{player}/heal", idempotent=True, model=SuccessResponse
+        )
 
     async def kick_player(
         self, player: str, reason: Optional[str] = None
@@ -156,10 +240,12 @@ class PlayersService(BaseService):
             APIException: If the request fails
         """
         request = KickRequest(reason=reason)
-        response = await self.client._post(
-            f"/api/players/{player}/kick", request.__dict__
+        return await self.client._post(
+            f"/api/players/{player}/kick",
+            request,
+            model=SuccessResponse,
+            priority=Priority.CRITICAL,
         )
-        return SuccessResponse(**response)
 
     async def kill_player(self, player: str) -> SuccessResponse:
         """
@@ -174,8 +260,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/players/{player}/kill")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/players/{player}/kill", model=SuccessResponse
+        )
 
     async def starve_player(self, player: str) -> SuccessResponse:
         """
@@ -190,8 +277,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/players/{player}/starve")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/players/{player}/starve", model=SuccessResponse
+        )
 
     async def teleport_player(
         self, player: str, world: str, x: float, y: float, z: float
@@ -213,10 +301,12 @@ class PlayersService(BaseService):
             APIException: If the request fails
         """
         request = TeleportRequest(world=world, x=x, y=y, z=z)
-        response = await self.client._post(
-            f"/api/players/{player}/teleport", request.__dict__
+        return await self.client._post(
+            f"/api/players/{player}/teleport",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def get_food_level(self, player: str) -> FoodLevelDto:
         """
@@ -231,8 +321,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/players/{player}/foodlevel")
-        return FoodLevelDto(**response)
+        return await self.client._get(
+            f"/api/players/{player}/foodlevel", model=FoodLevelDto
+        )
 
     async def set_food_level(self, player: str, food_level: int) -> SuccessResponse:
         """
@@ -249,10 +340,12 @@ class PlayersService(BaseService):
             APIException: If the request fails
         """
         request = FoodLevelRequest(foodLevel=food_level)
-        response = await self.client._patch(
-            f"/api/players/{player}/foodlevel", request.__dict__
+        return await self.client._patch(
+            f"/api/players/{player}/foodlevel",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def get_health(self, player: str) -> HealthDto:
         """
@@ -267,8 +360,7 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/players/{player}/health")
-        return HealthDto(**response)
+        return await self.client._get(f"/api/players/{player}/health", model=HealthDto)
 
     async def set_health(self, player: str, health: float) -> SuccessResponse:
         """
@@ -285,10 +377,12 @@ class PlayersService(BaseService):
             APIException: If the request fails
         """
         request = HealthRequest(health=health)
-        response = await self.client._patch(
-            f"/api/players/{player}/health", request.__dict__
+        return await self.client._patch(
+            f"/api/players/{player}/health",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def clear_inventory(self, player: str) -> SuccessResponse:
         """
@@ -303,8 +397,11 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/players/{player}/inventory/clear")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/players/{player}/inventory/clear",
+            idempotent=True,
+            model=SuccessResponse,
+        )
 
     async def get_inventory(self, player: str) -> PlayerInventoryDto:
         """
@@ -319,8 +416,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/players/{player}/inventory/get")
-        return PlayerInventoryDto(**response)
+        return await self.client._get(
+            f"/api/players/{player}/inventory/get", model=PlayerInventoryDto
+        )
 
     async def get_inventory_slot(self, player: str, slot: SlotType) -> SlotDto:
         """
@@ -336,10 +434,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(
-            f"/api/players/{player}/inventory/slots/{slot}"
+        return await self.client._get(
+            f"/api/players/{player}/inventory/slots/{slot}", model=SlotDto
         )
-        return SlotDto(**response)
 
     async def set_inventory_slot(
         self, player: str, slot: SlotType, item: str, amount: int
@@ -360,10 +457,12 @@ class PlayersService(BaseService):
             APIException: If the request fails
         """
         request = SlotRequest(item=item, amount=amount)
-        response = await self.client._patch(
-            f"/api/players/{player}/inventory/slots/{slot}", request.__dict__
+        return await self.client._patch(
+            f"/api/players/{player}/inventory/slots/{slot}",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def get_location(self, player: str) -> LocationDto:
         """
@@ -378,8 +477,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/players/{player}/location")
-        return LocationDto(**response)
+        return await self.client._get(
+            f"/api/players/{player}/location", model=LocationDto
+        )
 
     async def get_max_health(self, player: str) -> MaxHealthDto:
         """
@@ -394,8 +494,9 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/players/{player}/maxhealth")
-        return MaxHealthDto(**response)
+        return await self.client._get(
+            f"/api/players/{player}/maxhealth", model=MaxHealthDto
+        )
 
     async def set_max_health(self, player: str, max_health: float) -> SuccessResponse:
         """
@@ -412,10 +513,12 @@ class PlayersService(BaseService):
             APIException: If the request fails
         """
         request = MaxHealthRequest(maxHealth=max_health)
-        response = await self.client._patch(
-            f"/api/players/{player}/maxhealth", request.__dict__
+        return await self.client._patch(
+            f"/api/players/{player}/maxhealth",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def get_spawn_point(self, player: str) -> PlayerSpawnPointDto:
         """
@@ -430,5 +533,6 @@ class PlayersService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/players/{player}/spawnpoint")
-        return PlayerSpawnPointDto(**response)
+        return await self.client._get(
+            f"/api/players/{player}/spawnpoint", model=PlayerSpawnPointDto
+        )
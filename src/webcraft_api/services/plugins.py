@@ -1,3 +1,4 @@
+from src.webcraft_api.cache import CATALOG_TTL
 from src.webcraft_api.models.responses import PluginDto, PluginNamesDto
 from src.webcraft_api.services.base import BaseService
 
@@ -15,8 +16,9 @@ class PluginsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/plugins")
-        return PluginNamesDto(**response)
+        return await self.client._get(
+            "/api/plugins", cache_ttl=CATALOG_TTL, model=PluginNamesDto
+        )
 
     async def get_plugin_info(self, plugin: str) -> PluginDto:
         """
@@ -31,5 +33,4 @@ class PluginsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/plugins/{plugin}")
-        return PluginDto(**response)
+        return await self.client._get(f"/api/plugins/{plugin}", model=PluginDto)
@@ -1,3 +1,4 @@
+from src.webcraft_api.cache import CATALOG_TTL
 from src.webcraft_api.models.responses import ServerDto
 from src.webcraft_api.services.base import BaseService
 
@@ -15,5 +16,6 @@ class ServerService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/server")
-        return ServerDto(**response)
+        return await self.client._get(
+            "/api/server", cache_ttl=CATALOG_TTL, model=ServerDto
+        )
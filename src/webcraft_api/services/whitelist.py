@@ -24,8 +24,7 @@ class WhitelistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/whitelist")
-        return WhitelistDto(**response)
+        return await self.client._get("/api/whitelist", model=WhitelistDto)
 
     async def get_whitelisted_players(self) -> WhitelistedPlayersDto:
         """
@@ -37,8 +36,9 @@ class WhitelistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/whitelist/players")
-        return WhitelistedPlayersDto(**response)
+        return await self.client._get(
+            "/api/whitelist/players", model=WhitelistedPlayersDto
+        )
 
     async def whitelist_player(self, name: str) -> SuccessResponse:
         """
@@ -54,10 +54,12 @@ class WhitelistService(BaseService):
             APIException: If the request fails
         """
         request = WhitelistPlayerRequest(name=name)
-        response = await self.client._post(
-            "/api/whitelist/players/add", request.__dict__
+        return await self.client._post(
+            "/api/whitelist/players/add",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def unwhitelist_player(self, name: str) -> SuccessResponse:
         """
@@ -73,10 +75,12 @@ class WhitelistService(BaseService):
             APIException: If the request fails
         """
         request = UnwhitelistPlayerRequest(name=name)
-        response = await self.client._post(
-            "/api/whitelist/players/remove", request.__dict__
+        return await self.client._post(
+            "/api/whitelist/players/remove",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def is_player_whitelisted(self, player: str) -> IsWhitelistedDto:
         """
@@ -91,5 +95,6 @@ class WhitelistService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/whitelist/players/{player}")
-        return IsWhitelistedDto(**response)
+        return await self.client._get(
+            f"/api/whitelist/players/{player}", model=IsWhitelistedDto
+        )
@@ -1,5 +1,11 @@
-from typing import List, Union
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type, Union
 
+from pydantic import BaseModel
+
+from src.webcraft_api.batching import ProgressCallback, dispatch_chunks
+from src.webcraft_api.models.block_array import BlockArray
+from src.webcraft_api.models.bulk import FillResult
 from src.webcraft_api.models.enums import DifficultyType, WeatherType
 from src.webcraft_api.models.requests import (
     DropItemsRequest,
@@ -24,7 +30,25 @@ from src.webcraft_api.models.responses import (
     WorldDto,
     WorldNamesDto,
 )
+from src.webcraft_api.priority import Priority
+from src.webcraft_api.regions import Coordinate, Run, cuboid, expand, line, sphere
+from src.webcraft_api.serialization import JsonArrayStream
 from src.webcraft_api.services.base import BaseService
+from src.webcraft_api.timeouts import LONG_TIMEOUT, TimeoutConfig, resolve_timeout
+
+
+def _block_fields(entry: Any) -> Tuple[str, int, int, int]:
+    """Name and integer position of a decoded block, a model or a dict."""
+    if isinstance(entry, dict):
+        position = entry["position"]
+        return (
+            entry["name"],
+            int(position["x"]),
+            int(position["y"]),
+            int(position["z"]),
+        )
+    position = entry.position
+    return entry.name, int(position.x), int(position.y), int(position.z)
 
 
 class WorldsService(BaseService):
@@ -40,8 +64,7 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get("/api/worlds")
-        return WorldNamesDto(**response)
+        return await self.client._get("/api/worlds", model=WorldNamesDto)
 
     async def get_world_info(self, world_name: str) -> WorldDto:
         """
@@ -56,15 +79,17 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/worlds/{world_name}")
-        return WorldDto(**response)
+        return await self.client._get(f"/api/worlds/{world_name}", model=WorldDto)
 
-    async def save_world(self, world: str) -> SuccessResponse:
+    async def save_world(
+        self, world: str, timeout: Union[TimeoutConfig, float, None] = None
+    ) -> SuccessResponse:
         """
         Save the world.
 
         Args:
             world: The world name
+            timeout: Override the default long timeout for saving
 
         Returns:
             SuccessResponse: Success response
@@ -72,55 +97,499 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._post(f"/api/worlds/{world}/save")
-        return SuccessResponse(**response)
+        return await self.client._post(
+            f"/api/worlds/{world}/save",
+            idempotent=True,
+            timeout=timeout or LONG_TIMEOUT,
+            model=SuccessResponse,
+        )
 
-    async def get_blocks(self, world: str, blocks: List[GetBlockRequest]) -> BlocksDto:
+    def _blocks_body(
+        self, request_type: Type[BaseModel], chunk: List[BaseModel]
+    ) -> Union[BaseModel, JsonArrayStream]:
+        """Build a block list body, streamed once it reaches the threshold."""
+        threshold = self.client.batch.stream_threshold
+        if threshold is not None and len(chunk) >= threshold:
+            return JsonArrayStream("blocks", chunk)
+        return request_type(blocks=chunk)
+
+    async def get_blocks(
+        self,
+        world: str,
+        blocks: Iterable[GetBlockRequest],
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> BlocksDto:
         """
         Get blocks at specific locations.
 
+        Large lists are split into chunks according to the client's batch
+        settings and fetched concurrently; the result keeps the input order.
+        When the client has a block cache, cached positions are answered
+        locally and only the others are requested.
+
         Args:
             world: The world name
-            blocks: List of block positions to query
+            blocks: Block positions to query, may be a lazy iterable
+            timeout: Override the default long timeout for each chunk
+            on_progress: Called with the number of blocks fetched so far and
+                the total, if known
 
         Returns:
             BlocksDto: Block information
 
         Raises:
             APIException: If the request fails
-        """
-        request = GetBlocksRequest(blocks=blocks)
-        response = await self.client._post(
-            f"/api/worlds/{world}/blocks", request.__dict__
-        )
-        return BlocksDto(**response)
+            BatchError: If some chunks still fail after every attempt
+        """
+        cache = self.client.block_cache
+        if cache is None:
+            fetched = await self._fetch_blocks(world, blocks, timeout, on_progress)
+            return self.client._decode(BlocksDto, {"blocks": fetched})
+
+        requested = list(blocks)
+        names = [cache.get(world, block.x, block.y, block.z) for block in requested]
+        misses = [block for block, name in zip(requested, names) if name is None]
+        found = {}
+        if misses:
+            for entry in await self._fetch_blocks(world, misses, timeout, on_progress):
+                _, x, y, z = _block_fields(entry)
+                found[(x, y, z)] = entry
+
+        result = []
+        for block, name in zip(requested, names):
+            if name is not None:
+                result.append(
+                    {
+                        "name": name,
+                        "position": {"x": block.x, "y": block.y, "z": block.z},
+                    }
+                )
+            elif (entry := found.get((block.x, block.y, block.z))) is not None:
+                result.append(entry)
+        return self.client._decode(BlocksDto, {"blocks": result})
+
+    async def get_blocks_array(
+        self,
+        world: str,
+        blocks: Iterable[GetBlockRequest],
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> BlockArray:
+        """
+        Get blocks at specific locations as a compact numpy-backed array.
+
+        Responses are decoded straight into coordinate and palette arrays
+        without building a ``BlockDto`` per block. Requires numpy.
+
+        Args:
+            world: The world name
+            blocks: Block positions to query, may be a lazy iterable
+            timeout: Override the default long timeout for each chunk
+            on_progress: Called with the number of blocks fetched so far and
+                the total, if known
+
+        Returns:
+            BlockArray: Block information, in input order
+
+        Raises:
+            APIException: If the request fails
+            BatchError: If some chunks still fail after every attempt
+        """
+        cache = self.client.block_cache
+
+        async def send(chunk: List[GetBlockRequest]) -> BlockArray:
+            request = self._blocks_body(GetBlocksRequest, chunk)
+            response = await self.client._post(
+                f"/api/worlds/{world}/blocks",
+                request,
+                idempotent=True,
+                timeout=timeout or LONG_TIMEOUT,
+                priority=Priority.BULK,
+            )
+            result = BlockArray.from_raw(response.get("blocks", []))
+            if cache is not None:
+                names = result.palette
+                for x, y, z, index in zip(
+                    result.xs.tolist(),
+                    result.ys.tolist(),
+                    result.zs.tolist(),
+                    result.indices.tolist(),
+                ):
+                    cache.put(world, x, y, z, names[index])
+            return result
+
+        results = await dispatch_chunks(send, blocks, self.client.batch, on_progress)
+        return BlockArray.concatenate(results)
+
+    async def _fetch_blocks(
+        self,
+        world: str,
+        blocks: Iterable[GetBlockRequest],
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> List[Any]:
+        """
+        Request blocks from the server in chunks, filling the block cache.
+
+        Each chunk's response body is decoded into ``BlocksDto`` on its own,
+        so in validate mode pydantic parses the bytes directly, and the
+        chunks' blocks are concatenated. The blocks are models, or dicts in
+        raw mode.
+        """
+        cache = self.client.block_cache
+
+        async def send(chunk: List[GetBlockRequest]) -> List[Any]:
+            request = self._blocks_body(GetBlocksRequest, chunk)
+            response = await self.client._post(
+                f"/api/worlds/{world}/blocks",
+                request,
+                idempotent=True,
+                timeout=timeout or LONG_TIMEOUT,
+                model=BlocksDto,
+                priority=Priority.BULK,
+            )
+            if isinstance(response, dict):
+                found = response.get("blocks", [])
+            else:
+                found = response.blocks
+            if cache is not None:
+                for entry in found:
+                    name, x, y, z = _block_fields(entry)
+                    cache.put(world, x, y, z, name)
+            return found
+
+        results = await dispatch_chunks(send, blocks, self.client.batch, on_progress)
+        if not results:
+            return await send([])
+        return [entry for result in results for entry in result]
 
     async def set_blocks(
-        self, world: str, blocks: List[SetBlockRequest]
+        self,
+        world: str,
+        blocks: Iterable[SetBlockRequest],
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> SuccessResponse:
         """
         Set blocks in specific locations.
 
+        Large lists are split into chunks according to the client's batch
+        settings and sent concurrently. Written blocks are recorded in the
+        client's block cache, if any.
+
         Args:
             world: The world name
-            blocks: List of blocks to set
+            blocks: Blocks to set, may be a lazy iterable
+            timeout: Override the default long timeout for each chunk
+            on_progress: Called with the number of blocks set so far and the
+                total, if known
 
         Returns:
-            SuccessResponse: Success response
+            SuccessResponse: Success response of the last chunk
 
         Raises:
             APIException: If the request fails
-        """
-        request = SetBlocksRequest(blocks=blocks)
-        response = await self.client._patch(
-            f"/api/worlds/{world}/blocks", request.__dict__
+            BatchError: If some chunks still fail after every attempt
+        """
+        cache = self.client.block_cache
+
+        async def send(chunk: List[SetBlockRequest]) -> SuccessResponse:
+            request = self._blocks_body(SetBlocksRequest, chunk)
+            response = await self.client._patch(
+                f"/api/worlds/{world}/blocks",
+                request,
+                idempotent=True,
+                timeout=timeout or LONG_TIMEOUT,
+                priority=Priority.BULK,
+            )
+            if cache is not None:
+                for block in chunk:
+                    cache.put(world, block.x, block.y, block.z, block.block)
+            return self.client._decode(SuccessResponse, response)
+
+        results = await dispatch_chunks(send, blocks, self.client.batch, on_progress)
+        if not results:
+            return await send([])
+        return results[-1]
+
+    async def fill_cuboid(
+        self,
+        world: str,
+        block: str,
+        x1: int,
+        y1: int,
+        z1: int,
+        x2: int,
+        y2: int,
+        z2: int,
+        skip_unchanged: bool = False,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> FillResult:
+        """
+        Fill the box between two corners, both inclusive, with a block.
+
+        Args:
+            world: The world name
+            block: The block name
+            x1: X coordinate of the first corner
+            y1: Y coordinate of the first corner
+            z1: Z coordinate of the first corner
+            x2: X coordinate of the opposite corner
+            y2: Y coordinate of the opposite corner
+            z2: Z coordinate of the opposite corner
+            skip_unchanged: Read each chunk first and only write the blocks
+                that differ
+            timeout: Override the default long timeout for each chunk
+            on_progress: Called with the number of blocks scanned so far and
+                the total
+
+        Returns:
+            FillResult: Number of blocks scanned and changed
+
+        Raises:
+            APIException: If the request fails
+            BatchError: If some chunks still fail after every attempt
+        """
+        return await self._fill_runs(
+            world,
+            partial(cuboid, x1, y1, z1, x2, y2, z2),
+            block,
+            read_first=skip_unchanged,
+            timeout=timeout,
+            on_progress=on_progress,
+        )
+
+    async def fill_sphere(
+        self,
+        world: str,
+        block: str,
+        x: int,
+        y: int,
+        z: int,
+        radius: int,
+        hollow: bool = False,
+        skip_unchanged: bool = False,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> FillResult:
+        """
+        Fill a sphere around a center block.
+
+        Args:
+            world: The world name
+            block: The block name
+            x: X coordinate of the center
+            y: Y coordinate of the center
+            z: Z coordinate of the center
+            radius: The radius in blocks
+            hollow: Only fill the one block thick shell
+            skip_unchanged: Read each chunk first and only write the blocks
+                that differ
+            timeout: Override the default long timeout for each chunk
+            on_progress: Called with the number of blocks scanned so far and
+                the total
+
+        Returns:
+            FillResult: Number of blocks scanned and changed
+
+        Raises:
+            APIException: If the request fails
+            BatchError: If some chunks still fail after every attempt
+        """
+        return await self._fill_runs(
+            world,
+            partial(sphere, x, y, z, radius, hollow),
+            block,
+            read_first=skip_unchanged,
+            timeout=timeout,
+            on_progress=on_progress,
+        )
+
+    async def fill_line(
+        self,
+        world: str,
+        block: str,
+        x1: int,
+        y1: int,
+        z1: int,
+        x2: int,
+        y2: int,
+        z2: int,
+        skip_unchanged: bool = False,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> FillResult:
+        """
+        Draw a straight line of blocks between two points.
+
+        Args:
+            world: The world name
+            block: The block name
+            x1: X coordinate of the start
+            y1: Y coordinate of the start
+            z1: Z coordinate of the start
+            x2: X coordinate of the end
+            y2: Y coordinate of the end
+            z2: Z coordinate of the end
+            skip_unchanged: Read each chunk first and only write the blocks
+                that differ
+            timeout: Override the default long timeout for each chunk
+            on_progress: Called with the number of blocks scanned so far and
+                the total
+
+        Returns:
+            FillResult: Number of blocks scanned and changed
+
+        Raises:
+            APIException: If the request fails
+            BatchError: If some chunks still fail after every attempt
+        """
+        return await self._fill_runs(
+            world,
+            partial(line, x1, y1, z1, x2, y2, z2),
+            block,
+            read_first=skip_unchanged,
+            timeout=timeout,
+            on_progress=on_progress,
+        )
+
+    async def replace_blocks(
+        self,
+        world: str,
+        old_block: str,
+        new_block: str,
+        x1: int,
+        y1: int,
+        z1: int,
+        x2: int,
+        y2: int,
+        z2: int,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> FillResult:
+        """
+        Replace every occurrence of a block inside a box.
+
+        Args:
+            world: The world name
+            old_block: The block name to replace
+            new_block: The block name to put in its place
+            x1: X coordinate of the first corner
+            y1: Y coordinate of the first corner
+            z1: Z coordinate of the first corner
+            x2: X coordinate of the opposite corner
+            y2: Y coordinate of the opposite corner
+            z2: Z coordinate of the opposite corner
+            timeout: Override the default long timeout for each chunk
+            on_progress: Called with the number of blocks scanned so far and
+                the total
+
+        Returns:
+            FillResult: Number of blocks scanned and changed
+
+        Raises:
+            APIException: If the request fails
+            BatchError: If some chunks still fail after every attempt
+        """
+        return await self._fill_runs(
+            world,
+            partial(cuboid, x1, y1, z1, x2, y2, z2),
+            new_block,
+            read_first=True,
+            match=old_block,
+            timeout=timeout,
+            on_progress=on_progress,
+        )
+
+    async def _fill_runs(
+        self,
+        world: str,
+        region: Callable[[], Iterable[Run]],
+        block: str,
+        read_first: bool = False,
+        match: Optional[str] = None,
+        timeout: Union[TimeoutConfig, float, None] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> FillResult:
+        """
+        Write a block over a run-length encoded region, chunk by chunk.
+
+        ``region`` produces the runs and is called twice: once to count the
+        blocks for progress reports, then to expand the runs one chunk at a
+        time. Neither the runs nor the coordinates are ever held in full,
+        and chunks are sent as plain dicts, so no per-block model is
+        created and at most ``concurrency`` chunks are held in memory.
+        """
+        total = sum(len(run) for run in region())
+        cache = self.client.block_cache
+        endpoint = f"/api/worlds/{world}/blocks"
+        timeout = resolve_timeout(timeout, LONG_TIMEOUT)
+
+        async def process(chunk: List[Coordinate]) -> FillResult:
+            targets = chunk
+            if read_first:
+                response = await self.client._post(
+                    endpoint,
+                    {"blocks": [{"x": x, "y": y, "z": z} for x, y, z in chunk]},
+                    idempotent=True,
+                    timeout=timeout,
+                    priority=Priority.BULK,
+                )
+                current = {
+                    (
+                        int(found["position"]["x"]),
+                        int(found["position"]["y"]),
+                        int(found["position"]["z"]),
+                    ): found["name"]
+                    for found in response.get("blocks", [])
+                }
+                if cache is not None:
+                    for (x, y, z), name in current.items():
+                        cache.put(world, x, y, z, name)
+                targets = [
+                    coordinate
+                    for coordinate in chunk
+                    if current.get(coordinate) != block
+                    and (match is None or current.get(coordinate) == match)
+                ]
+            if targets:
+                await self.client._patch(
+                    endpoint,
+                    {
+                        "blocks": [
+                            {"block": block, "x": x, "y": y, "z": z}
+                            for x, y, z in targets
+                        ]
+                    },
+                    idempotent=True,
+                    timeout=timeout,
+                    priority=Priority.BULK,
+                )
+                if cache is not None:
+                    for x, y, z in targets:
+                        cache.put(world, x, y, z, block)
+            return FillResult(scanned=len(chunk), changed=len(targets))
+
+        def progress(done: int, _: Optional[int]):
+            if on_progress is not None:
+                on_progress(done, total)
+
+        results = await dispatch_chunks(
+            process, expand(region()), self.client.batch, progress
+        )
+        return FillResult(
+            scanned=sum(result.scanned for result in results),
+            changed=sum(result.changed for result in results),
         )
-        return SuccessResponse(**response)
 
     async def get_block(self, world: str, x: int, y: int, z: int) -> BlockDto:
         """
         Get block at a specific location.
 
+        Served from the client's block cache when the position is cached.
+
         Args:
             world: The world name
             x: X coordinate
@@ -133,11 +602,21 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
+        cache = self.client.block_cache
+        if cache is not None:
+            name = cache.get(world, x, y, z)
+            if name is not None:
+                return self.client._decode(
+                    BlockDto, {"name": name, "position": {"x": x, "y": y, "z": z}}
+                )
+
         request = GetBlockRequest(x=x, y=y, z=z)
         response = await self.client._post(
-            f"/api/worlds/{world}/blocks/block", request.__dict__
+            f"/api/worlds/{world}/blocks/block", request, idempotent=True
         )
-        return BlockDto(**response)
+        if cache is not None:
+            cache.put(world, x, y, z, response["name"])
+        return self.client._decode(BlockDto, response)
 
     async def set_block(
         self, world: str, block: str, x: int, y: int, z: int
@@ -160,9 +639,11 @@ class WorldsService(BaseService):
         """
         request = SetBlockRequest(block=block, x=x, y=y, z=z)
         response = await self.client._patch(
-            f"/api/worlds/{world}/blocks/block", request.__dict__
+            f"/api/worlds/{world}/blocks/block", request, idempotent=True
         )
-        return SuccessResponse(**response)
+        if self.client.block_cache is not None:
+            self.client.block_cache.put(world, x, y, z, block)
+        return self.client._decode(SuccessResponse, response)
 
     async def get_difficulty(self, world: str) -> DifficultyDto:
         """
@@ -177,8 +658,9 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/worlds/{world}/difficulty")
-        return DifficultyDto(**response)
+        return await self.client._get(
+            f"/api/worlds/{world}/difficulty", model=DifficultyDto
+        )
 
     async def set_difficulty(
         self, world: str, difficulty: Union[DifficultyType, str]
@@ -200,10 +682,12 @@ class WorldsService(BaseService):
             difficulty = difficulty.value
 
         request = SetDifficultyRequest(difficulty=difficulty)
-        response = await self.client._patch(
-            f"/api/worlds/{world}/difficulty", request.__dict__
+        return await self.client._patch(
+            f"/api/worlds/{world}/difficulty",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def drop_items(
         self, world: str, item: str, amount: int, x: int, y: int, z: int
@@ -226,10 +710,9 @@ class WorldsService(BaseService):
             APIException: If the request fails
         """
         request = DropItemsRequest(item=item, amount=amount, x=x, y=y, z=z)
-        response = await self.client._post(
-            f"/api/worlds/{world}/items/drop", request.__dict__
+        return await self.client._post(
+            f"/api/worlds/{world}/items/drop", request, model=SuccessResponse
         )
-        return SuccessResponse(**response)
 
     async def get_seed(self, world_name: str) -> SeedDto:
         """
@@ -244,8 +727,7 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/worlds/{world_name}/seed")
-        return SeedDto(**response)
+        return await self.client._get(f"/api/worlds/{world_name}/seed", model=SeedDto)
 
     async def get_spawn_point(self, world: str) -> SpawnPointDto:
         """
@@ -260,8 +742,9 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/worlds/{world}/spawnpoint")
-        return SpawnPointDto(**response)
+        return await self.client._get(
+            f"/api/worlds/{world}/spawnpoint", model=SpawnPointDto
+        )
 
     async def set_spawn_point(
         self, world: str, x: int, y: int, z: int
@@ -282,10 +765,12 @@ class WorldsService(BaseService):
             APIException: If the request fails
         """
         request = SetSpawnPointRequest(x=x, y=y, z=z)
-        response = await self.client._patch(
-            f"/api/worlds/{world}/spawnpoint", request.__dict__
+        return await self.client._patch(
+            f"/api/worlds/{world}/spawnpoint",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def get_time(self, world: str) -> TimeDto:
         """
@@ -300,8 +785,7 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/worlds/{world}/time")
-        return TimeDto(**response)
+        return await self.client._get(f"/api/worlds/{world}/time", model=TimeDto)
 
     async def set_time(self, world: str, time: int) -> SuccessResponse:
         """
@@ -318,10 +802,12 @@ class WorldsService(BaseService):
             APIException: If the request fails
         """
         request = SetTimeRequest(time=time)
-        response = await self.client._patch(
-            f"/api/worlds/{world}/time", request.__dict__
+        return await self.client._patch(
+            f"/api/worlds/{world}/time",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
 
     async def get_weather(self, world: str) -> WeatherDto:
         """
@@ -336,8 +822,7 @@ class WorldsService(BaseService):
         Raises:
             APIException: If the request fails
         """
-        response = await self.client._get(f"/api/worlds/{world}/weather")
-        return WeatherDto(**response)
+        return await self.client._get(f"/api/worlds/{world}/weather", model=WeatherDto)
 
     async def set_weather(
         self, world: str, weather: Union[WeatherType, str], duration: int
@@ -360,7 +845,9 @@ class WorldsService(BaseService):
             weather = weather.value
 
         request = SetWeatherRequest(weather=weather, duration=duration)
-        response = await self.client._patch(
-            f"/api/worlds/{world}/weather", request.__dict__
+        return await self.client._patch(
+            f"/api/worlds/{world}/weather",
+            request,
+            idempotent=True,
+            model=SuccessResponse,
         )
-        return SuccessResponse(**response)
@@ -0,0 +1,94 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from pydantic import BaseModel
+
+from src.webcraft_api.exceptions import DeadlineExceeded
+
+
+class SingleFlightStats(BaseModel):
+    """Counters describing how many concurrent calls were collapsed."""
+
+    calls: int
+    executed: int
+    collapsed: int
+    in_flight: int
+
+
+class SingleFlight:
+    """
+    Deduplicates identical concurrent calls.
+
+    The first caller for a key starts the work; callers arriving while it
+    is still running await the same result instead of starting their own.
+    The work runs in its own task, so cancelling one caller does not cancel
+    the request for the others.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executed = 0
+        self.collapsed = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Run ``fn`` unless an identical call is already in flight.
+
+        Args:
+            key: Identifies calls that may share a result
+            fn: Coroutine function doing the work
+            timeout: Seconds this caller waits at most; the shared call
+                keeps running for the others
+
+        Returns:
+            Any: The shared result
+
+        Raises:
+            DeadlineExceeded: If ``timeout`` passes before the result
+        """
+        self.calls += 1
+        future = self._in_flight.get(key)
+        if future is None:
+            self.executed += 1
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.collapsed += 1
+        if timeout is None:
+            return await asyncio.shield(future)
+        # Unlike wait_for, a timeout here cannot be confused with one
+        # raised by the shared call itself
+        done, _ = await asyncio.wait((future,), timeout=timeout)
+        if not done:
+            raise DeadlineExceeded()
+        return future.result()
+
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every caller went away
+            future.exception()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """
+        Current coalescing statistics.
+
+        Returns:
+            SingleFlightStats: Call, execution and collapse counters
+        """
+        return SingleFlightStats(
+            calls=self.calls,
+            executed=self.executed,
+            collapsed=self.collapsed,
+            in_flight=len(self._in_flight),
+        )
@@ -0,0 +1,134 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+import aiohttp
+from pydantic import BaseModel
+
+from src.webcraft_api.exceptions import DeadlineExceeded
+
+_deadline: ContextVar[Optional[float]] = ContextVar("webcraft_deadline", default=None)
+
+
+class TimeoutConfig(BaseModel):
+    """Connect, read and total timeouts for a request, in seconds."""
+
+    connect: Optional[float] = 10.0
+    sock_read: Optional[float] = 30.0
+    total: Optional[float] = 60.0
+
+    def to_client_timeout(
+        self, remaining: Optional[float] = None
+    ) -> aiohttp.ClientTimeout:
+        """
+        Convert to an aiohttp timeout, clamped to a deadline if one is set.
+
+        Args:
+            remaining: Seconds left before the current deadline
+
+        Returns:
+            aiohttp.ClientTimeout: The timeout to apply to the request
+        """
+        total = self.total
+        if remaining is not None:
+            total = remaining if total is None else min(total, remaining)
+        return aiohttp.ClientTimeout(
+            total=total, sock_connect=self.connect, sock_read=self.sock_read
+        )
+
+
+# Defaults for endpoints that are known to be slow or expected to be fast
+LONG_TIMEOUT = TimeoutConfig(connect=10.0, sock_read=300.0, total=300.0)
+SHORT_TIMEOUT = TimeoutConfig(connect=2.0, sock_read=5.0, total=5.0)
+
+
+def resolve_timeout(
+    timeout: Union[TimeoutConfig, float, None], default: TimeoutConfig
+) -> TimeoutConfig:
+    """
+    Turn a per-call timeout override into a full configuration.
+
+    Args:
+        timeout: A TimeoutConfig, a total timeout in seconds, or None
+        default: The configuration to use when no override is given
+
+    Returns:
+        TimeoutConfig: The effective timeout configuration
+    """
+    if timeout is None:
+        return default
+    if isinstance(timeout, TimeoutConfig):
+        return timeout
+    return default.model_copy(update={"total": float(timeout)})
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound every request made inside the block by a shared deadline.
+
+    The deadline is stored in a context variable, so it propagates into
+    tasks spawned with ``asyncio.gather`` or ``asyncio.create_task`` from
+    within the block. Nested deadlines can only shorten the outer one.
+
+    Args:
+        seconds: Time budget for the whole operation
+
+    Yields:
+        float: The absolute deadline on the ``time.monotonic`` clock
+    """
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _deadline.set(expires_at)
+    try:
+        yield expires_at
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """
+    Run the block without the caller's deadline.
+
+    Meant for work shared between callers with different deadlines, each
+    of which then waits for it no longer than its own deadline allows.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Seconds left before the current deadline.
+
+    Returns:
+        Optional[float]: The remaining time, or None when no deadline is set
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded()
+    return remaining
+
+
+def deadline_expired() -> bool:
+    """
+    Check whether the current deadline has passed.
+
+    Returns:
+        bool: True if a deadline is set and has expired
+    """
+    expires_at = _deadline.get()
+    return expires_at is not None and time.monotonic() >= expires_at
@@ -0,0 +1,270 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+AttributeValue = Any
+
+# Argument names of service methods recorded as span attributes
+SERVICE_ATTRIBUTES = {
+    "world": "webcraft.world",
+    "world_name": "webcraft.world",
+    "player": "webcraft.player",
+    "entity_id": "webcraft.entity_id",
+    "ip": "webcraft.ip",
+    "plugin": "webcraft.plugin",
+}
+
+
+class Span:
+    """
+    One timed operation of a trace.
+
+    Ids follow the W3C trace context format: 32 hex digits for the trace,
+    16 for the span. Times are Unix timestamps in nanoseconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        span_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, AttributeValue]] = None,
+    ):
+        """
+        Start a span.
+
+        Args:
+            name: The operation name
+            trace_id: The id shared by every span of the trace
+            span_id: The id of this span
+            parent_id: The id of the enclosing span, None for a root span
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.attributes: Dict[str, AttributeValue] = dict(attributes or {})
+        self.events: List[Tuple[int, str, Dict[str, AttributeValue]]] = []
+        self.status = "unset"
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+
+    def set_attribute(self, key: str, value: AttributeValue):
+        """
+        Set an attribute.
+
+        Args:
+            key: The attribute name
+            value: The value, a string, number or boolean
+        """
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """
+        Record something that happened during the span.
+
+        Args:
+            name: The event name
+            attributes: Details of the event
+        """
+        self.events.append((time.time_ns(), name, dict(attributes or {})))
+
+    def record_exception(self, error: BaseException):
+        """
+        Mark the span as failed by an exception.
+
+        Args:
+            error: The exception
+        """
+        self.status = "error"
+        self.add_event(
+            "exception",
+            {
+                "exception.type": type(error).__name__,
+                "exception.message": str(error),
+            },
+        )
+
+    @property
+    def duration(self) -> Optional[float]:
+        """
+        Length of the span.
+
+        Returns:
+            Optional[float]: Seconds from start to end, None while running
+        """
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, status={self.status!r}, duration={self.duration})"
+
+
+class _NoopSpan(Span):
+    """Span that records nothing, handed out by the no-op tracer."""
+
+    def __init__(self):
+        super().__init__("", "0" * 32, "0" * 16)
+
+    def set_attribute(self, key: str, value: AttributeValue):
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        pass
+
+    def record_exception(self, error: BaseException):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "webcraft_current_span", default=None
+)
+
+
+def current_span() -> Optional[Span]:
+    """
+    The innermost span of the running task.
+
+    Returns:
+        Optional[Span]: The span, or None outside of any span
+    """
+    return _current_span.get()
+
+
+class SpanExporter:
+    """
+    Destination of finished spans.
+
+    Subclass it to forward spans to a tracing backend, e.g. by recreating
+    them with the OpenTelemetry SDK.
+    """
+
+    def export(self, span: Span):
+        """
+        Receive a finished span.
+
+        Args:
+            span: The span, with its end time and status set
+        """
+
+    def shutdown(self):
+        """Flush and release resources; called by :meth:`Tracer.shutdown`."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a list, for tests and debugging."""
+
+    def __init__(self):
+        """Initialize an empty exporter."""
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def finished_spans(self, name: Optional[str] = None) -> List[Span]:
+        """
+        Spans exported so far, in the order they ended.
+
+        Args:
+            name: Only return spans with this name
+
+        Returns:
+            List[Span]: The spans
+        """
+        with self._lock:
+            return [span for span in self.spans if name is None or span.name == name]
+
+    def clear(self):
+        """Forget the spans exported so far."""
+        with self._lock:
+            self.spans.clear()
+
+
+class Tracer:
+    """
+    Creates spans and hands them to an exporter when they end.
+
+    Spans started inside another span, including in tasks created within
+    it, become its children. A tracer may be shared between clients.
+    """
+
+    enabled = True
+
+    def __init__(self, exporter: SpanExporter):
+        """
+        Initialize the tracer.
+
+        Args:
+            exporter: Receives every finished span
+        """
+        self.exporter = exporter
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, AttributeValue]] = None
+    ) -> Iterator[Span]:
+        """
+        Time the block as a span.
+
+        An exception leaving the block is recorded on the span and re-raised.
+
+        Args:
+            name: The operation name
+            attributes: Initial attributes
+
+        Yields:
+            Span: The running span
+        """
+        parent = _current_span.get()
+        span = Span(
+            name,
+            parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            f"{random.getrandbits(64):016x}",
+            parent.span_id if parent else None,
+            attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        else:
+            if span.status == "unset":
+                span.status = "ok"
+        finally:
+            _current_span.reset(token)
+            span.end_time = time.time_ns()
+            self.exporter.export(span)
+
+    def shutdown(self):
+        """Shut down the exporter."""
+        self.exporter.shutdown()
+
+
+class NoopTracer(Tracer):
+    """Default tracer: no spans are created and nothing is exported."""
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__(SpanExporter())
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, AttributeValue]] = None
+    ) -> Iterator[Span]:
+        yield _NOOP_SPAN
+
+
+NOOP_TRACER = NoopTracer()
@@ -0,0 +1,104 @@
+import asyncio
+import base64
+import json
+import time
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.auth import AuthConfig, decode_jwt_expiry
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.exceptions import APIException
+from src.webcraft_api.timeouts import TimeoutConfig
+
+
+def _jwt(claims) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload.decode()}.signature"
+
+
+class DecodeJwtExpiryTest(unittest.TestCase):
+    def test_exp_claim_is_returned(self):
+        self.assertEqual(decode_jwt_expiry(_jwt({"exp": 1700000000})), 1700000000.0)
+
+    def test_opaque_token_has_no_expiry(self):
+        self.assertIsNone(decode_jwt_expiry("not-a-jwt"))
+
+    def test_token_without_exp_has_no_expiry(self):
+        self.assertIsNone(decode_jwt_expiry(_jwt({"sub": "admin"})))
+
+    def test_non_numeric_exp_is_ignored(self):
+        self.assertIsNone(decode_jwt_expiry(_jwt({"exp": True})))
+
+
+class TokenRefreshTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # Each login issues a new token and revokes the previous ones
+        self.logins = 0
+        self.lifetime = 60.0
+        self.stall_logins = False
+
+        async def authenticate(request: web.Request) -> web.Response:
+            if self.stall_logins:
+                await asyncio.sleep(1.0)
+            self.logins += 1
+            token = _jwt({"exp": time.time() + self.lifetime, "n": self.logins})
+            self.valid = f"Bearer {token}"
+            return web.Response(text=json.dumps(token))
+
+        async def ping(request: web.Request) -> web.Response:
+            if request.headers.get("Authorization") != self.valid:
+                return web.json_response({"message": "Unauthorized"}, status=401)
+            return web.json_response({"response": "pong"})
+
+        app = web.Application()
+        app.router.add_post("/api/authenticate", authenticate)
+        app.router.add_get("/api/ping", ping)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+        self.url = str(self.server.make_url(""))
+
+    async def test_token_is_refreshed_before_it_expires(self):
+        # Refreshed halfway through, 0.2 seconds in
+        self.lifetime = 0.4
+        async with WebCraftAPI(self.url) as client:
+            await client.authenticate("admin", "secret")
+            await asyncio.sleep(0.3)
+
+            self.assertEqual(self.logins, 2)
+            await client.ping.ping()
+
+    async def test_concurrent_401s_share_one_login(self):
+        auth = AuthConfig(background_refresh=False)
+        async with WebCraftAPI(self.url, auth=auth) as client:
+            await client.authenticate("admin", "secret")
+            # Revoke the token; every ping gets a 401 and waits on one login
+            self.valid = None
+
+            await asyncio.gather(*(client.ping.ping() for _ in range(5)))
+
+        self.assertEqual(self.logins, 2)
+
+    async def test_401_is_raised_when_reauthentication_is_off(self):
+        auth = AuthConfig(reauthenticate_on_401=False)
+        async with WebCraftAPI(self.url, auth=auth) as client:
+            await client.authenticate("admin", "secret")
+            self.valid = None
+
+            with self.assertRaises(APIException) as raised:
+                await client.ping.ping()
+
+        self.assertEqual(raised.exception.status_code, 401)
+
+    async def test_stalled_login_times_out(self):
+        self.stall_logins = True
+        auth = AuthConfig(login_timeout=TimeoutConfig(total=0.05))
+        async with WebCraftAPI(self.url, auth=auth) as client:
+            with self.assertRaises(asyncio.TimeoutError):
+                await client.authenticate("admin", "secret")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from typing import Dict, List
+
+from src.webcraft_api.batching import BatchConfig, dispatch_chunks
+from src.webcraft_api.exceptions import APIException, BatchError
+
+
+class DispatchChunksTest(unittest.IsolatedAsyncioTestCase):
+    async def test_permanent_failure_survives_transient_resend(self):
+        transient_left = {2: 1}
+
+        async def send(chunk: List[int]) -> List[int]:
+            if chunk[0] == 0:
+                raise APIException("bad request", 400)
+            if transient_left.get(chunk[0]):
+                transient_left[chunk[0]] -= 1
+                raise APIException("busy", 503)
+            return chunk
+
+        with self.assertRaises(BatchError) as caught:
+            await dispatch_chunks(
+                send, range(6), BatchConfig(chunk_size=2, chunk_attempts=2)
+            )
+        self.assertEqual(list(caught.exception.failures), [0])
+        self.assertEqual(caught.exception.failures[0].status_code, 400)
+        self.assertEqual(caught.exception.completed, 2)
+
+    async def test_transient_failure_is_resent(self):
+        calls: Dict[int, int] = {}
+
+        async def send(chunk: List[int]) -> List[int]:
+            calls[chunk[0]] = calls.get(chunk[0], 0) + 1
+            if chunk[0] == 2 and calls[2] == 1:
+                raise APIException("busy", 503)
+            return chunk
+
+        results = await dispatch_chunks(
+            send, range(6), BatchConfig(chunk_size=2, chunk_attempts=2)
+        )
+        self.assertEqual(results, [[0, 1], [2, 3], [4, 5]])
+        self.assertEqual(calls[2], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from src.webcraft_api.models.block_array import BlockArray
+
+# One name more than a uint16 index can address
+STATES = 1 << 16 | 1
+
+
+def _raw(names):
+    return [
+        {"name": name, "position": {"x": i, "y": 0, "z": 0}}
+        for i, name in enumerate(names)
+    ]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class PaletteIndexTest(unittest.TestCase):
+    def test_small_palette_uses_uint16(self):
+        array = BlockArray.from_raw(_raw(["minecraft:stone", "minecraft:dirt"]))
+        self.assertEqual(array.indices.dtype, np.uint16)
+
+    def test_large_palette_is_widened(self):
+        names = [f"minecraft:wool[variant={i}]" for i in range(STATES)]
+        array = BlockArray.from_raw(_raw(names))
+
+        self.assertEqual(array.indices.dtype, np.uint32)
+        self.assertEqual(array.lookup(STATES - 1, 0, 0), names[-1])
+
+    def test_concatenation_past_uint16_is_widened(self):
+        names = [f"minecraft:wool[variant={i}]" for i in range(STATES)]
+        half = STATES // 2
+        array = BlockArray.concatenate(
+            [
+                BlockArray.from_raw(_raw(names[:half])),
+                BlockArray.from_raw(_raw(names[half:])),
+            ]
+        )
+
+        self.assertEqual(array.indices.dtype, np.uint32)
+        self.assertEqual(array[STATES - 1].name, names[-1])
+        self.assertEqual(int(array.mask(names[-1]).sum()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.block_cache import BlockCache
+from src.webcraft_api.client import WebCraftAPI
+
+SUCCESS = {"status": 200, "code": "OK", "message": "Success"}
+
+
+class BlockCacheTest(unittest.TestCase):
+    def test_put_block_is_served(self):
+        cache = BlockCache()
+        cache.put("world", 1, 64, -3, "minecraft:stone")
+
+        self.assertEqual(cache.get("world", 1, 64, -3), "minecraft:stone")
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_worlds_are_kept_apart(self):
+        cache = BlockCache()
+        cache.put("world", 0, 64, 0, "minecraft:stone")
+
+        self.assertIsNone(cache.get("world_nether", 0, 64, 0))
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_least_recently_used_chunk_is_evicted(self):
+        cache = BlockCache(max_blocks=2)
+        cache.put("world", 0, 64, 0, "minecraft:stone")
+        cache.put("world", 16, 64, 0, "minecraft:dirt")
+        cache.get("world", 0, 64, 0)
+
+        cache.put("world", 32, 64, 0, "minecraft:sand")
+
+        self.assertEqual(cache.get("world", 0, 64, 0), "minecraft:stone")
+        self.assertIsNone(cache.get("world", 16, 64, 0))
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_overwrite_does_not_grow_the_cache(self):
+        cache = BlockCache()
+        cache.put("world", 0, 64, 0, "minecraft:stone")
+        cache.put("world", 0, 64, 0, "minecraft:air")
+
+        self.assertEqual(cache.stats.blocks, 1)
+        self.assertEqual(cache.get("world", 0, 64, 0), "minecraft:air")
+
+    def test_invalidate_drops_one_world(self):
+        cache = BlockCache()
+        cache.put("world", 0, 64, 0, "minecraft:stone")
+        cache.put("world_nether", 0, 64, 0, "minecraft:netherrack")
+
+        self.assertEqual(cache.invalidate("world"), 1)
+        self.assertEqual(cache.stats.blocks, 1)
+
+
+class ClientBlockCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.reads = 0
+
+        async def get_block(request: web.Request) -> web.Response:
+            self.reads += 1
+            position = await request.json()
+            return web.json_response({"name": "minecraft:stone", "position": position})
+
+        async def set_block(request: web.Request) -> web.Response:
+            return web.json_response(SUCCESS)
+
+        app = web.Application()
+        app.router.add_post("/api/worlds/{world}/blocks/block", get_block)
+        app.router.add_patch("/api/worlds/{world}/blocks/block", set_block)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+    async def test_repeated_read_is_answered_locally(self):
+        url = str(self.server.make_url(""))
+        async with WebCraftAPI(url, block_cache=BlockCache()) as client:
+            await client.worlds.get_block("world", 0, 64, 0)
+            block = await client.worlds.get_block("world", 0, 64, 0)
+
+        self.assertEqual(self.reads, 1)
+        self.assertEqual(block.name, "minecraft:stone")
+
+    async def test_write_updates_the_cache(self):
+        url = str(self.server.make_url(""))
+        async with WebCraftAPI(url, block_cache=BlockCache()) as client:
+            await client.worlds.set_block("world", "minecraft:glass", 0, 64, 0)
+            block = await client.worlds.get_block("world", 0, 64, 0)
+
+        self.assertEqual(self.reads, 0)
+        self.assertEqual(block.name, "minecraft:glass")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.cache import ResponseCache
+from src.webcraft_api.client import WebCraftAPI
+
+BASE_URL = "http://localhost:7000"
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        # Every test controls the clock the cache reads
+        patcher = mock.patch("src.webcraft_api.cache.time")
+        self.clock = patcher.start()
+        self.clock.monotonic.return_value = 100.0
+        self.addCleanup(patcher.stop)
+
+    def test_entry_is_served_within_its_ttl(self):
+        cache = ResponseCache()
+        key = cache.key(BASE_URL, "/api/blocks")
+        cache.set(key, "blocks", ttl=60.0)
+
+        self.clock.monotonic.return_value = 159.0
+
+        self.assertEqual(cache.get(key), "blocks")
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_expired_entry_is_a_miss(self):
+        cache = ResponseCache()
+        key = cache.key(BASE_URL, "/api/blocks")
+        cache.set(key, "blocks", ttl=60.0)
+
+        self.clock.monotonic.return_value = 160.0
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertEqual(cache.stats.size, 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(max_entries=2)
+        first, second, third = (
+            cache.key(BASE_URL, endpoint)
+            for endpoint in ("/api/blocks", "/api/items", "/api/plugins")
+        )
+        cache.set(first, "blocks", ttl=60.0)
+        cache.set(second, "items", ttl=60.0)
+        cache.get(first)
+
+        cache.set(third, "plugins", ttl=60.0)
+
+        self.assertEqual(cache.get(first), "blocks")
+        self.assertIsNone(cache.get(second))
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_endpoint_override_of_zero_disables_caching(self):
+        cache = ResponseCache(ttls={"/api/plugins": 0.0})
+        key = cache.key(BASE_URL, "/api/plugins")
+
+        cache.set(key, "plugins", ttl=60.0)
+
+        self.assertIsNone(cache.get(key))
+
+    def test_invalidate_only_drops_matching_server_and_prefix(self):
+        cache = ResponseCache()
+        cache.set(cache.key(BASE_URL, "/api/plugins/a"), "a", ttl=60.0)
+        cache.set(cache.key(BASE_URL, "/api/blocks"), "blocks", ttl=60.0)
+        cache.set(cache.key("http://other:7000", "/api/plugins/a"), "a", ttl=60.0)
+
+        removed = cache.invalidate(BASE_URL, "/api/plugins")
+
+        self.assertEqual(removed, 1)
+        self.assertEqual(cache.stats.size, 2)
+
+
+class ClientCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_catalog_is_fetched_once(self):
+        requests = []
+
+        async def plugins(request: web.Request) -> web.Response:
+            requests.append(request.path)
+            return web.json_response({"plugins": ["WebCraft"]})
+
+        app = web.Application()
+        app.router.add_get("/api/plugins", plugins)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        url = str(server.make_url(""))
+        async with WebCraftAPI(url, cache=ResponseCache()) as client:
+            first = await client.plugins.get_all_plugins()
+            second = await client.plugins.get_all_plugins()
+
+        self.assertEqual(len(requests), 1)
+        self.assertIs(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import gzip
+import json
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.batching import BatchConfig
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.compression import (
+    CompressionConfig,
+    CompressionMiddleware,
+    supported_encodings,
+)
+from src.webcraft_api.models.requests import SetBlockRequest, SetBlocksRequest
+from src.webcraft_api.retry import RetryPolicy
+from src.webcraft_api.serialization import encode_model
+
+SUCCESS = {"status": 200, "code": "OK", "message": "Success"}
+
+
+class SupportedEncodingsTest(unittest.TestCase):
+    def test_gzip_and_deflate_come_last(self):
+        self.assertEqual(supported_encodings()[-2:], ("gzip", "deflate"))
+
+
+class ResponseCompressionTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.accepted = {}
+        blocks = json.dumps({"blocks": ["minecraft:stone"] * 500}).encode()
+
+        async def catalog(request: web.Request) -> web.Response:
+            self.accepted[request.path] = request.headers.get("Accept-Encoding")
+            return web.Response(
+                body=gzip.compress(blocks),
+                headers={"Content-Encoding": "gzip"},
+                content_type="application/json",
+            )
+
+        async def ping(request: web.Request) -> web.Response:
+            self.accepted[request.path] = request.headers.get("Accept-Encoding")
+            return web.json_response({"response": "pong"})
+
+        app = web.Application()
+        app.router.add_get("/api/blocks", catalog)
+        app.router.add_get("/api/ping", ping)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+        self.compression = CompressionMiddleware()
+        self.url = str(self.server.make_url(""))
+
+    async def test_only_opted_in_endpoints_are_negotiated(self):
+        compression = CompressionMiddleware(CompressionConfig(accept_encodings=("br",)))
+        async with WebCraftAPI(self.url, middlewares=[compression]) as client:
+            await client.items.get_all_blocks()
+            await client.ping.ping()
+
+        self.assertEqual(self.accepted["/api/blocks"], "br")
+        self.assertNotEqual(self.accepted["/api/ping"], "br")
+        self.assertEqual(compression.stats.responses, 1)
+
+    async def test_compressed_response_is_counted(self):
+        async with WebCraftAPI(self.url, middlewares=[self.compression]) as client:
+            response = await client.items.get_all_blocks()
+
+        stats = self.compression.stats
+        self.assertEqual(len(response.blocks), 500)
+        self.assertEqual(stats.encodings, {"gzip": 1})
+        self.assertGreater(stats.bytes_saved, 0)
+
+
+class RequestCompressionTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # The first attempt fails, so every body is sent twice
+        self.received = []
+
+        async def set_blocks(request: web.Request) -> web.Response:
+            self.received.append(await request.read())
+            status = 503 if len(self.received) == 1 else 200
+            return web.json_response(SUCCESS, status=status)
+
+        app = web.Application()
+        app.router.add_patch("/api/worlds/{world}/blocks", set_blocks)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+        self.compression = CompressionMiddleware(CompressionConfig(request_min_size=1))
+
+    async def _set_blocks(self, count: int) -> bytes:
+        blocks = [
+            SetBlockRequest(block="minecraft:stone", x=i, y=64, z=0)
+            for i in range(count)
+        ]
+        async with WebCraftAPI(
+            str(self.server.make_url("")),
+            retry=RetryPolicy(base_delay=0.001),
+            middlewares=[self.compression],
+        ) as client:
+            await client.worlds.set_blocks("world", blocks)
+        return encode_model(SetBlocksRequest(blocks=blocks))
+
+    async def test_retried_body_is_counted_once(self):
+        body = await self._set_blocks(10)
+
+        stats = self.compression.stats
+        self.assertEqual(self.received, [body, body])
+        self.assertEqual(stats.requests_compressed, 1)
+        self.assertEqual(stats.request_bytes, len(body))
+
+    async def test_retried_stream_is_counted_once(self):
+        body = await self._set_blocks(BatchConfig().chunk_size)
+
+        stats = self.compression.stats
+        self.assertEqual(self.received, [body, body])
+        self.assertEqual(stats.requests_compressed, 1)
+        self.assertEqual(stats.request_bytes, len(body))
+        self.assertLess(stats.request_bytes_sent, stats.request_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.events import (
+    EventPoller,
+    OnlinePlayersSource,
+    PlayerHealthSource,
+    PollingPolicy,
+)
+from src.webcraft_api.exceptions import APIException
+from src.webcraft_api.models.events import PlayerJoined, PlayerLeft, PollFailed
+
+PLAYERS = ["alex", "steve", "notch"]
+
+# Poll as fast as the tests can observe, without adapting the interval
+FAST = PollingPolicy(min_factor=1.0, max_factor=1.0)
+
+
+class RosterSource(OnlinePlayersSource):
+    """Returns the given rosters in turn, then the last one again."""
+
+    def __init__(self, *rosters):
+        super().__init__(interval=0.001)
+        self.rosters = list(rosters)
+
+    async def poll(self, client: WebCraftAPI):
+        roster = self.rosters.pop(0) if len(self.rosters) > 1 else self.rosters[0]
+        if isinstance(roster, Exception):
+            raise roster
+        return set(roster)
+
+
+async def _next(subscription, timeout: float = 1.0):
+    return await asyncio.wait_for(subscription.__anext__(), timeout)
+
+
+class OnlinePlayersDiffTest(unittest.TestCase):
+    def test_joins_and_leaves_are_reported(self):
+        events = OnlinePlayersSource().diff({"alex", "steve"}, {"steve", "notch"}, 1.0)
+
+        self.assertEqual(
+            events,
+            [
+                PlayerJoined(source="players/online", timestamp=1.0, player="notch"),
+                PlayerLeft(source="players/online", timestamp=1.0, player="alex"),
+            ],
+        )
+
+
+class SubscriptionTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.poller = EventPoller(WebCraftAPI("http://localhost:7000"), FAST)
+        self.addAsyncCleanup(self.poller.stop)
+
+    async def test_first_poll_only_records_a_baseline(self):
+        self.poller.watch(RosterSource(["alex"], ["alex", "steve"]))
+
+        async with self.poller.subscribe() as subscription:
+            event = await _next(subscription)
+
+        self.assertEqual(event.player, "steve")
+
+    async def test_every_subscriber_receives_each_event(self):
+        self.poller.watch(RosterSource([], ["alex"]))
+
+        first = self.poller.subscribe()
+        second = self.poller.subscribe()
+
+        self.assertEqual((await _next(first)).player, "alex")
+        self.assertEqual((await _next(second)).player, "alex")
+
+    async def test_subscription_filters_event_types(self):
+        self.poller.watch(RosterSource(["alex"], ["steve"]))
+
+        async with self.poller.subscribe(PlayerLeft) as subscription:
+            event = await _next(subscription)
+
+        self.assertIsInstance(event, PlayerLeft)
+
+    async def test_failed_poll_is_published(self):
+        self.poller.watch(RosterSource(APIException("Service Unavailable", 503)))
+
+        async with self.poller.subscribe(PollFailed) as subscription:
+            event = await _next(subscription)
+
+        self.assertEqual(event.status_code, 503)
+
+    async def test_full_queue_drops_the_oldest_event(self):
+        self.poller.watch(RosterSource([], ["alex"], ["alex", "steve"], []))
+
+        subscription = self.poller.subscribe(max_queue=2)
+        while self.poller.events < 4:
+            await asyncio.sleep(0.001)
+
+        self.assertEqual(subscription.dropped, 2)
+        self.assertIsInstance(await _next(subscription), PlayerLeft)
+
+    async def test_polling_stops_with_the_last_subscriber(self):
+        self.poller.watch(RosterSource(["alex"]))
+
+        async with self.poller.subscribe():
+            while self.poller.polls < 1:
+                await asyncio.sleep(0.001)
+
+        [entry] = self.poller.schedule
+        self.assertIsNone(entry.next_poll_in)
+
+    async def test_watching_the_same_key_reuses_the_source(self):
+        source = self.poller.watch(RosterSource(["alex"]))
+
+        self.assertIs(self.poller.watch(OnlinePlayersSource()), source)
+        self.assertEqual(self.poller.stats.sources, 1)
+
+
+class PollingPolicyTest(unittest.TestCase):
+    def test_change_speeds_polling_up(self):
+        policy = PollingPolicy(speedup=0.5)
+        self.assertEqual(policy.next_interval(2.0, 2.0, changed=True), 1.0)
+
+    def test_quiet_poll_backs_off(self):
+        policy = PollingPolicy(backoff=1.5)
+        self.assertEqual(policy.next_interval(2.0, 2.0, changed=False), 3.0)
+
+    def test_interval_stays_within_the_factors(self):
+        policy = PollingPolicy(min_factor=0.25, max_factor=8.0)
+        self.assertEqual(policy.next_interval(2.0, 0.5, changed=True), 0.5)
+        self.assertEqual(policy.next_interval(2.0, 16.0, changed=False), 16.0)
+
+
+class AdaptiveScheduleTest(unittest.IsolatedAsyncioTestCase):
+    async def test_quiet_source_is_polled_less_often(self):
+        poller = EventPoller(
+            WebCraftAPI("http://localhost:7000"), PollingPolicy(backoff=2.0)
+        )
+        self.addAsyncCleanup(poller.stop)
+        poller.watch(RosterSource(["alex"]))
+
+        async with poller.subscribe():
+            while poller.polls < 3:
+                await asyncio.sleep(0.001)
+            [entry] = poller.schedule
+
+        self.assertGreater(entry.interval, entry.base_interval)
+        self.assertEqual(entry.changes, 0)
+
+
+class PlayerHealthCostTest(unittest.IsolatedAsyncioTestCase):
+    async def test_first_poll_is_charged_every_request_it_made(self):
+        async def online(request: web.Request) -> web.Response:
+            return web.json_response({"players": PLAYERS})
+
+        async def info(request: web.Request) -> web.Response:
+            return web.json_response({"health": 20.0})
+
+        app = web.Application()
+        app.router.add_get("/api/players/online", online)
+        app.router.add_get("/api/players/{player}", info)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        policy = PollingPolicy(max_rps=1000.0, burst=100.0)
+        async with WebCraftAPI(str(server.make_url("")), polling=policy) as client:
+            source = client.events.watch(PlayerHealthSource(interval=60.0))
+            async with client.events.subscribe():
+                while client.events.polls < 1:
+                    await asyncio.sleep(0.01)
+            budget = client.events.budget_stats
+
+        self.assertEqual(source.cost, 1 + len(PLAYERS))
+        self.assertEqual(budget.acquired, 1 + len(PLAYERS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.fleet import Fleet
+
+
+class FleetErrorsTest(unittest.IsolatedAsyncioTestCase):
+    async def _server(self, players) -> str:
+        async def count(request: web.Request) -> web.Response:
+            if players is None:
+                return web.json_response({"message": "Server Error"}, status=500)
+            if players == "slow":
+                await asyncio.sleep(1.0)
+            return web.json_response({"online": players, "offline": 1})
+
+        async def authenticate(request: web.Request) -> web.Response:
+            return web.Response(text='"token"')
+
+        app = web.Application()
+        app.router.add_get("/api/players", count)
+        app.router.add_post("/api/authenticate", authenticate)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+        return str(server.make_url(""))
+
+    async def test_failing_server_is_reported_beside_the_others(self):
+        servers = {"lobby": await self._server(3), "survival": await self._server(None)}
+
+        async with Fleet(servers) as fleet:
+            result = await fleet.get_player_count()
+
+        self.assertEqual(result.online, 3)
+        self.assertEqual(list(result.servers.results), ["lobby"])
+        self.assertEqual(result.servers.errors["survival"].status_code, 500)
+
+    async def test_slow_server_fails_on_its_own_deadline(self):
+        servers = {"lobby": await self._server(3), "slow": await self._server("slow")}
+
+        async with Fleet(servers, timeout=0.1) as fleet:
+            result = await fleet.get_player_count()
+
+        self.assertEqual(list(result.servers.results), ["lobby"])
+        self.assertIn("slow", result.servers.errors)
+
+    async def test_bug_in_the_call_propagates(self):
+        servers = {"lobby": await self._server(3)}
+
+        async def broken(client):
+            raise KeyError("online")
+
+        async with Fleet(servers) as fleet:
+            with self.assertRaises(KeyError):
+                await fleet.gather(broken)
+
+    async def test_missing_credentials_log_nobody_in(self):
+        servers = {"lobby": await self._server(3), "survival": await self._server(3)}
+
+        async with Fleet(servers) as fleet:
+            with self.assertRaises(ValueError):
+                await fleet.authenticate(credentials={"lobby": ("admin", "secret")})
+            # Give a login already under way the time to finish
+            await asyncio.sleep(0.05)
+
+            self.assertIsNone(fleet["lobby"].token)
+
+    async def test_session_option_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Fleet(["http://localhost:7000"], session=object())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.metrics import LatencyHistogram, MetricsMiddleware, route_of
+from src.webcraft_api.retry import RetryPolicy
+
+
+class RouteOfTest(unittest.TestCase):
+    def test_names_are_replaced_by_placeholders(self):
+        self.assertEqual(
+            route_of("/api/players/Steve/health"), "/api/players/{player}/health"
+        )
+
+    def test_literal_segment_wins_over_placeholder(self):
+        self.assertEqual(route_of("/api/players/online"), "/api/players/online")
+
+    def test_unknown_endpoint_is_other(self):
+        self.assertEqual(route_of("/api/unknown/thing"), "other")
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_quantile_is_interpolated_within_its_bucket(self):
+        histogram = LatencyHistogram(buckets=(1.0, 2.0))
+        for seconds in (1.2, 1.4, 1.6, 1.8):
+            histogram.observe(seconds)
+
+        self.assertAlmostEqual(histogram.quantile(0.5), 1.5)
+
+    def test_overflow_bucket_is_capped_by_the_largest_observation(self):
+        histogram = LatencyHistogram(buckets=(1.0,))
+        histogram.observe(30.0)
+
+        self.assertEqual(histogram.quantile(1.0), 30.0)
+
+    def test_empty_histogram_reports_zero(self):
+        self.assertEqual(LatencyHistogram().quantile(0.5), 0.0)
+
+
+class MetricsMiddlewareTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # The first attempt fails, the retry succeeds
+        self.statuses = [503, 200]
+
+        async def player(request: web.Request) -> web.Response:
+            status = self.statuses.pop(0)
+            return web.json_response({"health": 20.0}, status=status)
+
+        app = web.Application()
+        app.router.add_get("/api/players/{player}/health", player)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+        self.metrics = MetricsMiddleware()
+        async with WebCraftAPI(
+            str(self.server.make_url("")),
+            retry=RetryPolicy(base_delay=0.001),
+            middlewares=[self.metrics],
+        ) as client:
+            await client._get("/api/players/Steve/health")
+
+    async def test_every_attempt_is_counted_by_status(self):
+        metrics = self.metrics.snapshot()["GET /api/players/{player}/health"]
+
+        self.assertEqual(metrics.requests, 2)
+        self.assertEqual(metrics.errors, 1)
+        self.assertEqual(metrics.statuses, {"200": 1, "503": 1})
+
+    async def test_prometheus_export_carries_constant_labels(self):
+        text = self.metrics.prometheus({"server": "lobby"})
+
+        self.assertIn(
+            'webcraft_requests_total{server="lobby",method="GET",'
+            'route="/api/players/{player}/health",status="503"} 1',
+            text,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+
+from src.webcraft_api.priority import (
+    Priority,
+    PriorityConfig,
+    PriorityScheduler,
+    priority,
+    resolve_priority,
+)
+
+
+class ResolvePriorityTest(unittest.TestCase):
+    def test_service_default_applies_outside_a_block(self):
+        self.assertEqual(resolve_priority(Priority.BULK), Priority.BULK)
+
+    def test_caller_block_overrides_the_default(self):
+        with priority(Priority.CRITICAL):
+            self.assertEqual(resolve_priority(Priority.BULK), Priority.CRITICAL)
+
+
+class PrioritySchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def _queue(self, scheduler, level, order):
+        async with scheduler.slot(level):
+            order.append(level)
+
+    async def test_most_urgent_class_goes_first(self):
+        scheduler = PriorityScheduler(PriorityConfig(max_in_flight=1))
+        order = []
+
+        async with scheduler.slot(Priority.NORMAL):
+            bulk = asyncio.create_task(self._queue(scheduler, Priority.BULK, order))
+            await asyncio.sleep(0)
+            critical = asyncio.create_task(
+                self._queue(scheduler, Priority.CRITICAL, order)
+            )
+            await asyncio.sleep(0)
+        await asyncio.gather(bulk, critical)
+
+        self.assertEqual(order, [Priority.CRITICAL, Priority.BULK])
+
+    async def test_long_waiting_request_is_promoted(self):
+        scheduler = PriorityScheduler(PriorityConfig(max_in_flight=1, max_wait=0.01))
+        order = []
+
+        async with scheduler.slot(Priority.NORMAL):
+            bulk = asyncio.create_task(self._queue(scheduler, Priority.BULK, order))
+            await asyncio.sleep(0.02)
+            critical = asyncio.create_task(
+                self._queue(scheduler, Priority.CRITICAL, order)
+            )
+            await asyncio.sleep(0)
+        await asyncio.gather(bulk, critical)
+
+        self.assertEqual(order, [Priority.BULK, Priority.CRITICAL])
+        self.assertEqual(scheduler.stats["bulk"].promoted, 1)
+
+    async def test_class_limit_lets_other_classes_through(self):
+        scheduler = PriorityScheduler(PriorityConfig(bulk=1))
+        order = []
+
+        async with scheduler.slot(Priority.BULK):
+            bulk = asyncio.create_task(self._queue(scheduler, Priority.BULK, order))
+            await asyncio.sleep(0)
+            await asyncio.wait_for(
+                self._queue(scheduler, Priority.CRITICAL, order), timeout=1.0
+            )
+            self.assertEqual(scheduler.stats["bulk"].queued, 1)
+        await bulk
+
+        self.assertEqual(order, [Priority.CRITICAL, Priority.BULK])
+
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        scheduler = PriorityScheduler(PriorityConfig(max_in_flight=1))
+
+        async with scheduler.slot(Priority.NORMAL):
+            waiting = asyncio.create_task(self._queue(scheduler, Priority.BULK, []))
+            await asyncio.sleep(0)
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+
+        self.assertEqual(scheduler.stats["bulk"].queued, 0)
+        self.assertEqual(scheduler.stats["bulk"].running, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
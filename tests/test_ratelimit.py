@@ -0,0 +1,96 @@
+import asyncio
+import unittest
+
+from src.webcraft_api.priority import Priority
+from src.webcraft_api.ratelimit import RateLimit, RateLimiter, TokenBucket
+
+
+class TokenBucketTest(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_is_granted_without_waiting(self):
+        bucket = TokenBucket(rate=1.0, burst=3.0)
+
+        waits = [await bucket.acquire() for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.0])
+
+    async def test_request_past_the_burst_waits_for_refill(self):
+        bucket = TokenBucket(rate=50.0, burst=1.0)
+        await bucket.acquire()
+
+        waited = await bucket.acquire()
+
+        self.assertGreater(waited, 0.01)
+        self.assertEqual(bucket.stats.waits, 1)
+
+    async def test_cost_above_the_burst_goes_into_debt(self):
+        bucket = TokenBucket(rate=100.0, burst=1.0)
+
+        self.assertEqual(await bucket.acquire(5.0), 0.0)
+        self.assertGreater(await bucket.acquire(), 0.04)
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_block_changes_are_world_edits(self):
+        group = RateLimiter.group("PATCH", "/api/worlds/world/blocks")
+        self.assertEqual(group, RateLimiter.WORLD_EDITS)
+
+    def test_block_queries_are_reads(self):
+        group = RateLimiter.group("POST", "/api/worlds/world/blocks/block")
+        self.assertEqual(group, RateLimiter.READS)
+
+    def test_other_changes_are_writes(self):
+        group = RateLimiter.group("POST", "/api/chat/broadcast")
+        self.assertEqual(group, RateLimiter.WRITES)
+
+    def test_group_without_a_limit_has_no_bucket(self):
+        limiter = RateLimiter(reads=RateLimit(rate=10.0))
+        self.assertEqual(list(limiter.stats), [RateLimiter.READS])
+
+
+class TokenBucketPriorityTest(unittest.IsolatedAsyncioTestCase):
+    async def test_critical_request_overtakes_queued_bulk_requests(self):
+        bucket = TokenBucket(rate=50.0, burst=1.0)
+        await bucket.acquire()
+        order = []
+
+        async def take(name: str, level: Priority):
+            await bucket.acquire(priority=level)
+            order.append(name)
+
+        bulk = [asyncio.create_task(take(f"bulk{i}", Priority.BULK)) for i in range(3)]
+        await asyncio.sleep(0)
+        critical = asyncio.create_task(take("critical", Priority.CRITICAL))
+        await asyncio.gather(*bulk, critical)
+
+        self.assertEqual(order, ["critical", "bulk0", "bulk1", "bulk2"])
+
+    async def test_cancelled_waiter_does_not_hold_up_the_queue(self):
+        bucket = TokenBucket(rate=20.0, burst=1.0)
+        await bucket.acquire()
+        first = asyncio.create_task(bucket.acquire(priority=Priority.CRITICAL))
+        second = asyncio.create_task(bucket.acquire(priority=Priority.BULK))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        waited = await asyncio.wait_for(second, timeout=1.0)
+
+        self.assertLess(waited, 0.1)
+        self.assertEqual(bucket.acquired, 2.0)
+
+
+class TokenBucketRefundTest(unittest.IsolatedAsyncioTestCase):
+    async def test_refund_wakes_a_waiter(self):
+        bucket = TokenBucket(rate=0.1, burst=2.0)
+        await bucket.acquire(2.0)
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        bucket.refund(1.0)
+
+        waited = await asyncio.wait_for(waiter, timeout=1.0)
+
+        self.assertLess(waited, 0.1)
+        self.assertEqual(bucket.acquired, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
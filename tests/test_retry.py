@@ -0,0 +1,54 @@
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.retry import RetryPolicy
+
+
+class BackoffTest(unittest.TestCase):
+    def test_retry_after_is_honoured(self):
+        self.assertEqual(RetryPolicy().backoff(1, retry_after=2.5), 2.5)
+
+    def test_long_retry_after_is_capped(self):
+        policy = RetryPolicy(max_retry_after=30.0)
+        self.assertEqual(policy.backoff(1, retry_after=120.0), 30.0)
+
+    def test_jitter_without_retry_after(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=5.0)
+        for attempt in range(1, 10):
+            self.assertLessEqual(policy.backoff(attempt), 5.0)
+
+
+class ReauthenticationReplayTest(unittest.IsolatedAsyncioTestCase):
+    async def test_replay_after_401_does_not_use_up_an_attempt(self):
+        # One 401, then two 503s, then success: four sends in total
+        statuses = [401, 503, 503, 200]
+        sent = []
+
+        async def authenticate(request: web.Request) -> web.Response:
+            return web.Response(text='"token"')
+
+        async def ping(request: web.Request) -> web.Response:
+            sent.append(request.headers.get("Authorization"))
+            status = statuses[len(sent) - 1]
+            return web.json_response({"response": "pong"}, status=status)
+
+        app = web.Application()
+        app.router.add_post("/api/authenticate", authenticate)
+        app.router.add_get("/api/ping", ping)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+        async with WebCraftAPI(str(server.make_url("")), retry=policy) as client:
+            await client.authenticate("admin", "secret")
+            await client.ping.ping()
+
+        self.assertEqual(len(sent), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
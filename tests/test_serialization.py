@@ -0,0 +1,56 @@
+import json
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.batching import BatchConfig
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.models.requests import SetBlockRequest, SetBlocksRequest
+from src.webcraft_api.serialization import encode_model
+
+SUCCESS = {"status": 200, "code": "OK", "message": "Success"}
+
+
+class SetBlocksBodyTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.received = []
+
+        async def set_blocks(request: web.Request) -> web.Response:
+            self.received.append((request.headers.copy(), await request.read()))
+            return web.json_response(SUCCESS)
+
+        app = web.Application()
+        app.router.add_patch("/api/worlds/{world}/blocks", set_blocks)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+    def _blocks(self, count: int):
+        return [
+            SetBlockRequest(block="minecraft:stone", x=i, y=64, z=0)
+            for i in range(count)
+        ]
+
+    async def test_default_chunk_is_streamed(self):
+        blocks = self._blocks(BatchConfig().chunk_size)
+        async with WebCraftAPI(str(self.server.make_url(""))) as client:
+            await client.worlds.set_blocks("world", blocks)
+
+        [(headers, body)] = self.received
+        self.assertEqual(headers.get("Transfer-Encoding"), "chunked")
+        self.assertNotIn("Content-Length", headers)
+        self.assertEqual(body, encode_model(SetBlocksRequest(blocks=blocks)))
+
+    async def test_small_chunk_is_encoded_up_front(self):
+        blocks = self._blocks(10)
+        async with WebCraftAPI(str(self.server.make_url(""))) as client:
+            await client.worlds.set_blocks("world", blocks)
+
+        [(headers, body)] = self.received
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+        self.assertEqual(json.loads(body), SetBlocksRequest(blocks=blocks).model_dump())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.exceptions import DeadlineExceeded
+from src.webcraft_api.singleflight import SingleFlight
+
+PLUGIN = {
+    "name": "WebCraft",
+    "enabled": True,
+    "version": "1.0",
+    "description": "",
+    "website": "",
+    "authors": [],
+    "contributors": [],
+}
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+        self.assertEqual(results, ["done"] * 5)
+        self.assertEqual(calls, 1)
+        self.assertEqual(flight.stats.collapsed, 4)
+
+    async def test_later_call_runs_again(self):
+        flight = SingleFlight()
+
+        async def work() -> int:
+            return flight.executed
+
+        await flight.do("key", work)
+        await flight.do("key", work)
+
+        self.assertEqual(flight.stats.executed, 2)
+        self.assertEqual(flight.stats.in_flight, 0)
+
+    async def test_error_reaches_every_caller(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("key", work), flight.do("key", work), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    async def test_caller_timeout_leaves_shared_call_running(self):
+        flight = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        patient = asyncio.create_task(flight.do("key", work))
+        with self.assertRaises(DeadlineExceeded):
+            await flight.do("key", work, timeout=0.01)
+
+        self.assertEqual(await patient, "done")
+
+    async def test_cancelled_caller_leaves_shared_call_running(self):
+        flight = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        impatient = asyncio.create_task(flight.do("key", work))
+        patient = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        impatient.cancel()
+
+        self.assertEqual(await patient, "done")
+
+
+class CoalescedGetTest(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_gets_send_one_request(self):
+        requests = []
+
+        async def plugin(request: web.Request) -> web.Response:
+            requests.append(request.path)
+            await asyncio.sleep(0.01)
+            return web.json_response(PLUGIN)
+
+        app = web.Application()
+        app.router.add_get("/api/plugins/{plugin}", plugin)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        async with WebCraftAPI(str(server.make_url(""))) as client:
+            await asyncio.gather(
+                *(client.plugins.get_plugin_info("WebCraft") for _ in range(3))
+            )
+
+        self.assertEqual(len(requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.webcraft_api.client import WebCraftAPI
+from src.webcraft_api.retry import RetryPolicy
+from src.webcraft_api.tracing import InMemorySpanExporter, Tracer
+
+
+class SpanParentingTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        self.tracer = Tracer(self.exporter)
+
+    async def test_nested_span_is_a_child(self):
+        with self.tracer.start_span("outer") as outer:
+            with self.tracer.start_span("inner") as inner:
+                pass
+
+        self.assertEqual(inner.parent_id, outer.span_id)
+        self.assertEqual(inner.trace_id, outer.trace_id)
+
+    async def test_span_in_a_task_is_a_child(self):
+        async def work():
+            with self.tracer.start_span("task") as span:
+                return span
+
+        with self.tracer.start_span("outer") as outer:
+            child = await asyncio.create_task(work())
+
+        self.assertEqual(child.parent_id, outer.span_id)
+
+    async def test_sibling_roots_start_separate_traces(self):
+        with self.tracer.start_span("first") as first:
+            pass
+        with self.tracer.start_span("second") as second:
+            pass
+
+        self.assertIsNone(second.parent_id)
+        self.assertNotEqual(first.trace_id, second.trace_id)
+
+    async def test_exception_marks_the_span_failed(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.start_span("failing"):
+                raise ValueError("boom")
+
+        [span] = self.exporter.finished_spans("failing")
+        self.assertEqual(span.status, "error")
+
+
+class ClientSpansTest(unittest.IsolatedAsyncioTestCase):
+    async def test_http_span_is_a_child_of_the_service_span(self):
+        # The first attempt fails, so the HTTP span covers a resend
+        statuses = [503, 200]
+
+        async def ping(request: web.Request) -> web.Response:
+            return web.json_response({"response": "pong"}, status=statuses.pop(0))
+
+        app = web.Application()
+        app.router.add_get("/api/ping", ping)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        exporter = InMemorySpanExporter()
+        async with WebCraftAPI(
+            str(server.make_url("")),
+            retry=RetryPolicy(base_delay=0.001),
+            tracer=Tracer(exporter),
+        ) as client:
+            await client.ping.ping()
+
+        [service] = exporter.finished_spans("PingService.ping")
+        [http] = exporter.finished_spans("GET /api/ping")
+        self.assertEqual(http.parent_id, service.span_id)
+        self.assertEqual(http.attributes["http.request.resend_count"], 1)
+        self.assertEqual(http.attributes["http.response.status_code"], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()